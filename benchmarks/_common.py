@@ -0,0 +1,142 @@
+"""
+Shared helpers for the benchmark scripts
+Headless setup, statistics, JSON output and baseline comparison
+"""
+
+import json
+import os
+import platform
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def setup_headless():
+    """Make pygame run without a window or audio device and import the repo's packages"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if REPO_ROOT not in sys.path:
+        sys.path.insert(0, REPO_ROOT)
+
+def environment_info():
+    """Describe the machine and versions a result was measured on"""
+    info = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+    try:
+        import pygame
+        info["pygame"] = pygame.version.ver
+        info["sdl"] = ".".join(str(part) for part in pygame.get_sdl_version())
+    except ImportError:
+        pass
+    return info
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def summarize(values, digits=3):
+    """Get count, mean, min, percentiles and max of a list of samples"""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0}
+    return {
+        "count": len(ordered),
+        "mean": round(sum(ordered) / len(ordered), digits),
+        "min": round(ordered[0], digits),
+        "p50": round(percentile(ordered, 50), digits),
+        "p95": round(percentile(ordered, 95), digits),
+        "p99": round(percentile(ordered, 99), digits),
+        "max": round(ordered[-1], digits),
+    }
+
+def write_results(results, path=None):
+    """Write results as JSON to path, or to stdout if no path is given"""
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text + "\n")
+    else:
+        sys.stdout.write(text + "\n")
+
+def load_baseline(path):
+    """Load a previously written results file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def lookup(results, key_path):
+    """Get a nested value by a dot-separated path, or None if missing"""
+    value = results
+    for key in key_path.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+def compare(current, baseline, metrics, tolerance):
+    """Compare metrics against a baseline and list the ones that regressed
+
+    Args:
+        metrics: (key_path, higher_is_better) pairs looked up in both results
+        tolerance: allowed regression in percent before a metric counts as failed
+
+    Returns:
+        list: one dict per compared metric with its change in percent and a regressed flag
+    """
+    report = []
+    for key_path, higher_is_better in metrics:
+        new, old = lookup(current, key_path), lookup(baseline, key_path)
+        if not isinstance(new, (int, float)) or not isinstance(old, (int, float)) or old == 0:
+            continue
+        change = (new - old) / old * 100
+        regression = -change if higher_is_better else change
+        report.append({
+            "metric": key_path,
+            "baseline": old,
+            "current": new,
+            "change_percent": round(change, 1),
+            "regressed": regression > tolerance,
+        })
+    return report
+
+def print_comparison(report, tolerance, out=None):
+    """Print a comparison report; returns True if nothing regressed"""
+    write = (out or sys.stderr).write
+    failed = [entry for entry in report if entry["regressed"]]
+    for entry in report:
+        marker = "FAIL" if entry["regressed"] else "ok"
+        write(f"{marker:>4}  {entry['metric']}: {entry['baseline']:g} -> {entry['current']:g} "
+              f"({entry['change_percent']:+.1f}%)\n")
+    write(f"{len(failed)} of {len(report)} metrics regressed by more than {tolerance:g}%\n")
+    return not failed
+
+def add_output_arguments(parser, default_tolerance):
+    """Add the --output/--baseline/--tolerance options every benchmark takes"""
+    parser.add_argument("--output", help="write JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="results file to compare against; exit 1 on regression")
+    parser.add_argument("--tolerance", type=float, default=default_tolerance,
+                        help=f"allowed regression in percent (default {default_tolerance:g})")
+
+def resolve_output_paths(args):
+    """Make --output and --baseline absolute so they still work after a chdir"""
+    if args.output:
+        args.output = os.path.abspath(args.output)
+    if args.baseline:
+        args.baseline = os.path.abspath(args.baseline)
+
+def finish(results, args, metrics):
+    """Write results and compare them to the baseline if one was given; returns the exit code"""
+    if args.baseline:
+        report = compare(results, load_baseline(args.baseline), metrics, args.tolerance)
+        results["comparison"] = {"baseline": args.baseline, "tolerance": args.tolerance, "metrics": report}
+        write_results(results, args.output)
+        return 0 if print_comparison(report, args.tolerance) else 1
+    write_results(results, args.output)
+    return 0
@@ -0,0 +1,301 @@
+"""
+Gameplay step-throughput benchmark
+Drives Snake, FoodManager, PowerUpManager and ObstacleManager headlessly and reports
+ticks per second and allocations per tick for a grid of scenarios
+
+A tick is one snake step: the work SnakeGame._update_game does on a frame where the
+snake moves (power-up timers, move, all collision checks, achievement stat updates
+and manager updates). The snake follows a serpentine cycle so it never dies; any
+collision that does happen is counted and play continues.
+
+Allocations are measured in a separate pass under tracemalloc: the transient bytes
+allocated above the tick's starting level, and the net number of memory blocks kept.
+
+Usage:
+    python benchmarks/gameplay.py [--ticks 1000] [--repeat 3] [--quick] [--filter board100]
+                                  [--output gameplay.json] [--baseline old.json] [--tolerance 10]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _common import setup_headless, environment_info, add_output_arguments, resolve_output_paths, finish
+
+SNAKE_LENGTHS = (10, 100, 1000, 10000)
+OBSTACLE_COUNTS = (0, 50, 500, 5000)
+BOARD_SIZES = (20, 100, 500)  # Cells per side
+
+QUICK_SNAKE_LENGTHS = (10, 1000)
+QUICK_OBSTACLE_COUNTS = (0, 500)
+QUICK_BOARD_SIZES = (20, 100)
+
+def serpentine_cycle(cells_x, cells_y):
+    """Get a closed path of (col, row) cells that leaves odd rows mostly free
+
+    Even rows are swept alternately right and left over columns 1.., joined by one
+    cell in the odd row between them; column 0 is the lane back to the start.
+    """
+    rows = cells_y - cells_y % 4  # An even number of swept rows ends next to the return lane
+    path = []
+    for row in range(0, rows, 2):
+        columns = range(1, cells_x) if row % 4 == 0 else range(cells_x - 1, 0, -1)
+        path.extend((col, row) for col in columns)
+        if row + 2 < rows:
+            path.append((path[-1][0], row + 1))
+    path.extend((0, row) for row in range(rows - 2, -1, -1))
+    return path
+
+def free_cells(cells_x, cells_y, path):
+    """Get cells off the snake's path, where obstacles can go"""
+    on_path = set(path)
+    return [(col, row) for row in range(cells_y) for col in range(cells_x) if (col, row) not in on_path]
+
+class Scenario:
+    """One benchmark configuration and the game objects it drives"""
+
+    def __init__(self, name, snake_length, obstacle_count, board_cells, level=None):
+        self.name = name
+        self.snake_length = snake_length
+        self.obstacle_count = obstacle_count
+        self.board_cells = board_cells
+        self.level = level
+
+    def describe(self):
+        """Get the scenario parameters for the results file"""
+        return {
+            "snake_length": self.snake_length,
+            "obstacles": self.obstacle_count,
+            "board": f"{self.board_cells}x{self.board_cells}",
+            "level": self.level,
+        }
+
+    def is_feasible(self):
+        """Check that the snake and obstacles fit on the board"""
+        path = serpentine_cycle(self.board_cells, self.board_cells)
+        if self.snake_length >= len(path):
+            return False
+        if self.level is not None:
+            return True
+        return self.obstacle_count <= len(free_cells(self.board_cells, self.board_cells, path))
+
+    def build(self, seed, save_dir):
+        """Create fresh game objects for a run"""
+        from components.core import config, GameState, AchievementManager
+        from components.entities import Snake, FoodManager, PowerUpManager, ObstacleManager
+        from components.entities.obstacle import Obstacle
+
+        random.seed(seed)
+        block = config.get_block_size()
+        self.block = block
+        cells = self.board_cells
+        size = cells * block
+
+        self.path = serpentine_cycle(cells, cells)
+        self.step = self.snake_length - 1  # Path index of the head
+
+        snake = Snake(0, 0, 0, 0, size, size)
+        snake.body = [[col * block, row * block] for col, row in self.path[:self.snake_length]]
+        snake.length = self.snake_length
+        snake.x, snake.y = snake.body[-1]
+        self.snake = snake
+        self._steer()
+        snake.change_direction(*snake.turn_queue.popleft()[:2])
+
+        self.obstacle_manager = ObstacleManager(0, 0, size, size)
+        if self.level is not None:
+            self.obstacle_manager.generate_level_obstacles(self.level, snake.body)
+            self.move_interval = GameState().snake_move_interval
+            multipliers = config.get("levels.speed_multiplier")
+            if self.level <= len(multipliers):
+                self.move_interval = int(200 / multipliers[self.level - 1])
+        else:
+            cells_free = free_cells(cells, cells, self.path)
+            types = self.obstacle_manager.obstacle_types
+            self.obstacle_manager.obstacles = [
+                Obstacle(col * block, row * block, random.choice(types))
+                for col, row in random.sample(cells_free, self.obstacle_count)
+            ]
+            self.move_interval = GameState().snake_move_interval
+
+        self.food_manager = FoodManager(0, 0, size, size)
+        self.food_manager.spawn_food(snake.body, self.obstacle_manager.obstacles, "normal")
+        self.powerup_manager = PowerUpManager(0, 0, size, size)
+
+        self.achievements = AchievementManager(save_file=os.path.join(save_dir, "achievements.json"))
+        self.achievements.update_stats("game_start")
+        self.score = 0
+        self.survival_time = 0.0
+        self.collisions = 0
+
+    def _steer(self):
+        """Queue the turn that keeps the head on the path"""
+        col, row = self.path[(self.step + 1) % len(self.path)]
+        head_col, head_row = self.path[self.step % len(self.path)]
+        self.snake.queue_direction((col - head_col) * self.block, (row - head_row) * self.block)
+
+    def tick(self):
+        """Advance the game by one snake step (mirrors SnakeGame._update_game)"""
+        snake = self.snake
+        achievements = self.achievements
+        delta_time = self.move_interval
+
+        snake._update_power_ups(delta_time)
+        self._steer()
+        snake.move()
+        self.step += 1
+
+        if snake.check_collision():
+            self.collisions += 1
+        if snake.check_obstacle_collision(self.obstacle_manager.obstacles):
+            self.collisions += 1
+
+        food = self.food_manager.check_collision(snake.get_head_rect())
+        if food:
+            score_change = food.get_score()
+            self.score = max(0, self.score + score_change)
+            food_type = "normal" if score_change == 10 else "special" if score_change > 0 else "bad"
+            achievements.update_stats("food_eaten", food_type=food_type)
+            if score_change > 0:
+                snake.grow()
+            elif score_change < 0:
+                snake.shrink()
+            self.food_manager.ensure_normal_food(snake.body, self.obstacle_manager.obstacles)
+
+        powerup = self.powerup_manager.check_collision(snake.get_head_rect())
+        if powerup:
+            snake.apply_power_up(powerup.get_type(), powerup.get_duration())
+            achievements.update_stats("powerup_collected")
+
+        self.survival_time += delta_time / 1000
+        achievements.update_stats("survival_time", time=self.survival_time)
+        achievements.update_stats("score_update", score=self.score)
+        achievements.update_stats("level_update", level=self.level or 1)
+        achievements.check_achievements()
+
+        self.food_manager.update(delta_time)
+        self.powerup_manager.update(delta_time)
+        self.obstacle_manager.update()
+
+def build_scenarios(quick=False):
+    """Get the scenario grid plus one scenario per configured level"""
+    from components.core import config
+
+    lengths = QUICK_SNAKE_LENGTHS if quick else SNAKE_LENGTHS
+    obstacles = QUICK_OBSTACLE_COUNTS if quick else OBSTACLE_COUNTS
+    boards = QUICK_BOARD_SIZES if quick else BOARD_SIZES
+
+    scenarios = []
+    for board in boards:
+        for length in lengths:
+            for count in obstacles:
+                scenarios.append(Scenario(f"len{length}_obs{count}_board{board}", length, count, board))
+
+    # Levels use the real obstacle generator and speed on the standard 20x20 play area
+    level_counts = config.get("levels.obstacle_count")
+    for level in range(1, config.get("levels.max_level") + 1):
+        count = level_counts[min(level - 1, len(level_counts) - 1)]
+        scenarios.append(Scenario(f"level{level}", 10, count, 20, level=level))
+    return scenarios
+
+def measure_throughput(scenario, ticks, repeat, seed, save_dir):
+    """Get ticks per second over several runs (best and median) and collisions seen in all runs"""
+    rates = []
+    collisions = 0
+    for run in range(repeat):
+        scenario.build(seed + run, save_dir)
+        for _ in range(min(50, ticks)):
+            scenario.tick()  # Warm up caches and achievement indexes
+        start = time.perf_counter()
+        for _ in range(ticks):
+            scenario.tick()
+        rates.append(ticks / (time.perf_counter() - start))
+        collisions += scenario.collisions
+    rates.sort()
+    return {
+        "ticks_per_sec": round(rates[-1], 1),
+        "ticks_per_sec_median": round(rates[len(rates) // 2], 1),
+        "collisions": collisions,
+    }
+
+def measure_allocations(scenario, ticks, seed, save_dir):
+    """Get transient bytes and net memory blocks allocated per tick"""
+    scenario.build(seed, save_dir)
+    for _ in range(min(50, ticks)):
+        scenario.tick()
+
+    blocks_before = sys.getallocatedblocks()
+    tracemalloc.start()
+    transient = 0
+    try:
+        for _ in range(ticks):
+            current, _ = tracemalloc.get_traced_memory()
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            scenario.tick()
+            transient += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    blocks_after = sys.getallocatedblocks()
+
+    result = {"net_blocks_per_tick": round((blocks_after - blocks_before) / ticks, 2)}
+    if hasattr(tracemalloc, "reset_peak"):
+        result["transient_bytes_per_tick"] = round(transient / ticks, 1)
+    return result
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure gameplay step throughput headlessly")
+    parser.add_argument("--ticks", type=int, default=1000, help="timed ticks per run (default 1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per scenario (default 3)")
+    parser.add_argument("--alloc-ticks", type=int, default=200, help="ticks in the allocation pass (default 200)")
+    parser.add_argument("--seed", type=int, default=1234, help="random seed")
+    parser.add_argument("--quick", action="store_true", help="run a reduced scenario grid")
+    parser.add_argument("--filter", help="only run scenarios whose name contains this text")
+    add_output_arguments(parser, default_tolerance=10)
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    resolve_output_paths(args)
+    # Config, save and cache files go to a scratch directory, never the repo
+    original_dir = os.getcwd()
+    save_dir = tempfile.mkdtemp(prefix="snake-gameplay-")
+    os.chdir(save_dir)
+
+    results = {}
+    skipped = []
+    try:
+        for scenario in build_scenarios(args.quick):
+            if args.filter and args.filter not in scenario.name:
+                continue
+            if not scenario.is_feasible():
+                skipped.append(scenario.name)
+                continue
+            entry = scenario.describe()
+            entry.update(measure_throughput(scenario, args.ticks, args.repeat, args.seed, save_dir))
+            entry.update(measure_allocations(scenario, args.alloc_ticks, args.seed, save_dir))
+            results[scenario.name] = entry
+            sys.stderr.write(f"{scenario.name}: {entry['ticks_per_sec']:.0f} ticks/s\n")
+    finally:
+        os.chdir(original_dir)
+        shutil.rmtree(save_dir, ignore_errors=True)
+
+    output = {
+        "benchmark": "gameplay",
+        "ticks": args.ticks,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "environment": environment_info(),
+        "results": results,
+        "skipped": skipped,
+    }
+    metrics = [(f"results.{name}.ticks_per_sec", True) for name in results]
+    return finish(output, args, metrics)
+
+if __name__ == "__main__":
+    sys.exit(main())
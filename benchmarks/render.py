@@ -0,0 +1,233 @@
+"""
+Render frame-time benchmark
+Times every screen's draw path headlessly and counts draw calls per frame
+
+Each screen draws into an offscreen surface the size of the window, so the numbers
+cover the game's own drawing and not the display flip. Draw calls are pygame.draw
+primitives (on any surface) plus blit/blits/fill calls on the screen surface; text
+rendering is not counted. Game screens use synthetic snakes, food, power-ups and
+obstacles.
+
+Usage:
+    python benchmarks/render.py [--frames 300] [--filter game]
+                                [--output render.json] [--baseline old.json] [--tolerance 15]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import setup_headless, environment_info, summarize, add_output_arguments, resolve_output_paths, finish
+
+DRAW_FUNCTIONS = ("rect", "line", "lines", "aaline", "aalines", "circle", "ellipse", "arc", "polygon")
+
+class DrawCounter:
+    """Counts pygame.draw calls and screen blits/fills while installed"""
+
+    def __init__(self):
+        self.counts = {}
+        self._originals = {}
+
+    def add(self, name):
+        """Count one call"""
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def install(self):
+        """Wrap the pygame.draw functions"""
+        import pygame
+        for name in DRAW_FUNCTIONS:
+            original = getattr(pygame.draw, name, None)
+            if original is None:
+                continue
+            self._originals[name] = original
+            setattr(pygame.draw, name, self._wrap(name, original))
+
+    def _wrap(self, name, function):
+        """Get a wrapper that counts calls to function"""
+        key = f"draw.{name}"
+        def wrapper(*args, **kwargs):
+            self.add(key)
+            return function(*args, **kwargs)
+        return wrapper
+
+    def take(self):
+        """Get and reset the counts"""
+        counts, self.counts = self.counts, {}
+        return counts
+
+def make_counting_surface(counter, size):
+    """Create a screen surface whose blit, blits and fill calls are counted"""
+    import pygame
+
+    class CountingSurface(pygame.Surface):
+        def blit(self, *args, **kwargs):
+            counter.add("blit")
+            return super().blit(*args, **kwargs)
+
+        def blits(self, *args, **kwargs):
+            counter.add("blits")
+            return super().blits(*args, **kwargs)
+
+        def fill(self, *args, **kwargs):
+            counter.add("fill")
+            return super().fill(*args, **kwargs)
+
+    return CountingSurface(size)
+
+def build_game_objects(game_state, snake_length, level, busy):
+    """Create snake, food, power-ups and obstacles inside the play area"""
+    from components.core import config
+    from components.entities import Snake, FoodManager, PowerUpManager, ObstacleManager
+    from gameplay import serpentine_cycle
+
+    area = game_state
+    block = config.get_block_size()
+    cells_x, cells_y = area.game_area_width // block, area.game_area_height // block
+    path = serpentine_cycle(cells_x, cells_y)
+
+    snake = Snake(area.game_area_x, area.game_area_y, area.game_area_x, area.game_area_y,
+                  area.game_area_width, area.game_area_height)
+    snake.body = [[area.game_area_x + col * block, area.game_area_y + row * block]
+                  for col, row in path[:snake_length]]
+    snake.length = snake_length
+    snake.x, snake.y = snake.body[-1]
+    snake.x_change = block
+
+    obstacles = ObstacleManager(area.game_area_x, area.game_area_y, area.game_area_width, area.game_area_height)
+    obstacles.generate_level_obstacles(level, snake.body)
+
+    foods = FoodManager(area.game_area_x, area.game_area_y, area.game_area_width, area.game_area_height)
+    powerups = PowerUpManager(area.game_area_x, area.game_area_y, area.game_area_width, area.game_area_height)
+    foods.spawn_food(snake.body, obstacles.obstacles, "normal")
+    if busy:
+        foods.spawn_food(snake.body, obstacles.obstacles, "special")
+        foods.spawn_food(snake.body, obstacles.obstacles, "bad")
+        powerups.spawn_powerup(snake.body, obstacles.obstacles, foods.foods)
+        snake.apply_power_up("slow_motion", 8000)
+
+    return {"snake": snake, "food_manager": foods, "powerup_manager": powerups, "obstacle_manager": obstacles}
+
+def build_screens(screen):
+    """Get (name, draw function) for every screen, with synthetic state where needed"""
+    from components.core import GameState, GameRenderer, leaderboard
+    from components.ui import MainMenu, LevelSelectMenu, SettingsMenu, HighScoreMenu, AchievementMenu, GameOverMenu
+
+    for index in range(30):
+        leaderboard.add_score(random.randint(0, 5000), random.randint(1, 5))
+
+    renderer = GameRenderer(screen)
+    small_state = GameState()
+    small_state.reset_for_new_game(1)
+    small_state.score = 120
+    small_objects = build_game_objects(small_state, 5, 1, busy=False)
+    busy_state = GameState()
+    busy_state.reset_for_new_game(5)
+    busy_state.score = 98760
+    busy_objects = build_game_objects(busy_state, 150, 5, busy=True)
+
+    countdown_frame = [0]
+    def draw_countdown():
+        countdown_frame[0] += 1
+        renderer.draw_countdown((countdown_frame[0] * 16) % 3000, 3000)
+
+    def draw_paused():
+        renderer.invalidate_pause_frame()
+        renderer.draw_paused(busy_objects, busy_state)
+
+    def draw_paused_cached():
+        renderer.draw_paused(busy_objects, busy_state)
+
+    return [
+        ("main_menu", MainMenu(screen).draw),
+        ("level_select", LevelSelectMenu(screen).draw),
+        ("settings", SettingsMenu(screen).draw),
+        ("high_scores", HighScoreMenu(screen).draw),
+        ("achievements", AchievementMenu(screen).draw),
+        ("game_over", GameOverMenu(screen, 4321, 3).draw),
+        ("countdown", draw_countdown),
+        ("pause_overlay", renderer.draw_pause),
+        ("paused_first_frame", draw_paused),
+        ("paused_cached", draw_paused_cached),
+        ("game_small", lambda: renderer.draw_game(small_objects, small_state)),
+        ("game_busy", lambda: renderer.draw_game(busy_objects, busy_state)),
+    ]
+
+def measure_screen(draw, counter, frames, warmup):
+    """Get frame-time percentiles in ms and mean draw calls per frame"""
+    for _ in range(warmup):
+        draw()
+    counter.take()
+
+    times = []
+    calls = {}
+    for _ in range(frames):
+        start = time.perf_counter()
+        draw()
+        times.append((time.perf_counter() - start) * 1000)
+        for name, count in counter.take().items():
+            calls[name] = calls.get(name, 0) + count
+
+    result = summarize(times)
+    result["draw_calls_per_frame"] = round(sum(calls.values()) / frames, 1)
+    result["draw_calls"] = {name: round(count / frames, 1) for name, count in sorted(calls.items())}
+    return result
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure per-screen frame times headlessly")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per screen (default 300)")
+    parser.add_argument("--warmup", type=int, default=30, help="untimed frames first (default 30)")
+    parser.add_argument("--seed", type=int, default=1234, help="random seed")
+    parser.add_argument("--filter", help="only run screens whose name contains this text")
+    add_output_arguments(parser, default_tolerance=15)
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    resolve_output_paths(args)
+    # Config, score and save files go to a scratch directory, never the repo
+    original_dir = os.getcwd()
+    scratch = tempfile.mkdtemp(prefix="snake-render-")
+    os.chdir(scratch)
+    random.seed(args.seed)
+
+    results = {}
+    try:
+        import pygame
+        from components.core import config, leaderboard
+        pygame.init()
+        pygame.display.set_mode(config.get_screen_size())
+
+        counter = DrawCounter()
+        counter.install()
+        screen = make_counting_surface(counter, config.get_screen_size())
+
+        for name, draw in build_screens(screen):
+            if args.filter and args.filter not in name:
+                continue
+            results[name] = measure_screen(draw, counter, args.frames, args.warmup)
+            sys.stderr.write(f"{name}: p50 {results[name]['p50']:.2f} ms, "
+                             f"{results[name]['draw_calls_per_frame']:g} draw calls\n")
+        leaderboard.close()
+    finally:
+        os.chdir(original_dir)
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    output = {
+        "benchmark": "render",
+        "unit": "ms",
+        "frames": args.frames,
+        "environment": environment_info(),
+        "results": results,
+    }
+    metrics = []
+    for name in results:
+        metrics.append((f"results.{name}.p50", False))
+        metrics.append((f"results.{name}.p95", False))
+    return finish(output, args, metrics)
+
+if __name__ == "__main__":
+    sys.exit(main())
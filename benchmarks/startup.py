@@ -0,0 +1,162 @@
+"""
+Startup benchmark
+Measures cold and warm start of the game up to the first flip(), broken down by phase
+
+Each run starts a fresh interpreter on a scratch copy of the game with the SDL dummy
+driver. Cold runs use a new copy every time, so the game's modules are compiled and no
+save or cache files exist; warm runs reuse one primed copy. The fonts_* phases are
+included in game_init.
+
+Usage:
+    python benchmarks/startup.py [--runs 5] [--output startup.json]
+                                 [--baseline old.json] [--tolerance 20]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from _common import REPO_ROOT, setup_headless, environment_info, summarize, add_output_arguments, finish
+
+PHASES = (
+    "import_pygame", "import_core", "import_entities", "import_ui", "import_main",
+    "pygame_init", "config_load", "achievement_load", "game_init",
+    "fonts_menu", "fonts_renderer", "first_frame", "total",
+)
+
+def _timed_wrapper(function, timings, key):
+    """Wrap function so its wall time is added to timings[key]"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timings[key] = timings.get(key, 0.0) + (time.perf_counter() - start) * 1000
+    return wrapper
+
+def measure_once():
+    """Run startup in this process and get per-phase times in milliseconds
+
+    Config and achievements are loaded synchronously before the game is built so
+    their cost is reported on its own instead of hidden in the background preload.
+    """
+    timings = {}
+    start = time.perf_counter()
+    mark = start
+
+    def lap(name):
+        nonlocal mark
+        now = time.perf_counter()
+        timings[name] = (now - mark) * 1000
+        mark = now
+
+    import pygame
+    lap("import_pygame")
+    import components.core
+    lap("import_core")
+    import components.entities
+    lap("import_entities")
+    import components.ui
+    lap("import_ui")
+    import main
+    lap("import_main")
+
+    pygame.init()
+    lap("pygame_init")
+    components.core.config.get_fps()
+    lap("config_load")
+    components.core.achievement_manager.get_progress_summary()
+    lap("achievement_load")
+
+    # Font creation happens inside game construction; time it separately
+    from components.ui.base_menu import Menu
+    from components.core.game_renderer import GameRenderer
+    Menu._get_cached_font = classmethod(_timed_wrapper(Menu._get_cached_font.__func__, timings, "fonts_menu"))
+    GameRenderer.__init__ = _timed_wrapper(GameRenderer.__init__, timings, "fonts_renderer")
+
+    game = main.SnakeGame()
+    lap("game_init")
+    game._draw()
+    pygame.display.flip()
+    lap("first_frame")
+
+    timings["total"] = (time.perf_counter() - start) * 1000
+    timings.setdefault("fonts_menu", 0.0)
+    components.core.config.stop_file_watcher()
+    return timings
+
+def _copy_game(dest):
+    """Copy the game sources without bytecode or generated files"""
+    ignore = shutil.ignore_patterns("__pycache__", "*.pyc", "*.cache")
+    shutil.copytree(os.path.join(REPO_ROOT, "components"), os.path.join(dest, "components"), ignore=ignore)
+    shutil.copy2(os.path.join(REPO_ROOT, "main.py"), dest)
+
+def _run_child(game_dir):
+    """Measure one startup in a fresh interpreter"""
+    env = dict(os.environ)
+    env["SDL_VIDEODRIVER"] = "dummy"
+    env["SDL_AUDIODRIVER"] = "dummy"
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", game_dir],
+        cwd=game_dir, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        universal_newlines=True, timeout=120
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"startup run failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def run_benchmark(runs):
+    """Run cold and warm startups and summarize each phase"""
+    samples = {"cold": [], "warm": []}
+    scratch = tempfile.mkdtemp(prefix="snake-startup-")
+    try:
+        for index in range(runs):
+            game_dir = os.path.join(scratch, f"cold-{index}")
+            _copy_game(game_dir)
+            samples["cold"].append(_run_child(game_dir))
+
+        game_dir = os.path.join(scratch, "warm")
+        _copy_game(game_dir)
+        _run_child(game_dir)  # Prime bytecode, save files and OS caches
+        for index in range(runs):
+            samples["warm"].append(_run_child(game_dir))
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    return {
+        mode: {phase: summarize([run.get(phase, 0.0) for run in mode_samples]) for phase in PHASES}
+        for mode, mode_samples in samples.items()
+    }
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Measure game startup time headlessly")
+    parser.add_argument("--runs", type=int, default=5, help="startups per mode (default 5)")
+    parser.add_argument("--child", metavar="GAME_DIR", help=argparse.SUPPRESS)
+    add_output_arguments(parser, default_tolerance=20)
+    args = parser.parse_args(argv)
+
+    setup_headless()
+    if args.child:
+        sys.path.insert(0, args.child)
+        sys.stdout.write(json.dumps(measure_once()) + "\n")
+        sys.stdout.flush()
+        os._exit(0)  # Skip interpreter teardown; it is not part of startup
+
+    results = {
+        "benchmark": "startup",
+        "unit": "ms",
+        "runs": args.runs,
+        "environment": environment_info(),
+        "results": run_benchmark(args.runs),
+    }
+    metrics = [(f"results.{mode}.{phase}.p50", False) for mode in ("cold", "warm") for phase in ("total", "first_frame")]
+    return finish(results, args, metrics)
+
+if __name__ == "__main__":
+    sys.exit(main())
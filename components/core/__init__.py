@@ -1,6 +1,16 @@
 # Core components
 from .config import config, Config
 from .game_state import GameState
+from .scene_registry import SceneRegistry, Scene
 from .event_handler import EventHandler
 from .game_renderer import GameRenderer
+from .glyph_atlas import GlyphAtlas
+from .animation_clock import animation_clock, AnimationClock
+from .frame_governor import FrameGovernor
+from .frame_profiler import FrameProfiler
+from .stall_watchdog import StallWatchdog
+from .debug_capture import DebugCapture
+from .input_latency import input_latency, InputLatencyTracker
+from .persistence import atomic_write_json, DebouncedWriter
 from .achievement_manager import achievement_manager, AchievementManager
+from .leaderboard import leaderboard, Leaderboard
@@ -0,0 +1,356 @@
+"""
+Achievement catalog
+Loads declarative achievement definitions and compiles their conditions into fast evaluators
+"""
+
+import json
+import math
+import operator
+import os
+import numpy as np
+from .persistence import atomic_write_json
+
+# Bundled definitions; a different file can be passed to AchievementManager
+DEFAULT_CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "achievement_catalog.json")
+# Parsed entries as JSON, keyed by catalog path and signature; kept with the
+# config and save files in the working directory, never inside the package
+CACHE_FILE = "achievement_catalog.cache"
+
+# Bump when the parsed definition format changes so stale caches are ignored
+CACHE_VERSION = 3
+
+OPERATORS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+    "==": operator.eq,
+    "!=": operator.ne,
+}
+
+class StatThreshold:
+    """Condition met when a single stat reaches a value; indexed for O(log n) checks"""
+
+    def __init__(self, field, value):
+        self.field = field
+        self.value = value
+        self.depends_on = (field,)
+        self.columns = (field,)
+
+    def __call__(self, game_stats):
+        return getattr(game_stats, self.field) >= self.value
+
+    def evaluate_batch(self, columns):
+        """Evaluate against {field: array} columns, one entry per player"""
+        return np.asarray(columns[self.field]) >= self.value
+
+    def __repr__(self):
+        return f"StatThreshold({self.field!r}, {self.value!r})"
+
+class CompiledCondition:
+    """Condition compiled from a declarative spec"""
+
+    def __init__(self, spec, evaluate, evaluate_batch, depends_on, columns):
+        self.spec = spec
+        self._evaluate = evaluate
+        self._evaluate_batch = evaluate_batch
+        self.depends_on = depends_on  # Change-tracking keys for the achievement index
+        self.columns = columns  # Batch input columns
+
+    def __call__(self, game_stats):
+        return self._evaluate(game_stats)
+
+    def evaluate_batch(self, columns):
+        """Evaluate against {field: array} columns, one entry per player"""
+        return self._evaluate_batch(columns)
+
+    def __repr__(self):
+        return f"CompiledCondition({self.spec!r})"
+
+class AchievementDefinition:
+    """Parsed achievement entry from the catalog"""
+
+    def __init__(self, id, name, description, icon, condition, persistent=True, hidden=False):
+        self.id = id
+        self.name = name
+        self.description = description
+        self.icon = icon
+        self.condition = condition
+        self.persistent = persistent
+        self.hidden = hidden
+
+def _normalize_condition(spec):
+    """Validate a condition spec and expand shorthand into all/any/compare nodes
+
+    Supported forms:
+        {"stat": "total_games", "op": ">=", "value": 25}
+        {"stat": "consecutive_food", "op": ">=", "value": 5, "within_seconds": 10}
+        {"event": "food_eaten", "count": 5, "within_seconds": 10}
+        {"all": [...]} and {"any": [...]}
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"condition must be an object: {spec!r}")
+
+    for key in ("all", "any"):
+        if key in spec:
+            children = spec[key]
+            if not isinstance(children, list) or not children:
+                raise ValueError(f"'{key}' needs a non-empty list")
+            return {key: [_normalize_condition(child) for child in children]}
+
+    if "event" in spec:
+        # Rate condition: `count` events inside any window of `within_seconds`
+        event, count, window = spec["event"], spec.get("count"), spec.get("within_seconds")
+        if not isinstance(event, str) or not event:
+            raise ValueError(f"invalid event name: {event!r}")
+        if isinstance(count, bool) or not isinstance(count, int) or count < 1:
+            raise ValueError(f"invalid event count: {count!r}")
+        if isinstance(window, bool) or not isinstance(window, (int, float)) or window <= 0:
+            raise ValueError(f"invalid within_seconds: {window!r}")
+        return {"event": event, "count": count, "within_seconds": window}
+
+    stat = spec.get("stat")
+    op = spec.get("op", ">=")
+    value = spec.get("value")
+    if not isinstance(stat, str) or not stat.isidentifier() or stat.startswith("_"):
+        raise ValueError(f"invalid stat name: {stat!r}")
+    if op not in OPERATORS:
+        raise ValueError(f"unknown operator: {op!r}")
+    if isinstance(value, bool):
+        if op not in ("==", "!="):
+            raise ValueError(f"flag {stat} can only be compared with == or !=")
+    elif not isinstance(value, (int, float)):
+        raise ValueError(f"invalid value for {stat}: {value!r}")
+
+    compare = {"stat": stat, "op": op, "value": value}
+    window = spec.get("within_seconds")
+    if window is None:
+        return compare
+    if isinstance(window, bool) or not isinstance(window, (int, float)) or window <= 0:
+        raise ValueError(f"invalid within_seconds: {window!r}")
+    # Time window: the target must be reached before the game clock passes the limit
+    return {"all": [compare, {"stat": "survival_time", "op": "<=", "value": window}]}
+
+def _event_column(spec):
+    """Get the batch column holding the best span for an event node"""
+    return f"event_span:{spec['event']}:{spec['count']}"
+
+def _stat_names(spec, columns=False):
+    """Get keys referenced by a normalized spec, in first-use order
+
+    Returns change-tracking keys ("event:<name>" for rate conditions), or batch
+    column names when columns is True.
+    """
+    if "stat" in spec:
+        return [spec["stat"]]
+    if "event" in spec:
+        return [_event_column(spec) if columns else "event:" + spec["event"]]
+    names = []
+    for child in spec.get("all") or spec.get("any"):
+        for name in _stat_names(child, columns):
+            if name not in names:
+                names.append(name)
+    return names
+
+def compile_condition(spec):
+    """Compile a normalized spec into a StatThreshold or CompiledCondition"""
+    if "stat" in spec and spec["op"] == ">=" and not isinstance(spec["value"], bool):
+        return StatThreshold(spec["stat"], spec["value"])
+    evaluate, evaluate_batch = _compile_node(spec)
+    return CompiledCondition(spec, evaluate, evaluate_batch,
+                             tuple(_stat_names(spec)), tuple(_stat_names(spec, columns=True)))
+
+def _compile_node(spec):
+    """Build (scalar, batch) evaluator closures for a normalized spec node"""
+    if "stat" in spec:
+        compare = OPERATORS[spec["op"]]
+        stat, value = spec["stat"], spec["value"]
+
+        def evaluate(stats):
+            return compare(getattr(stats, stat), value)
+
+        def evaluate_batch(columns):
+            return compare(np.asarray(columns[stat]), value)
+
+        return evaluate, evaluate_batch
+
+    if "event" in spec:
+        event, count, window = spec["event"], spec["count"], spec["within_seconds"]
+        column = _event_column(spec)
+
+        def evaluate(stats):
+            return stats.event_span(event, count) <= window
+
+        def evaluate_batch(columns):
+            return np.asarray(columns[column], dtype=float) <= window
+
+        return evaluate, evaluate_batch
+
+    is_all = "all" in spec
+    children = [_compile_node(child) for child in spec["all" if is_all else "any"]]
+    scalar = tuple(child[0] for child in children)
+    batch = tuple(child[1] for child in children)
+    combine_scalar = all if is_all else any
+    combine_batch = np.logical_and.reduce if is_all else np.logical_or.reduce
+
+    def evaluate(stats):
+        return combine_scalar(child(stats) for child in scalar)
+
+    def evaluate_batch(columns):
+        return combine_batch([child(columns) for child in batch])
+
+    return evaluate, evaluate_batch
+
+def _parse_entry(entry):
+    """Validate one catalog entry into constructor arguments for AchievementDefinition"""
+    if not isinstance(entry, dict):
+        raise ValueError("achievement entry must be an object")
+    fields = {}
+    for key in ("id", "name", "description", "icon"):
+        value = entry.get(key)
+        if not isinstance(value, str) or not value:
+            raise ValueError(f"achievement {entry.get('id')!r} is missing '{key}'")
+        fields[key] = value
+    fields["persistent"] = bool(entry.get("persistent", True))
+    fields["hidden"] = bool(entry.get("hidden", False))
+    fields["condition"] = _normalize_condition(entry.get("condition"))
+    return fields
+
+def _parse_catalog(path):
+    """Read and validate a catalog file, skipping invalid entries"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    entries = data.get("achievements", []) if isinstance(data, dict) else []
+
+    parsed = []
+    seen = set()
+    for entry in entries:
+        try:
+            fields = _parse_entry(entry)
+        except (ValueError, TypeError, AttributeError):
+            continue  # One bad entry must not hide the rest of the catalog
+        if fields["id"] not in seen:
+            seen.add(fields["id"])
+            parsed.append(fields)
+    return parsed
+
+def _file_signature(path):
+    """Get a signature that changes whenever the file is edited"""
+    stat = os.stat(path)
+    return (os.path.abspath(path), stat.st_mtime_ns, stat.st_size, CACHE_VERSION)
+
+def _read_cache(cache_file, signature):
+    """Get the cache contents and the entries cached for signature (None if absent or stale)"""
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        record = cached[signature[0]]
+        if record["signature"] == list(signature) and isinstance(record["entries"], list):
+            return cached, record["entries"]
+        return cached, None
+    except (IOError, OSError, ValueError, UnicodeDecodeError, TypeError, KeyError, IndexError, AttributeError):
+        return None, None
+
+def _write_cache(cache_file, cached, signature, entries):
+    """Store parsed entries for signature, keeping entries for other catalogs"""
+    cached = cached if isinstance(cached, dict) else {}
+    cached[signature[0]] = {"signature": list(signature), "entries": entries}
+    try:
+        atomic_write_json(cache_file, cached, indent=None)
+    except (IOError, OSError, TypeError, ValueError):
+        pass
+
+def _build_definitions(entries):
+    """Compile parsed entries into AchievementDefinition objects"""
+    definitions = []
+    for fields in entries:
+        fields = dict(fields)
+        fields["condition"] = compile_condition(fields["condition"])
+        definitions.append(AchievementDefinition(**fields))
+    return definitions
+
+_compiled_cache = {}
+
+def load_catalog(path=DEFAULT_CATALOG_FILE, cache_file=CACHE_FILE):
+    """Load achievement definitions from a catalog file
+
+    Parsed entries are cached on disk as JSON keyed by the file's mtime and size, and compiled
+    definitions are shared in memory, so repeated loads skip parsing and compilation.
+    Falls back to the bundled catalog if the file is missing or unreadable.
+    """
+    try:
+        signature = _file_signature(path)
+    except OSError:
+        if path != DEFAULT_CATALOG_FILE:
+            return load_catalog(DEFAULT_CATALOG_FILE, cache_file)
+        return []
+
+    if signature in _compiled_cache:
+        return list(_compiled_cache[signature])
+
+    cached, entries = _read_cache(cache_file, signature) if cache_file else (None, None)
+    definitions = None
+    if entries is not None:
+        try:
+            definitions = _build_definitions(entries)
+        except (KeyError, TypeError, ValueError, AttributeError, IndexError):
+            definitions = None  # Damaged cache; parse the catalog again
+
+    if definitions is None:
+        try:
+            entries = _parse_catalog(path)
+        except (IOError, OSError, json.JSONDecodeError, UnicodeDecodeError):
+            if path != DEFAULT_CATALOG_FILE:
+                return load_catalog(DEFAULT_CATALOG_FILE, cache_file)
+            return []
+        definitions = _build_definitions(entries)
+        if cache_file:
+            _write_cache(cache_file, cached, signature, entries)
+
+    _compiled_cache[signature] = definitions
+    return list(definitions)
+
+def _column_value(stats, column):
+    """Read one batch column from a GameStats object or a dict of stat values"""
+    if isinstance(stats, dict):
+        return stats.get(column, math.inf if column.startswith("event_span:") else 0)
+    if column.startswith("event_span:"):
+        _, event, count = column.split(":")
+        return stats.event_span(event, int(count))
+    return getattr(stats, column, 0)
+
+def stats_to_columns(stats_list, columns):
+    """Convert GameStats objects or dicts into {column: array} form
+
+    Dicts supply rate conditions as "event_span:<event>:<count>" entries holding the
+    shortest time the player took to log that many events.
+    """
+    return {
+        column: np.asarray([_column_value(stats, column) for stats in stats_list])
+        for column in columns
+    }
+
+def evaluate_batch(definitions, stats_list):
+    """Evaluate every definition for many players at once
+
+    Args:
+        definitions: AchievementDefinition list from load_catalog
+        stats_list: GameStats objects or dicts of stat values, one per player
+
+    Returns:
+        dict: achievement id -> boolean NumPy array, True where the player qualifies
+    """
+    names = []
+    for definition in definitions:
+        for name in definition.condition.columns:
+            if name not in names:
+                names.append(name)
+    columns = stats_to_columns(stats_list, names)
+
+    results = {}
+    for definition in definitions:
+        try:
+            results[definition.id] = np.asarray(definition.condition.evaluate_batch(columns), dtype=bool)
+        except (TypeError, ValueError):
+            results[definition.id] = np.zeros(len(stats_list), dtype=bool)
+    return results
@@ -5,13 +5,19 @@ Tracks player progress and unlocks achievements
 
 import json
 import os
+import threading
 import time
+from bisect import bisect_right
 from datetime import datetime
+from .persistence import atomic_write_json, DebouncedWriter
+from .event_window import SlidingWindowCounter
+from .achievement_catalog import load_catalog, DEFAULT_CATALOG_FILE, StatThreshold
 
 class Achievement:
     """Individual achievement class"""
     
-    def __init__(self, id, name, description, icon, condition_func, persistent=True, hidden=False):
+    def __init__(self, id, name, description, icon, condition_func, persistent=True, hidden=False,
+                 depends_on=None):
         self.id = id
         self.name = name
         self.description = description
@@ -21,6 +27,11 @@ class Achievement:
         self.hidden = hidden
         self.unlocked = False
         self.unlock_time = None
+        
+        # GameStats fields the condition reads; None means check after any change
+        if depends_on is None:
+            depends_on = getattr(condition_func, "depends_on", None)
+        self.depends_on = tuple(depends_on) if depends_on is not None else None
     
     def check_condition(self, game_stats):
         """Check if achievement condition is met"""
@@ -42,6 +53,10 @@ class GameStats:
     """Track game statistics for achievements"""
     
     def __init__(self):
+        # Names of fields changed since the last achievement check; None means all
+        object.__setattr__(self, "changed_fields", None)
+        # Per-event timestamp buffers for rate-based achievements
+        object.__setattr__(self, "event_windows", {})
         self.reset_session()
         # Persistent stats
         self.total_games = 0
@@ -64,81 +79,150 @@ class GameStats:
         self.survival_time = 0
         self.deaths_this_game = 0
         self.perfect_level = True  # No deaths in current level
+        self.normal_food_eaten = 0
+        self.special_food_eaten = 0
+        self.bad_food_eaten = 0
+        self.last_death_cause = None
+        for window in self.event_windows.values():
+            window.clear()
+    
+    def _get_window(self, name):
+        """Get the timestamp buffer for an event kind, creating it on first use"""
+        window = self.event_windows.get(name)
+        if window is None:
+            window = self.event_windows[name] = SlidingWindowCounter()
+        return window
+    
+    def record_event(self, name, timestamp=None):
+        """Record a timestamped event (defaults to the current survival time)"""
+        self._get_window(name).record(self.survival_time if timestamp is None else timestamp)
+        if self.changed_fields is not None:
+            self.changed_fields.add("event:" + name)
+    
+    def event_span(self, name, count):
+        """Get the shortest time in which `count` events of this kind happened this game"""
+        return self._get_window(name).best_span(count)
+    
+    def event_count(self, name, seconds):
+        """Count events of this kind in the last `seconds` of game time"""
+        return self._get_window(name).count_within(seconds, self.survival_time)
+    
+    def __setattr__(self, name, value):
+        changed = self.changed_fields
+        if changed is not None and self.__dict__.get(name, _MISSING) != value:
+            changed.add(name)
+        object.__setattr__(self, name, value)
+    
+    def take_changed_fields(self):
+        """Get and clear fields changed since the last call (None means all)"""
+        changed = self.changed_fields
+        object.__setattr__(self, "changed_fields", set())
+        return changed
+    
+    def mark_all_changed(self):
+        """Force every achievement to be re-checked on the next evaluation"""
+        object.__setattr__(self, "changed_fields", None)
+
+_MISSING = object()
 
 class AchievementManager:
     """Manages all achievements and notifications"""
     
-    def __init__(self, save_file="achievements.json"):
+    def __init__(self, save_file="achievements.json", catalog_file=DEFAULT_CATALOG_FILE):
         self.save_file = save_file
+        self.catalog_file = catalog_file
         self.achievements = {}
         self.game_stats = GameStats()
         self.pending_notifications = []
         self.notification_timer = 0
         
-        self._define_achievements()
-        self.load_progress()
-        self.reset_session_achievements()  # Reset session achievements on startup
+        # Dependency index built lazily by _rebuild_index
+        self._index_dirty = True
+        self._thresholds = {}
+        self._threshold_values = {}
+        self._dependents = {}
+        self._always_check = []
+        
+        # Incremented whenever unlock state changes so views can cache their rendering
+        self.revision = 0
+        
+        # Unlocks are saved write-behind so gameplay frames never wait on disk
+        self._writer = DebouncedWriter(save_file, delay=1.0, indent=2)
+        
+        # Catalog and saved progress are read on first use (or by preload), not at import
+        self._loaded = False
+        self._loading = False
+        self._load_lock = threading.RLock()
+        self._preload_thread = None
+    
+    def _ensure_loaded(self):
+        """Read the catalog and saved progress once, waiting for a running preload"""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded or self._loading:
+                return
+            self._loading = True
+            try:
+                self._define_achievements()
+                self.load_progress()
+                self.reset_session_achievements()  # Reset session achievements on startup
+            finally:
+                self._loading = False
+                self._loaded = True
+    
+    def preload(self):
+        """Start reading the catalog and saved progress on a background thread"""
+        if self._loaded or self._preload_thread is not None:
+            return
+        self._preload_thread = threading.Thread(target=self._ensure_loaded, name="achievement-load", daemon=True)
+        self._preload_thread.start()
     
     def _define_achievements(self):
-        """Define all available achievements"""
-        achievements_data = [
-            # SESSION ACHIEVEMENTS (Reset each game session)
-            ("speed_demon", "Speed Demon", "Eat 5 food items in 10 seconds", ">>>", 
-             lambda stats: stats.consecutive_food >= 5 and stats.survival_time <= 10, False),
-            
-            ("survivor", "Survivor", "Survive for 60 seconds", "60s", 
-             lambda stats: stats.survival_time >= 60, False),
-            
-            ("speed_eater", "Speed Eater", "Eat 3 food items in 5 seconds", "3<<", 
-             lambda stats: stats.consecutive_food >= 3 and stats.survival_time <= 5, False),
-            
-            ("collector", "Collector", "Collect 10 power-ups in one game", "10+", 
-             lambda stats: stats.powerups_collected_this_game >= 10, False),
-            
-            ("session_master", "Session Master", "Reach score 300 in one game", "300", 
-             lambda stats: stats.current_score >= 300, False),
-            
-            ("food_chain", "Food Chain", "Eat 20 food items in one game", "20", 
-             lambda stats: stats.food_eaten_this_game >= 20, False),
-            
-            # PERSISTENT ACHIEVEMENTS (Saved between sessions)
-            ("first_blood", "First Blood", "Complete your first game", "1st", 
-             lambda stats: stats.total_games >= 1, True),
-            
-            ("baby_steps", "Baby Steps", "Eat 50 food items total", "50", 
-             lambda stats: stats.total_food_eaten >= 50, True),
-            
-            ("getting_started", "Getting Started", "Reach score 500 total", "500", 
-             lambda stats: stats.highest_score >= 500, True),
-            
-            ("power_hungry", "Power Hungry", "Collect 100 power-ups total", "100", 
-             lambda stats: stats.total_powerups_collected >= 100, True),
-            
-            ("high_roller", "High Roller", "Reach score 1000", "1K", 
-             lambda stats: stats.highest_score >= 1000, True),
-            
-            ("score_master", "Score Master", "Reach score 2000", "2K", 
-             lambda stats: stats.highest_score >= 2000, True),
-            
-            ("level_up", "Level Up", "Reach level 3", "L3", 
-             lambda stats: stats.highest_level >= 3, True),
-            
-            ("master_level", "Master Level", "Reach level 5", "L5", 
-             lambda stats: stats.highest_level >= 5, True),
-            
-            ("glutton", "Glutton", "Eat 200 food items total", "200", 
-             lambda stats: stats.total_food_eaten >= 200, True),
-            
-            ("veteran", "Veteran", "Play 25 games", "25G", 
-             lambda stats: stats.total_games >= 25, True),
-            
-            ("dedication", "Dedication", "Play for 30 minutes total", "30m", 
-             lambda stats: stats.total_playtime >= 1800, True),  # 30 minutes
-        ]
+        """Define all available achievements from the catalog file"""
+        for definition in load_catalog(self.catalog_file):
+            self.add_achievement(Achievement(
+                definition.id, definition.name, definition.description, definition.icon,
+                definition.condition, definition.persistent, definition.hidden
+            ))
+    
+    def add_achievement(self, achievement):
+        """Register an achievement and schedule an index rebuild"""
+        self.achievements[achievement.id] = achievement
+        self._index_dirty = True
+        self.revision += 1
+    
+    def _rebuild_index(self):
+        """Index locked achievements by the stat fields they depend on
+        
+        Threshold conditions go into per-field lists sorted by value, so finding the
+        newly met ones is a bisect. Other conditions are listed under each field they read.
+        """
+        self._thresholds = {}
+        self._dependents = {}
+        self._always_check = []
+        
+        for achievement in self.achievements.values():
+            if achievement.unlocked:
+                continue
+            condition = achievement.condition_func
+            if isinstance(condition, StatThreshold):
+                self._thresholds.setdefault(condition.field, []).append((condition.value, achievement.id))
+            elif achievement.depends_on is None:
+                self._always_check.append(achievement)
+            else:
+                for field in achievement.depends_on:
+                    self._dependents.setdefault(field, []).append(achievement)
+        
+        for entries in self._thresholds.values():
+            entries.sort()
+        self._threshold_values = {
+            field: [value for value, _ in entries] for field, entries in self._thresholds.items()
+        }
         
-        for achievement_data in achievements_data:
-            achievement = Achievement(*achievement_data)
-            self.achievements[achievement.id] = achievement
+        self._index_dirty = False
+        # Stats may already satisfy conditions that were just (re)indexed
+        self.game_stats.mark_all_changed()
     
     def update_stats(self, event_type, **kwargs):
         """Update game statistics based on events
@@ -147,6 +231,7 @@ class AchievementManager:
             event_type (str): Type of event ('game_start', 'food_eaten', etc.)
             **kwargs: Additional event data (score, level, food_type, etc.)
         """
+        self._ensure_loaded()
         if event_type == "game_start":
             self.game_stats.reset_session()
             
@@ -160,9 +245,16 @@ class AchievementManager:
             
         elif event_type == "food_eaten":
             food_type = kwargs.get("food_type", "normal")
+            if food_type == "normal":
+                self.game_stats.normal_food_eaten += 1
+            elif food_type == "special":
+                self.game_stats.special_food_eaten += 1
+            else:
+                self.game_stats.bad_food_eaten += 1
             if food_type in ["normal", "special"]:  # Don't count bad food
                 self.game_stats.food_eaten_this_game += 1
                 self.game_stats.total_food_eaten += 1
+                self.game_stats.record_event("food_eaten")
                 self.game_stats.consecutive_food += 1
                 self.game_stats.max_consecutive_food = max(
                     self.game_stats.max_consecutive_food, 
@@ -173,6 +265,7 @@ class AchievementManager:
                 
         elif event_type == "powerup_collected":
             self.game_stats.powerups_collected_this_game += 1
+            self.game_stats.record_event("powerup_collected")
             self.game_stats.total_powerups_collected += 1
             
         elif event_type == "score_update":
@@ -183,6 +276,7 @@ class AchievementManager:
             
         elif event_type == "death":
             self.game_stats.deaths_this_game += 1
+            self.game_stats.last_death_cause = kwargs.get("cause")
             self.game_stats.perfect_level = False
             self.game_stats.consecutive_food = 0
             
@@ -190,25 +284,64 @@ class AchievementManager:
             self.game_stats.survival_time = kwargs.get("time", 0)
     
     def check_achievements(self):
-        """Check all achievements and return newly unlocked ones (optimized)
+        """Check achievements affected by changed stats and return newly unlocked ones
         
         Returns:
             list: List of newly unlocked Achievement objects
         
         Note:
-            Only checks unlocked achievements to improve performance
+            Only locked achievements that depend on a changed stat are evaluated,
+            so the cost does not grow with the number of achievements.
         """
+        self._ensure_loaded()
+        if self._index_dirty:
+            self._rebuild_index()
+        
+        changed_fields = self.game_stats.take_changed_fields()
+        if changed_fields is None:
+            changed_fields = set(self._thresholds) | set(self._dependents)
+        if not changed_fields and not self._always_check:
+            return []
+        
         newly_unlocked = []
+        stats = self.game_stats
         
-        # Only check unlocked achievements to avoid redundant checks
-        for achievement in self.achievements.values():
-            if not achievement.unlocked and achievement.check_condition(self.game_stats):
+        for field in changed_fields:
+            # Thresholds up to the current value are met; they are sorted so this is a bisect
+            values = self._threshold_values.get(field)
+            if values:
+                try:
+                    met = bisect_right(values, getattr(stats, field))
+                except (AttributeError, TypeError):
+                    met = 0
+                if met:
+                    for _, aid in self._thresholds[field][:met]:
+                        achievement = self.achievements[aid]
+                        if not achievement.unlocked:
+                            achievement.unlock()
+                            newly_unlocked.append(achievement)
+                    del self._thresholds[field][:met]
+                    del values[:met]
+            
+            for achievement in self._dependents.get(field, ()):
+                if achievement.check_condition(stats):
+                    newly_unlocked.append(achievement)
+        
+        for achievement in self._always_check:
+            if achievement.check_condition(stats):
                 newly_unlocked.append(achievement)
-                self.pending_notifications.append(achievement)
+        
+        if newly_unlocked:
+            # Drop unlocked entries from the dependency lists
+            for field, dependents in self._dependents.items():
+                self._dependents[field] = [a for a in dependents if not a.unlocked]
+            self._always_check = [a for a in self._always_check if not a.unlocked]
+            self.pending_notifications.extend(newly_unlocked)
         
         # Save progress only if there are new achievements
         if newly_unlocked:
-            self.save_progress()
+            self.revision += 1
+            self.schedule_save()
         
         return newly_unlocked
     
@@ -226,6 +359,7 @@ class AchievementManager:
     
     def get_progress_summary(self):
         """Get achievement progress summary"""
+        self._ensure_loaded()
         total = len(self.achievements)
         unlocked = sum(1 for a in self.achievements.values() if a.unlocked)
         return {
@@ -236,6 +370,7 @@ class AchievementManager:
     
     def get_achievements_by_category(self):
         """Get achievements organized by unlock status"""
+        self._ensure_loaded()
         unlocked = [a for a in self.achievements.values() if a.unlocked]
         locked = [a for a in self.achievements.values() if not a.unlocked and not a.hidden]
         
@@ -247,13 +382,17 @@ class AchievementManager:
     
     def reset_session_achievements(self):
         """Reset all session-based achievements"""
+        self._ensure_loaded()
         for achievement in self.achievements.values():
-            if not achievement.persistent:
+            if not achievement.persistent and achievement.unlocked:
                 achievement.unlocked = False
                 achievement.unlock_time = None
+                self.revision += 1
+                self._index_dirty = True
     
     def get_achievements_by_type(self):
         """Get achievements organized by type (session vs persistent)"""
+        self._ensure_loaded()
         session_unlocked = [a for a in self.achievements.values() if not a.persistent and a.unlocked]
         session_locked = [a for a in self.achievements.values() if not a.persistent and not a.unlocked]
         persistent_unlocked = [a for a in self.achievements.values() if a.persistent and a.unlocked]
@@ -264,37 +403,50 @@ class AchievementManager:
             "persistent": {"unlocked": persistent_unlocked, "locked": persistent_locked}
         }
     
-    def save_progress(self):
-        """Save only persistent achievement progress to file
+    def _build_save_data(self):
+        """Build a plain-data copy of persistent progress for writing
         
         Note:
-            Only saves persistent achievements and stats.
+            Only includes persistent achievements and stats.
             Session achievements are not saved and reset each game.
         """
-        try:
-            # Only save persistent achievements
-            persistent_achievements = {
-                aid: {
-                    "unlocked": a.unlocked,
-                    "unlock_time": a.unlock_time
-                } for aid, a in self.achievements.items() if a.persistent
-            }
-            
-            data = {
-                "achievements": persistent_achievements,
-                "stats": {
-                    "total_games": self.game_stats.total_games,
-                    "total_score": self.game_stats.total_score,
-                    "total_food_eaten": self.game_stats.total_food_eaten,
-                    "total_powerups_collected": self.game_stats.total_powerups_collected,
-                    "highest_score": self.game_stats.highest_score,
-                    "highest_level": self.game_stats.highest_level,
-                    "total_playtime": self.game_stats.total_playtime
-                }
+        # Only save persistent achievements
+        persistent_achievements = {
+            aid: {
+                "unlocked": a.unlocked,
+                "unlock_time": a.unlock_time
+            } for aid, a in self.achievements.items() if a.persistent
+        }
+        
+        return {
+            "achievements": persistent_achievements,
+            "stats": {
+                "total_games": self.game_stats.total_games,
+                "total_score": self.game_stats.total_score,
+                "total_food_eaten": self.game_stats.total_food_eaten,
+                "total_powerups_collected": self.game_stats.total_powerups_collected,
+                "highest_score": self.game_stats.highest_score,
+                "highest_level": self.game_stats.highest_level,
+                "total_playtime": self.game_stats.total_playtime
             }
-            
-            with open(self.save_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+        }
+    
+    def schedule_save(self):
+        """Queue progress for a background write; bursts of unlocks share one write"""
+        self._writer.schedule(self._build_save_data())
+    
+    def flush(self):
+        """Finish any queued background write and stop the writer"""
+        self._writer.close()
+    
+    def save_progress(self):
+        """Save only persistent achievement progress to file immediately"""
+        if not self._loaded:
+            return  # Nothing was read, so nothing can have changed
+        try:
+            data = self._build_save_data()
+            with self._writer.lock:
+                atomic_write_json(self.save_file, data, indent=2)
         except (IOError, OSError, PermissionError) as e:
             # Handle file system errors gracefully
             pass
@@ -319,6 +471,9 @@ class AchievementManager:
                     achievement.unlocked = progress.get("unlocked", False)
                     achievement.unlock_time = progress.get("unlock_time")
             
+            self.revision += 1
+            self._index_dirty = True
+            
             # Load persistent stats
             stats_data = data.get("stats", {})
             for key, value in stats_data.items():
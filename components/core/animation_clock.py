@@ -0,0 +1,31 @@
+"""
+Animation clock for time-based effects
+Entities and menus sample elapsed time so animation speed does not depend on the frame rate
+"""
+
+import time
+
+class AnimationClock:
+    """Monotonic clock shared by all animated entities and menus"""
+
+    # Gameplay animations were tuned at the fixed 60 FPS gameplay rate
+    REFERENCE_FPS = 60
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+
+    def now(self):
+        """Get seconds elapsed since the clock was created"""
+        return time.perf_counter() - self._origin
+
+    def frames_since(self, start_time, fps=REFERENCE_FPS):
+        """Get elapsed time since start_time expressed in frames at the given rate"""
+        return (self.now() - start_time) * fps
+
+    @staticmethod
+    def smoothing(rate, elapsed_frames):
+        """Get easing factor equivalent to applying `rate` once per frame for elapsed_frames"""
+        return 1.0 - (1.0 - rate) ** max(0.0, elapsed_frames)
+
+# Global animation clock instance
+animation_clock = AnimationClock()
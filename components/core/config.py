@@ -3,8 +3,12 @@ Configuration file for Snake Game
 Contains all game settings, colors, and constants
 """
 
+import copy
 import json
 import os
+import threading
+import weakref
+from .persistence import atomic_write_json, DebouncedWriter
 
 # Default game settings
 DEFAULT_CONFIG = {
@@ -61,24 +65,144 @@ DEFAULT_CONFIG = {
         "speed_multiplier": [1.0, 1.2, 1.5, 1.8, 2.0],
         "special_food_chance": [0.1, 0.15, 0.2, 0.25, 0.3],
         "level_names": ["Easy", "Normal", "Hard", "Expert", "Master"]
+    },
+    "debug": {
+        "frame_profiler_overlay": False,  # F3 toggles, F4 exports the recorded frames
+        "stall_watchdog": True,           # Log main-loop stalls to stalls.log
+        "stall_threshold_ms": 50,
+        "capture_frames": 300             # F5 profiles this many frames of the current state
     }
 }
 
+DEFAULT_COLOR = (255, 255, 255)
+
+class ConfigSection:
+    """Read-only attribute view of a config section"""
+    
+    def __init__(self, **values):
+        self.__dict__.update(values)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("config snapshot is read-only")
+    
+    def __delattr__(self, name):
+        raise AttributeError("config snapshot is read-only")
+    
+    def __repr__(self):
+        return f"ConfigSection({self.__dict__!r})"
+
+def _to_color(value):
+    """Convert config color value to an RGB tuple"""
+    if isinstance(value, (list, tuple)) and len(value) >= 3:
+        try:
+            return tuple(int(c) for c in value[:3])  # Ensure RGB format
+        except (TypeError, ValueError):
+            pass
+    return DEFAULT_COLOR
+
+def _freeze(value, default=None):
+    """Convert a config value to its snapshot form, falling back to default if invalid"""
+    if isinstance(default, dict) or (default is None and isinstance(value, dict)):
+        default = default or {}
+        source = value if isinstance(value, dict) else {}
+        keys = list(default) + [key for key in source if key not in default]
+        return ConfigSection(**{
+            key: _freeze(source.get(key, default.get(key)), default.get(key)) for key in keys
+        })
+    if isinstance(default, bool):
+        return value if isinstance(value, bool) else default
+    if isinstance(default, (int, float)):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return value
+        return default
+    if isinstance(default, list):
+        return tuple(value) if isinstance(value, (list, tuple)) else tuple(default)
+    if isinstance(value, list):
+        return tuple(value)
+    return value
+
+def _values_equal(old, new):
+    """Compare config values, treating lists and tuples alike"""
+    if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+        return list(old) == list(new)
+    return old == new
+
+def _diff_paths(old, new, prefix=""):
+    """List dotted key paths whose values differ between two config dicts"""
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed = []
+        for key in list(old) + [key for key in new if key not in old]:
+            path = f"{prefix}.{key}" if prefix else key
+            if key not in old or key not in new:
+                changed.append(path)
+            else:
+                changed.extend(_diff_paths(old[key], new[key], path))
+        return changed
+    return [] if _values_equal(old, new) else [prefix]
+
+def _paths_match(path, prefix):
+    """Check if a changed path and a subscribed prefix overlap"""
+    return (path == prefix or path.startswith(prefix + ".") or prefix.startswith(path + "."))
+
 class Config:
     """Configuration manager for the game"""
     
     def __init__(self, config_file="config.json"):
         self.config_file = config_file
-        self.config = self.load_config()
+        
+        # Read from disk on first access so importing the package does no I/O
+        self._config = None
+        self._snapshot = None
+        self._file_signature = None
+        
+        # Change notification: list of (key prefixes, callback reference)
+        self._subscribers = []
+        
+        # Hot reload state, filled by the file watcher thread
+        self._pending_config = None
+        self._reload_lock = threading.Lock()
+        self._watcher = None
+        
+        # Serializes disk access between the background writer and the watcher
+        self._file_lock = threading.Lock()
+        self._writer = DebouncedWriter(config_file, delay=0.5, lock=self._file_lock,
+                                       on_written=self._on_file_written)
+    
+    @property
+    def config(self):
+        """Raw config dict, loaded on first access"""
+        self._ensure_loaded()
+        return self._config
+    
+    @config.setter
+    def config(self, value):
+        self._config = value
+    
+    @property
+    def snapshot(self):
+        """Read-only typed view of the config, built on first access"""
+        if self._snapshot is None:
+            self._snapshot = self._build_snapshot()
+        return self._snapshot
+    
+    @snapshot.setter
+    def snapshot(self, value):
+        self._snapshot = value
+    
+    def _ensure_loaded(self):
+        """Read the config file if it has not been read yet"""
+        if self._config is None:
+            self._config = self.load_config()
+            self._file_signature = self._get_file_signature()
     
     def load_config(self):
         """Load configuration from file or create default"""
         # Validate config_file path to prevent path traversal
         if not self._is_safe_path(self.config_file):
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
             
         if not os.path.exists(self.config_file):
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
             
         try:
             with open(self.config_file, 'r', encoding='utf-8') as f:
@@ -86,32 +210,166 @@ class Config:
             
             # Validate loaded config structure
             if not isinstance(config, dict):
-                return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
                 
             # Merge with default config to ensure all keys exist
             try:
                 return self._merge_configs(DEFAULT_CONFIG, config)
             except (TypeError, AttributeError, RecursionError):
-                return DEFAULT_CONFIG.copy()
+                return copy.deepcopy(DEFAULT_CONFIG)
                 
         except (json.JSONDecodeError, IOError, OSError, UnicodeDecodeError):
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
     
     def save_config(self):
-        """Save current configuration to file"""
+        """Save current configuration to file immediately"""
         # Validate config_file path to prevent path traversal
         if not self._is_safe_path(self.config_file):
             return
             
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4, ensure_ascii=False)
-        except IOError:
+            with self._file_lock:
+                atomic_write_json(self.config_file, self.config)
+                self._on_file_written()
+        except (IOError, OSError):
             pass
     
+    def schedule_save(self):
+        """Save configuration on a background thread once changes settle"""
+        if not self._is_safe_path(self.config_file):
+            return
+        self._writer.schedule(copy.deepcopy(self.config))
+    
+    def flush(self):
+        """Write any scheduled save now; call before exiting"""
+        self._writer.close()
+    
+    def _on_file_written(self):
+        """Remember our own write so the watcher does not treat it as an external change"""
+        self._file_signature = self._get_file_signature()
+    
+    def reload(self):
+        """Reload configuration from file"""
+        self._apply_config(self.load_config())
+    
+    def _apply_config(self, new_config):
+        """Replace configuration and notify subscribers of changed keys"""
+        changed_paths = _diff_paths(self.config, new_config)
+        self.config = new_config
+        if changed_paths:
+            self.snapshot = self._build_snapshot()
+            self._notify(changed_paths)
+    
+    def subscribe(self, callback, *key_prefixes):
+        """Call callback(changed_paths) when keys under any of key_prefixes change
+        
+        Bound methods are held weakly so subscribing objects can still be collected;
+        their subscription is dropped when they are. With no prefixes the callback
+        receives every change. Returns a token for unsubscribe.
+        """
+        if hasattr(callback, "__self__"):
+            reference = weakref.WeakMethod(callback, self._drop_subscriber)
+        else:
+            reference = lambda: callback
+        token = (tuple(key_prefixes), reference)
+        self._subscribers.append(token)
+        return token
+    
+    def unsubscribe(self, token):
+        """Remove a subscription"""
+        if token in self._subscribers:
+            self._subscribers.remove(token)
+    
+    def _drop_subscriber(self, dead_reference):
+        """Remove the subscription of a collected object (weakref callback)"""
+        self._subscribers = [token for token in self._subscribers if token[1] is not dead_reference]
+    
+    def _notify(self, changed_paths):
+        """Notify subscribers whose prefixes match the changed paths"""
+        for token in list(self._subscribers):
+            key_prefixes, reference = token
+            callback = reference()
+            if callback is None:
+                self.unsubscribe(token)
+                continue
+            
+            if key_prefixes:
+                matched = [path for path in changed_paths
+                           if any(_paths_match(path, prefix) for prefix in key_prefixes)]
+            else:
+                matched = list(changed_paths)
+            
+            if matched:
+                try:
+                    callback(matched)
+                except Exception:
+                    pass  # A broken subscriber must not break the game loop
+    
+    def _get_file_signature(self):
+        """Get (mtime, size) of the config file, or None if missing"""
+        try:
+            stat = os.stat(self.config_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def start_file_watcher(self, interval=1.0):
+        """Watch config file for external edits on a background thread"""
+        if self._watcher is not None:
+            return
+        # Load first so only edits made after startup count as changes
+        self._ensure_loaded()
+        stop_event = threading.Event()
+        
+        def watch():
+            while not stop_event.wait(interval):
+                with self._file_lock:
+                    signature = self._get_file_signature()
+                    if signature is None or signature == self._file_signature:
+                        continue
+                    new_config = self.load_config()
+                    self._file_signature = signature
+                with self._reload_lock:
+                    self._pending_config = new_config
+        
+        thread = threading.Thread(target=watch, name="config-watcher", daemon=True)
+        self._watcher = (thread, stop_event)
+        thread.start()
+    
+    def stop_file_watcher(self):
+        """Stop the background file watcher"""
+        if self._watcher is not None:
+            self._watcher[1].set()
+            self._watcher = None
+    
+    def poll_file_changes(self):
+        """Apply a reload picked up by the file watcher; call once per frame on the main thread"""
+        if self._pending_config is None:
+            return False
+        with self._reload_lock:
+            new_config, self._pending_config = self._pending_config, None
+        if new_config is None:
+            return False
+        self._apply_config(new_config)
+        return True
+    
+    def _build_snapshot(self):
+        """Build immutable snapshot with validated numbers and precomputed color tuples"""
+        try:
+            snapshot = _freeze(self.config, DEFAULT_CONFIG)
+        except (TypeError, AttributeError, RecursionError):
+            snapshot = _freeze(DEFAULT_CONFIG, DEFAULT_CONFIG)
+        
+        colors = self.config.get("colors") if isinstance(self.config.get("colors"), dict) else {}
+        colors = {**DEFAULT_CONFIG["colors"], **colors}
+        snapshot.__dict__["colors"] = ConfigSection(**{
+            name: _to_color(value) for name, value in colors.items()
+        })
+        return snapshot
+    
     def _merge_configs(self, default, user):
         """Merge user config with default config"""
-        result = default.copy()
+        result = copy.deepcopy(default)
         for key, value in user.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
                 result[key] = self._merge_configs(result[key], value)
@@ -132,6 +390,7 @@ class Config:
     
     def set(self, key_path, value):
         """Set configuration value using dot notation"""
+        old_value = self.get(key_path)
         try:
             keys = key_path.split('.')
             config = self.config
@@ -141,17 +400,19 @@ class Config:
                 config = config[key]
             config[keys[-1]] = value
         except (AttributeError, TypeError, KeyError):
-            pass  # Silently fail if config structure is invalid
+            return  # Silently fail if config structure is invalid
+        
+        # A local change supersedes any reload read from disk before it
+        with self._reload_lock:
+            self._pending_config = None
+        
+        if not _values_equal(old_value, value):
+            self.snapshot = self._build_snapshot()
+            self._notify([key_path])
     
     def get_color(self, color_name):
         """Get color tuple from config"""
-        try:
-            color = self.get(f"colors.{color_name}")
-            if color and isinstance(color, (list, tuple)) and len(color) >= 3:
-                return tuple(color[:3])  # Ensure RGB format
-            return (255, 255, 255)  # Default white
-        except (TypeError, ValueError):
-            return (255, 255, 255)
+        return getattr(self.snapshot.colors, color_name, DEFAULT_COLOR)
     
     def get_screen_size(self):
         """Get fixed optimal screen dimensions"""
@@ -159,11 +420,11 @@ class Config:
     
     def get_fps(self):
         """Get FPS setting"""
-        return self.get("screen.fps")
+        return self.snapshot.screen.fps
     
     def get_block_size(self):
         """Get block size"""
-        return self.get("game.block_size", 20)
+        return self.snapshot.game.block_size
     
     def _is_safe_path(self, path):
         """Check if path is safe (no path traversal)"""
@@ -0,0 +1,177 @@
+"""
+Per-state debug capture
+Wraps the next frames of one game state in cProfile and takes tracemalloc snapshots
+before and after, writing a pstats file and a text report labelled with the state
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import tracemalloc
+from datetime import datetime
+
+class DebugCapture:
+    """Profiles and allocation-diffs a run of frames in a single game state
+
+    Capture starts at the first frame in the requested state (or the current one)
+    and ends after the requested number of frames, or early if the state changes.
+    Only frame work between begin_frame() and end_frame() is profiled.
+    """
+
+    TOP_FUNCTIONS = 40
+    TOP_ALLOCATIONS = 25
+    TRACEBACK_DEPTH = 10
+
+    # Allocations made by the capture itself
+    IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>",
+                     "<unknown>", __file__, tracemalloc.__file__, cProfile.__file__, pstats.__file__)
+
+    def __init__(self, frames=300, output_dir=".", context=None):
+        self.frames = frames
+        self.output_dir = output_dir
+        self.context = context  # Callable returning a dict of details (e.g. cache sizes) for the report
+        self.last_report = None
+
+        self._requested_frames = 0
+        self._requested_state = None
+        self._state = None
+        self._remaining = 0
+        self._captured = 0
+        self._profile = None
+        self._snapshot = None
+        self._started_tracing = False
+        self._start_time = 0.0
+        self._context_before = {}
+
+    @property
+    def active(self):
+        """Check if frames are being captured"""
+        return self._profile is not None
+
+    def request(self, frames=None, state=None):
+        """Capture the next frames of state (the current state if None)"""
+        if self.active:
+            return
+        self._requested_frames = frames or self.frames
+        self._requested_state = state
+
+    def request_from_env(self, environ=None):
+        """Request a capture from SNAKE_CAPTURE_FRAMES and optional SNAKE_CAPTURE_STATE"""
+        environ = os.environ if environ is None else environ
+        try:
+            frames = int(environ.get("SNAKE_CAPTURE_FRAMES", "0"))
+        except ValueError:
+            return
+        if frames > 0:
+            self.request(frames, environ.get("SNAKE_CAPTURE_STATE") or None)
+
+    def begin_frame(self, state):
+        """Start or resume profiling for a frame in state"""
+        if self.active:
+            if state != self._state:
+                self._finish()  # The state ended before the requested frames
+                return
+            self._profile.enable()
+            return
+        if self._requested_frames and (self._requested_state is None or self._requested_state == state):
+            self._start(state)
+            self._profile.enable()
+
+    def end_frame(self):
+        """Pause profiling at the end of a frame's work"""
+        if not self.active:
+            return
+        self._profile.disable()
+        self._captured += 1
+        self._remaining -= 1
+        if self._remaining <= 0:
+            self._finish()
+
+    def stop(self):
+        """Finish a capture in progress, e.g. on exit"""
+        if self.active:
+            self._finish()
+
+    def _start(self, state):
+        """Take the starting snapshot and create the profiler"""
+        self._state = state
+        self._remaining = self._requested_frames
+        self._requested_frames = 0
+        self._requested_state = None
+        self._captured = 0
+        self._context_before = self._read_context()
+
+        self._started_tracing = not tracemalloc.is_tracing()
+        if self._started_tracing:
+            tracemalloc.start(self.TRACEBACK_DEPTH)
+        self._snapshot = self._take_snapshot()
+        self._start_time = time.perf_counter()
+        self._profile = cProfile.Profile()
+
+    def _finish(self):
+        """Take the closing snapshot and write the results"""
+        profile, self._profile = self._profile, None
+        profile.disable()
+        duration = time.perf_counter() - self._start_time
+        after = self._take_snapshot()
+        if self._started_tracing:
+            tracemalloc.stop()
+        before, self._snapshot = self._snapshot, None
+
+        base = os.path.join(self.output_dir, datetime.now().strftime(f"capture_{self._state}_%Y%m%d_%H%M%S"))
+        try:
+            profile.dump_stats(base + ".prof")
+            with open(base + ".txt", 'w', encoding='utf-8') as f:
+                f.write(self._format_report(profile, before, after, duration))
+        except (IOError, OSError):
+            return
+        self.last_report = os.path.abspath(base + ".txt")
+
+    def _take_snapshot(self):
+        """Take a tracemalloc snapshot without the capture's own allocations"""
+        snapshot = tracemalloc.take_snapshot()
+        return snapshot.filter_traces([tracemalloc.Filter(False, name) for name in self.IGNORED_FILES])
+
+    def _read_context(self):
+        """Get details from the context callback"""
+        if self.context is None:
+            return {}
+        try:
+            return dict(self.context())
+        except Exception:
+            return {}
+
+    def _format_report(self, profile, before, after, duration):
+        """Format the context, allocation diff and profile as text"""
+        out = io.StringIO()
+        out.write(f"State: {self._state}\n")
+        out.write(f"Frames: {self._captured} in {duration:.2f} s\n")
+
+        context_after = self._read_context()
+        if context_after:
+            out.write("\nContext (before -> after)\n")
+            for key in sorted(set(self._context_before) | set(context_after)):
+                out.write(f"  {key}: {self._context_before.get(key, '-')} -> {context_after.get(key, '-')}\n")
+
+        lines = after.compare_to(before, "lineno")
+        growth = sum(stat.size_diff for stat in lines)
+        out.write(f"\nAllocations kept over the capture: {growth / 1024:+.1f} KiB "
+                  f"({sum(stat.count_diff for stat in lines):+d} blocks)\n")
+        out.write(f"\nTop {self.TOP_ALLOCATIONS} lines by growth\n")
+        for stat in lines[:self.TOP_ALLOCATIONS]:
+            out.write(f"  {stat}\n")
+
+        out.write("\nLargest growing allocation sites with tracebacks\n")
+        for stat in after.compare_to(before, "traceback")[:5]:
+            if stat.size_diff <= 0:
+                break
+            out.write(f"  {stat.size_diff / 1024:+.1f} KiB, {stat.count_diff:+d} blocks\n")
+            for line in stat.traceback.format():
+                out.write(f"    {line}\n")
+
+        out.write(f"\nProfile: top {self.TOP_FUNCTIONS} functions by cumulative time\n")
+        stats = pstats.Stats(profile, stream=out)
+        stats.sort_stats("cumulative").print_stats(self.TOP_FUNCTIONS)
+        return out.getvalue()
@@ -3,42 +3,77 @@ Event handling for different game states
 """
 
 import pygame
+from .input_latency import input_latency
+from .scene_registry import SceneRegistry
 
 class EventHandler:
     """Handles events for different game states"""
     
-    def __init__(self, game_state, menus, block_size):
+    # Events after which the window contents must be redrawn
+    EXPOSE_EVENTS = (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE))
+    
+    # Key -> unit direction for snake movement
+    DIRECTION_KEYS = {
+        pygame.K_LEFT: (-1, 0), pygame.K_a: (-1, 0),
+        pygame.K_RIGHT: (1, 0), pygame.K_d: (1, 0),
+        pygame.K_UP: (0, -1), pygame.K_w: (0, -1),
+        pygame.K_DOWN: (0, 1), pygame.K_s: (0, 1),
+    }
+    
+    def __init__(self, game_state, menus, block_size, scenes=None):
         self.game_state = game_state
         self.menus = menus
         self.block_size = block_size
+        self.last_event_count = 0
+        self.window_exposed = False
+        self.snake = None
+        self.hotkeys = {}  # Key -> callback, handled in every state
+        
+        self.scenes = scenes or SceneRegistry()
+        self._register_scenes()
+        game_state.add_listener(self.scenes.on_state_change)
+        self.scenes.activate(game_state.state)
+    
+    def _register_scenes(self):
+        """Register each state's event handler and the event types it needs"""
+        menu_events = SceneRegistry.MENU_EVENTS
+        keyboard_events = SceneRegistry.KEYBOARD_EVENTS
+        handlers = {
+            "menu": (self._handle_menu_events, menu_events),
+            "level_select": (self._handle_level_select_events, menu_events),
+            "settings": (self._handle_settings_events, menu_events),
+            "high_scores": (self._handle_high_scores_events, menu_events),
+            "achievements": (self._handle_achievements_events, menu_events),
+            "countdown": (self._handle_countdown_events, keyboard_events),
+            "playing": (self._handle_playing_events, keyboard_events),
+            "paused": (self._handle_paused_events, keyboard_events),
+            "game_over": (self._handle_game_over_events, menu_events),
+        }
+        for state, (handler, allowed_events) in handlers.items():
+            self.scenes.register(state, handle_event=handler, allowed_events=allowed_events)
+    
+    def add_hotkey(self, key, callback):
+        """Run callback when key is pressed, whatever the current state"""
+        self.hotkeys[key] = callback
     
     def handle_events(self, snake=None):
         """Handle all game events"""
-        for event in pygame.event.get():
+        self.snake = snake
+        events = self.scenes.poll_events()
+        self.last_event_count = len(events)
+        for event in events:
             # Always check for QUIT first
             if event.type == pygame.QUIT:
                 return False
+            if event.type in self.EXPOSE_EVENTS:
+                self.window_exposed = True
+            if event.type == pygame.KEYDOWN and event.key in self.hotkeys:
+                self.hotkeys[event.key]()
+                continue
             
-            # Delegate to specific handlers
-            result = None
-            if self.game_state.state == "menu":
-                result = self._handle_menu_events(event)
-            elif self.game_state.state == "level_select":
-                result = self._handle_level_select_events(event)
-            elif self.game_state.state == "settings":
-                result = self._handle_settings_events(event)
-            elif self.game_state.state == "high_scores":
-                result = self._handle_high_scores_events(event)
-            elif self.game_state.state == "achievements":
-                result = self._handle_achievements_events(event)
-            elif self.game_state.state == "countdown":
-                result = self._handle_countdown_events(event)
-            elif self.game_state.state == "playing":
-                result = self._handle_playing_events(event, snake)
-            elif self.game_state.state == "paused":
-                result = self._handle_paused_events(event)
-            elif self.game_state.state == "game_over":
-                result = self._handle_game_over_events(event)
+            # Delegate to the current state's handler
+            handler = self.scenes.get(self.game_state.state).handle_event
+            result = handler(event) if handler else None
             
             # If result is False (quit command), stop processing and return False
             if result is False:
@@ -105,23 +140,22 @@ class EventHandler:
             self.game_state.set_state("menu")
         return True
     
-    def _handle_playing_events(self, event, snake):
+    def _handle_playing_events(self, event, snake=None):
         """Handle playing state events"""
+        snake = snake or self.snake
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_ESCAPE:
                 self.game_state.set_state("menu")
             elif event.key == pygame.K_SPACE:
                 self.game_state.set_state("paused")
             elif snake:
-                # Movement controls
-                if event.key == pygame.K_LEFT or event.key == pygame.K_a:
-                    snake.change_direction(-self.block_size, 0)
-                elif event.key == pygame.K_RIGHT or event.key == pygame.K_d:
-                    snake.change_direction(self.block_size, 0)
-                elif event.key == pygame.K_UP or event.key == pygame.K_w:
-                    snake.change_direction(0, -self.block_size)
-                elif event.key == pygame.K_DOWN or event.key == pygame.K_s:
-                    snake.change_direction(0, self.block_size)
+                # Movement controls are queued and applied one per snake step
+                direction = self.DIRECTION_KEYS.get(event.key)
+                if direction:
+                    dx, dy = direction
+                    if not snake.queue_direction(dx * self.block_size, dy * self.block_size,
+                                                 input_latency.now()):
+                        input_latency.turn_dropped()
         return True
     
     def _handle_paused_events(self, event):
@@ -0,0 +1,97 @@
+"""
+Sliding-window event tracking
+Timestamped events with amortised O(1) window counts and rate checks
+"""
+
+import math
+
+class SlidingWindowCounter:
+    """Timestamps of one event type, oldest first
+
+    Each tracked window keeps a pointer to its oldest event, which only moves
+    forward, so counting events in the last T seconds is amortised O(1). Each
+    tracked count N keeps the smallest span seen over N consecutive events, so
+    "N events in any T-second window" is a single comparison.
+    """
+
+    def __init__(self):
+        self._times = []
+        self._base = 0  # Absolute index of _times[0]
+        self._window_starts = {}  # window seconds -> absolute index of oldest event inside it
+        self._best_spans = {}  # event count -> smallest span covering that many events
+
+    def __len__(self):
+        return self._base + len(self._times)
+
+    def track_count(self, count):
+        """Start tracking the best span of `count` consecutive events"""
+        if count in self._best_spans:
+            return
+        best = math.inf
+        times = self._times
+        # Events recorded before tracking started are still in the buffer if a window needs them
+        for i in range(count - 1, len(times)):
+            best = min(best, times[i] - times[i - count + 1])
+        self._best_spans[count] = best
+
+    def track_window(self, seconds):
+        """Start tracking event counts over the last `seconds`"""
+        self._window_starts.setdefault(seconds, self._base)
+
+    def record(self, timestamp):
+        """Record an event; timestamps must not go backwards"""
+        times = self._times
+        times.append(timestamp)
+        total = len(times)
+        for count, best in self._best_spans.items():
+            if total >= count:
+                span = timestamp - times[total - count]
+                if span < best:
+                    self._best_spans[count] = span
+        # Advance windows here too so old events can be trimmed even if nobody queries
+        for seconds in self._window_starts:
+            self._advance(seconds, timestamp)
+        self._trim()
+
+    def _advance(self, seconds, now):
+        """Move a window's start pointer past events older than `seconds` before now"""
+        start = self._window_starts[seconds]
+        times, base = self._times, self._base
+        cutoff = now - seconds
+        end = base + len(times)
+        while start < end and times[start - base] <= cutoff:
+            start += 1
+        self._window_starts[seconds] = start
+        return end - start
+
+    def count_within(self, seconds, now):
+        """Count events in the half-open window (now - seconds, now]"""
+        if seconds not in self._window_starts:
+            self.track_window(seconds)
+        return self._advance(seconds, now)
+
+    def best_span(self, count):
+        """Get the shortest time in which `count` events happened (inf if never)"""
+        if count not in self._best_spans:
+            self.track_count(count)
+        return self._best_spans[count]
+
+    def _trim(self):
+        """Drop events no tracked window or count can still use"""
+        times = self._times
+        keep_from = len(times) - max(self._best_spans, default=1)
+        if self._window_starts:
+            keep_from = min(keep_from, min(self._window_starts.values()) - self._base)
+        # Compact in bulk so the list shift cost is amortised
+        if keep_from > 64 and keep_from * 2 > len(times):
+            del times[:keep_from]
+            self._base += keep_from
+
+    def clear(self):
+        """Forget all events but keep tracked windows and counts"""
+        self._base += len(self._times)
+        self._times = []
+        for seconds in self._window_starts:
+            self._window_starts[seconds] = self._base
+        for count in self._best_spans:
+            self._best_spans[count] = math.inf
@@ -0,0 +1,86 @@
+"""
+Adaptive frame-rate governor
+Lowers the frame rate on idle screens and sleeps until the next event when nothing changes
+"""
+
+import asyncio
+import pygame
+from .config import config
+
+class FrameGovernor:
+    """Chooses how long the main loop waits between frames"""
+
+    # States that run the simulation and always need the full frame rate
+    ACTIVE_STATES = ("playing", "countdown")
+    # Screens that only change in response to input
+    STATIC_STATES = ("paused", "game_over", "high_scores")
+    # How often a sleeping governor checks for new events
+    SLEEP_SLICE_MS = 10
+
+    def __init__(self, active_fps=60, idle_fps=10, idle_after_ms=2000, wake_interval_ms=500):
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_after_ms = idle_after_ms
+        self.wake_interval_ms = wake_interval_ms
+
+        self.last_activity = pygame.time.get_ticks()
+        self.current_state = None
+        self.sleeping = False
+        
+        self.menu_fps = config.get_fps() or active_fps
+        config.subscribe(self._on_fps_changed, "screen.fps")
+    
+    def _on_fps_changed(self, changed_paths):
+        """Pick up a new menu frame rate and show it immediately"""
+        self.menu_fps = config.get_fps() or self.active_fps
+        self.note_activity()
+
+    def note_activity(self):
+        """Record input or a state change so the loop ramps back up to full rate"""
+        self.last_activity = pygame.time.get_ticks()
+
+    def note_events(self, event_count):
+        """Record events handled this frame"""
+        if event_count:
+            self.note_activity()
+
+    def is_idle(self):
+        """Check if there has been no activity for idle_after_ms"""
+        return pygame.time.get_ticks() - self.last_activity >= self.idle_after_ms
+
+    def get_target_fps(self, state, animating=False):
+        """Get frame rate for the current state"""
+        if state in self.ACTIVE_STATES or animating:
+            return self.active_fps
+
+        if self.is_idle():
+            return min(self.idle_fps, self.menu_fps)
+        return self.menu_fps
+
+    async def wait(self, clock, state, animating=False, max_sleep_ms=None):
+        """Wait for the next frame, blocking on events while an idle static screen is shown
+
+        max_sleep_ms shortens the sleep for something that must refresh on a timer.
+        """
+        if state != self.current_state:
+            self.current_state = state
+            self.note_activity()
+
+        if state in self.STATIC_STATES and not animating and self.is_idle():
+            self.sleeping = True
+            # Sleep in short slices so the asyncio loop (and the browser) keeps running;
+            # queued events stay in place for the next poll_events, in their original order
+            sleep_ms = self.wake_interval_ms if max_sleep_ms is None else min(self.wake_interval_ms, max_sleep_ms)
+            deadline = pygame.time.get_ticks() + sleep_ms
+            while pygame.time.get_ticks() < deadline:
+                if pygame.event.peek():
+                    self.note_activity()
+                    break
+                await asyncio.sleep(self.SLEEP_SLICE_MS / 1000)
+            # Restart frame timing so the sleep is not counted as game time
+            clock.tick()
+            clock.tick()
+            self.sleeping = False
+            return
+
+        clock.tick(self.get_target_fps(state, animating))
@@ -0,0 +1,184 @@
+"""
+Per-phase frame profiler
+Records how long each part of the main loop takes into fixed-size ring buffers,
+draws an optional overlay and exports the samples for offline analysis
+"""
+
+import csv
+import os
+import time
+from array import array
+from datetime import datetime
+import pygame
+from .glyph_atlas import GlyphAtlas
+
+class FrameProfiler:
+    """Ring buffers of per-phase frame timings in nanoseconds"""
+
+    # Main loop phases in the order they run
+    PHASES = ("events", "achievements", "countdown", "update", "draw",
+              "notification", "overlay", "flip", "wait")
+
+    # Phases that are the game's own work, as opposed to waiting for the next frame
+    WORK_PHASES = PHASES[:-1]
+
+    OVERLAY_REFRESH_MS = 250
+    GRAPH_FRAMES = 120
+
+    def __init__(self, capacity=600):
+        self.capacity = capacity
+        self.samples = {phase: array('q', bytes(8 * capacity)) for phase in self.PHASES}
+        self.frames = 0  # Frames recorded since start; the newest is at (frames - 1) % capacity
+        self.overlay_visible = False
+
+        self._slot = 0
+        self._mark = None
+        self._font = None
+        self._overlay_surface = None
+        self._overlay_refreshed = 0
+
+    def begin_frame(self):
+        """Start timing a frame; phases not marked this frame count as zero"""
+        self._slot = self.frames % self.capacity
+        for buffer in self.samples.values():
+            buffer[self._slot] = 0
+        self._mark = time.perf_counter_ns()
+
+    def mark(self, phase):
+        """Attribute the time since the previous mark to phase"""
+        if self._mark is None:
+            return
+        now = time.perf_counter_ns()
+        self.samples[phase][self._slot] += now - self._mark
+        self._mark = now
+
+    def end_frame(self):
+        """Finish the current frame"""
+        if self._mark is None:
+            return
+        self.frames += 1
+        self._mark = None
+
+    def _recent(self, phase, count=None):
+        """Get up to count most recent samples of a phase, oldest first, in nanoseconds"""
+        # A frame in progress has already claimed the oldest slot
+        in_progress = 1 if self._mark is not None else 0
+        stored = min(self.frames, self.capacity - in_progress)
+        count = stored if count is None else min(count, stored)
+        buffer = self.samples[phase]
+        end = self.frames % self.capacity
+        return [buffer[(end - count + i) % self.capacity] for i in range(count)]
+
+    def _frame_totals(self, phases, count=None):
+        """Get per-frame sums of phases, oldest first, in nanoseconds"""
+        columns = [self._recent(phase, count) for phase in phases]
+        return [sum(values) for values in zip(*columns)]
+
+    @staticmethod
+    def _stats(values):
+        """Get mean, p50, p95, p99 and max in milliseconds"""
+        if not values:
+            return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+        ordered = sorted(values)
+        def pick(p):
+            return ordered[min(len(ordered) - 1, max(0, int(round(p / 100 * len(ordered))) - 1))] / 1e6
+        return {
+            "mean": round(sum(ordered) / len(ordered) / 1e6, 3),
+            "p50": round(pick(50), 3),
+            "p95": round(pick(95), 3),
+            "p99": round(pick(99), 3),
+            "max": round(ordered[-1] / 1e6, 3),
+        }
+
+    def summary(self):
+        """Get statistics per phase plus work (all but wait) and total frame time"""
+        result = {phase: self._stats(self._recent(phase)) for phase in self.PHASES}
+        result["work"] = self._stats(self._frame_totals(self.WORK_PHASES))
+        result["total"] = self._stats(self._frame_totals(self.PHASES))
+        return result
+
+    def toggle_overlay(self):
+        """Show or hide the on-screen overlay"""
+        self.overlay_visible = not self.overlay_visible
+        self._overlay_surface = None
+
+    def export(self, path=None):
+        """Write recorded frames as CSV (one row per frame, times in ms); returns the path"""
+        if path is None:
+            path = datetime.now().strftime("frame_profile_%Y%m%d_%H%M%S.csv")
+        columns = [self._recent(phase) for phase in self.PHASES]
+        first_frame = self.frames - len(columns[0])
+        try:
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(("frame",) + self.PHASES + ("work", "total"))
+                for index, values in enumerate(zip(*columns)):
+                    work = sum(values[:-1])
+                    writer.writerow([first_frame + index] + [f"{value / 1e6:.3f}" for value in values]
+                                    + [f"{work / 1e6:.3f}", f"{(work + values[-1]) / 1e6:.3f}"])
+        except (IOError, OSError):
+            return None
+        return os.path.abspath(path)
+
+    def overlay_due(self):
+        """Check if the visible overlay is waiting for its next refresh"""
+        if not self.overlay_visible:
+            return False
+        return (self._overlay_surface is None
+                or pygame.time.get_ticks() - self._overlay_refreshed >= self.OVERLAY_REFRESH_MS)
+
+    def draw_overlay(self, surface):
+        """Draw phase averages, percentiles and a frame-time graph in the top-left corner"""
+        if not self.overlay_visible:
+            return
+        try:
+            now = pygame.time.get_ticks()
+            if self._overlay_surface is None or now - self._overlay_refreshed >= self.OVERLAY_REFRESH_MS:
+                self._overlay_surface = self._render_overlay()
+                self._overlay_refreshed = now
+            surface.blit(self._overlay_surface, (8, 8))
+        except (pygame.error, AttributeError, ValueError):
+            pass
+
+    def _render_overlay(self):
+        """Render the overlay panel"""
+        if self._font is None:
+            self._font = pygame.font.Font(None, 20)
+        atlas = GlyphAtlas.for_font(self._font, (230, 230, 230))
+        line_height = atlas.height + 2
+        summary = self.summary()
+        rows = ("total", "work") + self.PHASES
+
+        graph_height = 60
+        width = 300
+        height = 10 + line_height * (len(rows) + 1) + graph_height + 10
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 180))
+
+        y = 6
+        panel.blit(atlas.render("phase        avg    p95    p99  ms"), (8, y))
+        y += line_height
+        for name in rows:
+            stats = summary[name]
+            text = f"{name:<12} {stats['mean']:>5.2f}  {stats['p95']:>5.2f}  {stats['p99']:>5.2f}"
+            panel.blit(atlas.render(text), (8, y))
+            y += line_height
+
+        # Frame-time graph: total frame time (dim) with the work part on top (bright)
+        graph_top = y + 4
+        graph_bottom = graph_top + graph_height
+        scale_ms = 50.0
+        totals = self._frame_totals(self.PHASES, self.GRAPH_FRAMES)
+        works = self._frame_totals(self.WORK_PHASES, self.GRAPH_FRAMES)
+        bar_width = max(1, (width - 16) // self.GRAPH_FRAMES)
+        for index, (total, work) in enumerate(zip(totals, works)):
+            x = 8 + index * bar_width
+            total_height = min(graph_height, int(total / 1e6 / scale_ms * graph_height))
+            work_height = min(graph_height, int(work / 1e6 / scale_ms * graph_height))
+            pygame.draw.rect(panel, (70, 90, 140), (x, graph_bottom - total_height, bar_width, total_height))
+            color = (90, 220, 90) if work / 1e6 < 16.7 else (230, 200, 60) if work / 1e6 < 33.3 else (230, 70, 70)
+            pygame.draw.rect(panel, color, (x, graph_bottom - work_height, bar_width, work_height))
+        for budget_ms in (16.7, 33.3):
+            line_y = graph_bottom - int(budget_ms / scale_ms * graph_height)
+            pygame.draw.line(panel, (200, 200, 200, 120), (8, line_y), (width - 8, line_y))
+        return panel
@@ -0,0 +1,257 @@
+"""
+Per-game history log
+Appends one compact JSON line per finished game to a rotating log, and streams
+the logs back for analytics without loading them into memory
+
+Usage:
+    python -m components.core.game_history [--log game_history.jsonl] [--bucket 10]
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from datetime import datetime
+
+HISTORY_FILE = "game_history.jsonl"
+
+class GameHistoryLog:
+    """Append-only JSON-lines log rotated by size, written on a background thread"""
+
+    def __init__(self, path=HISTORY_FILE, max_bytes=1024 * 1024, backup_count=5, max_queued=1000):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        # Bounded so a stuck disk cannot grow memory; records are dropped when full
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def append(self, record):
+        """Queue a record for writing; never blocks the caller"""
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False) + "\n"
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            return False
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="game-history", daemon=True)
+            self._thread.start()
+        return True
+
+    def _run(self):
+        """Writer thread: drain queued lines into the log"""
+        while True:
+            line = self._queue.get()
+            if line is None:
+                return
+            lines = [line]
+            # Write whatever else is already queued in the same open/close
+            while True:
+                try:
+                    line = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if line is None:
+                    self._write(lines)
+                    return
+                lines.append(line)
+            self._write(lines)
+
+    def _write(self, lines):
+        """Append lines, rotating the log first if it is full"""
+        try:
+            with self._lock:
+                self._rotate_if_needed()
+                with open(self.path, 'a', encoding='utf-8') as f:
+                    f.writelines(lines)
+        except (IOError, OSError):
+            pass
+
+    def _rotate_if_needed(self):
+        """Shift game_history.jsonl -> .1 -> .2 ... when it reaches max_bytes"""
+        try:
+            if os.path.getsize(self.path) < self.max_bytes:
+                return
+        except OSError:
+            return
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count > 0:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+    def close(self):
+        """Write all queued records and stop the writer thread, waiting a few seconds at most"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._thread = None
+        try:
+            self._queue.put(None, timeout=1.0)
+        except queue.Full:
+            # The writer is stuck; give up on the queued records as append() does when full
+            return
+        thread.join(timeout=2.0)
+
+def build_game_record(game_stats, level, score):
+    """Build the history record for a finished game from its GameStats"""
+    return {
+        "ended_at": round(time.time(), 3),
+        "level": level,
+        "score": score,
+        "duration": round(game_stats.survival_time, 2),
+        "food": {
+            "normal": game_stats.normal_food_eaten,
+            "special": game_stats.special_food_eaten,
+            "bad": game_stats.bad_food_eaten,
+        },
+        "powerups": game_stats.powerups_collected_this_game,
+        "deaths": game_stats.deaths_this_game,
+        "cause": game_stats.last_death_cause,
+    }
+
+def log_files(path=HISTORY_FILE):
+    """Get existing log files, oldest first"""
+    backups = []
+    index = 1
+    while os.path.exists(f"{path}.{index}"):
+        backups.append(f"{path}.{index}")
+        index += 1
+    files = list(reversed(backups))
+    if os.path.exists(path):
+        files.append(path)
+    return files
+
+def iter_records(paths):
+    """Stream records from log files one line at a time, skipping damaged lines"""
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict):
+                        yield record
+        except (IOError, OSError, UnicodeDecodeError):
+            continue
+
+class StreamingHistogram:
+    """Fixed-width bucket counts; memory depends on the value range, not the sample count"""
+
+    def __init__(self, bucket_width=10):
+        self.bucket_width = bucket_width
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value):
+        """Count one value"""
+        bucket = int(value // self.bucket_width)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self):
+        """Mean of all added values"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Get the lower bound of the bucket holding the p-th percentile"""
+        if not self.count:
+            return 0
+        target = max(1, int(round(p / 100 * self.count)))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                return bucket * self.bucket_width
+        return max(self.buckets) * self.bucket_width
+
+def summarize(records, bucket_width=10):
+    """Aggregate a stream of records in a single pass"""
+    scores = StreamingHistogram(bucket_width)
+    durations = StreamingHistogram(1)
+    per_level = {}
+    per_day = {}
+    causes = {}
+
+    for record in records:
+        try:
+            score = float(record["score"])
+            level = int(record["level"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        scores.add(score)
+        if isinstance(record.get("duration"), (int, float)):
+            durations.add(record["duration"])
+        per_level.setdefault(level, StreamingHistogram(bucket_width)).add(score)
+        cause = record.get("cause") or "unknown"
+        causes[cause] = causes.get(cause, 0) + 1
+        if isinstance(record.get("ended_at"), (int, float)):
+            day = datetime.fromtimestamp(record["ended_at"]).strftime("%Y-%m-%d")
+            per_day.setdefault(day, StreamingHistogram(bucket_width)).add(score)
+
+    return {"scores": scores, "durations": durations, "per_level": per_level,
+            "per_day": per_day, "causes": causes}
+
+def print_summary(summary, out=None):
+    """Print a text report of a summarize() result"""
+    write = (out or sys.stdout).write
+    scores, durations = summary["scores"], summary["durations"]
+
+    write(f"Games: {scores.count}\n")
+    if not scores.count:
+        return
+    write(f"Score  mean {scores.mean:.1f}  p50 {scores.percentile(50):g}  "
+          f"p90 {scores.percentile(90):g}  p99 {scores.percentile(99):g}\n")
+    write(f"Length mean {durations.mean:.1f}s  p50 {durations.percentile(50):g}s  "
+          f"p90 {durations.percentile(90):g}s\n")
+
+    write("\nScore histogram per level:\n")
+    for level in sorted(summary["per_level"]):
+        histogram = summary["per_level"][level]
+        write(f"  Level {level}: {histogram.count} games, mean {histogram.mean:.1f}, "
+              f"p50 {histogram.percentile(50):g}\n")
+        peak = max(histogram.buckets.values())
+        for bucket in sorted(histogram.buckets):
+            low = bucket * histogram.bucket_width
+            bar = "#" * max(1, int(40 * histogram.buckets[bucket] / peak))
+            write(f"    {low:>7g}-{low + histogram.bucket_width:<7g} {bar} {histogram.buckets[bucket]}\n")
+
+    write("\nDaily trend:\n")
+    for day in sorted(summary["per_day"]):
+        histogram = summary["per_day"][day]
+        write(f"  {day}: {histogram.count} games, mean score {histogram.mean:.1f}\n")
+
+    write("\nCauses of death:\n")
+    for cause, count in sorted(summary["causes"].items(), key=lambda item: -item[1]):
+        write(f"  {cause}: {count}\n")
+
+def main(argv=None):
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description="Summarize per-game history logs")
+    parser.add_argument("files", nargs="*", help="log files to read (default: the rotated game history)")
+    parser.add_argument("--log", default=HISTORY_FILE, help="base log path used when no files are given")
+    parser.add_argument("--bucket", type=float, default=10, help="score histogram bucket width")
+    args = parser.parse_args(argv)
+
+    paths = args.files or log_files(args.log)
+    print_summary(summarize(iter_records(paths), args.bucket))
+    return 0
+
+# Global history log instance
+game_history = GameHistoryLog()
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ Game rendering system
 
 import pygame
 from .config import config
+from .glyph_atlas import GlyphAtlas
 
 class GameRenderer:
     """Handles all game rendering"""
@@ -26,6 +27,19 @@ class GameRenderer:
         
         # Cache for countdown fonts to avoid recreation
         self._countdown_font_cache = {}
+        
+        # HUD line cache: line key -> ((text, color), surface)
+        self._hud_line_cache = {}
+        
+        # Last game frame with the pause overlay baked in
+        self._pause_frame = None
+        
+        config.subscribe(self._on_colors_changed, "colors")
+    
+    def _on_colors_changed(self, changed_paths):
+        """Drop cached renderings that depend on config colors"""
+        self._hud_line_cache.clear()
+        self._pause_frame = None
     
     def draw_text(self, text, font, color, x, y, center=True):
         """Draw text on screen"""
@@ -42,7 +56,8 @@ class GameRenderer:
     
     def draw_countdown(self, countdown_timer, countdown_duration):
         """Draw countdown screen"""
-        self.screen.fill(config.get_color('background'))
+        colors = config.snapshot.colors
+        self.screen.fill(colors.background)
         
         # Countdown text
         remaining_time = countdown_duration - countdown_timer
@@ -68,52 +83,82 @@ class GameRenderer:
                     del self._countdown_font_cache[oldest_key]
             
             font = self._countdown_font_cache[font_size]
-            text_surface = font.render(count_text, True, config.get_color('text_highlight'))
+            text_surface = font.render(count_text, True, colors.text_highlight)
             text_rect = text_surface.get_rect(center=(self.screen_width // 2, self.screen_height // 2))
             self.screen.blit(text_surface, text_rect)
         except Exception:
             pass
-            self.draw_text(count_text, self.font_large, config.get_color('text_highlight'),
+            self.draw_text(count_text, self.font_large, colors.text_highlight,
                           self.screen_width // 2, self.screen_height // 2)
         
         # Instructions
-        self.draw_text("Get Ready!", self.font_medium, config.get_color('text'),
+        self.draw_text("Get Ready!", self.font_medium, colors.text,
                       self.screen_width // 2, self.screen_height // 2 + 100)
-        self.draw_text("Press ESC to cancel", self.font_small, config.get_color('text'),
+        self.draw_text("Press ESC to cancel", self.font_small, colors.text,
                       self.screen_width // 2, self.screen_height // 2 + 150)
     
     def draw_pause(self):
         """Draw pause screen"""
+        colors = config.snapshot.colors
+        
         # Semi-transparent overlay
         overlay = pygame.Surface((self.screen_width, self.screen_height))
         overlay.set_alpha(128)
-        overlay.fill(config.get_color('background'))
+        overlay.fill(colors.background)
         self.screen.blit(overlay, (0, 0))
         
         # Pause text
-        self.draw_text("PAUSED", self.font_large, config.get_color('text_highlight'),
+        self.draw_text("PAUSED", self.font_large, colors.text_highlight,
                       self.screen_width // 2, self.screen_height // 2 - 50)
-        self.draw_text("Press SPACE to continue", self.font_medium, config.get_color('text'),
+        self.draw_text("Press SPACE to continue", self.font_medium, colors.text,
                       self.screen_width // 2, self.screen_height // 2 + 20)
-        self.draw_text("Press ESC for main menu", self.font_medium, config.get_color('text'),
+        self.draw_text("Press ESC for main menu", self.font_medium, colors.text,
                       self.screen_width // 2, self.screen_height // 2 + 60)
     
+    def _draw_hud_line(self, key, text, font, color, x, y):
+        """Draw HUD line, re-rendering it from the glyph atlas only when its text changes"""
+        try:
+            cached = self._hud_line_cache.get(key)
+            if cached is None or cached[0] != (text, color):
+                surface = GlyphAtlas.for_font(font, color).render(text)
+                cached = ((text, color), surface)
+                self._hud_line_cache[key] = cached
+            self.screen.blit(cached[1], (x, y))
+        except (pygame.error, AttributeError, ValueError):
+            pass
+    
+    def invalidate_pause_frame(self):
+        """Force the pause composite to be rebuilt on next draw"""
+        self._pause_frame = None
+    
+    def draw_paused(self, game_objects, game_state):
+        """Draw paused game from a cached composite of the last frame and overlay"""
+        if self._pause_frame is None:
+            self.draw_game(game_objects, game_state)
+            self.draw_pause()
+            self._pause_frame = self.screen.copy()
+        else:
+            self.screen.blit(self._pause_frame, (0, 0))
+    
     def draw_hud(self, score, level, lives, snake_move_interval, active_powerups, powerup_timers, game_area):
         """Draw heads-up display"""
         sidebar_x = game_area['x'] + game_area['width'] + 20
+        colors = config.snapshot.colors
+        text_color = colors.text
+        highlight_color = colors.text_highlight
         
         # Score
-        self.draw_text(f"Score: {score:06d}", self.font_medium, config.get_color('text'),
-                      sidebar_x, 80, False)
+        self._draw_hud_line("score", f"Score: {score:06d}", self.font_medium, text_color,
+                            sidebar_x, 80)
         
         # Level
-        self.draw_text(f"Level: {level}", self.font_medium, config.get_color('text'),
-                      sidebar_x, 120, False)
+        self._draw_hud_line("level", f"Level: {level}", self.font_medium, text_color,
+                            sidebar_x, 120)
         
         # Lives
         lives_text = "♥" * lives
-        self.draw_text(f"Lives: {lives_text}", self.font_medium, config.get_color('text'),
-                      sidebar_x, 160, False)
+        self._draw_hud_line("lives", f"Lives: {lives_text}", self.font_medium, text_color,
+                            sidebar_x, 160)
         
         # Speed with error handling
         try:
@@ -122,33 +167,35 @@ class GameRenderer:
         except (ZeroDivisionError, TypeError):
             speed_text = "Speed: 0.0/sec"
         
-        self.draw_text(speed_text, self.font_small, config.get_color('text'),
-                      sidebar_x, 200, False)
+        self._draw_hud_line("speed", speed_text, self.font_small, text_color,
+                            sidebar_x, 200)
         
         # Power-ups
         if active_powerups:
-            self.draw_text("Power-ups:", self.font_small, config.get_color('text_highlight'),
-                          sidebar_x, 240, False)
+            self._draw_hud_line("powerups", "Power-ups:", self.font_small, highlight_color,
+                                sidebar_x, 240)
             y_offset = 260
             for k, v in powerup_timers.items():
-                self.draw_text(f"{k}: {int(v/1000)}s", self.font_small, config.get_color('text'),
-                              sidebar_x, y_offset, False)
+                self._draw_hud_line(("powerup", k), f"{k}: {int(v/1000)}s", self.font_small, text_color,
+                                    sidebar_x, y_offset)
                 y_offset += 20
         
         # Instructions
-        self.draw_text("Controls:", self.font_small, config.get_color('text_highlight'),
-                      sidebar_x, 350, False)
-        self.draw_text("WASD/Arrows: Move", self.font_small, config.get_color('text'),
-                      sidebar_x, 370, False)
-        self.draw_text("SPACE: Pause", self.font_small, config.get_color('text'),
-                      sidebar_x, 390, False)
-        self.draw_text("ESC: Menu", self.font_small, config.get_color('text'),
-                      sidebar_x, 410, False)
+        self._draw_hud_line("controls", "Controls:", self.font_small, highlight_color,
+                            sidebar_x, 350)
+        self._draw_hud_line("controls_move", "WASD/Arrows: Move", self.font_small, text_color,
+                            sidebar_x, 370)
+        self._draw_hud_line("controls_pause", "SPACE: Pause", self.font_small, text_color,
+                            sidebar_x, 390)
+        self._draw_hud_line("controls_menu", "ESC: Menu", self.font_small, text_color,
+                            sidebar_x, 410)
     
     def draw_game(self, game_objects, game_state):
         """Draw game elements"""
+        colors = config.snapshot.colors
+        
         # Clear screen with a dark gradient background
-        self.screen.fill(config.get_color('background'))
+        self.screen.fill(colors.background)
         
         # Draw colored background around game area
         background_color = (20, 20, 40)  # Dark blue/purple
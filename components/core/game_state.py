@@ -29,10 +29,21 @@ class GameState:
         self.player2_score = 0
         self.player1_lives = 3
         self.player2_lives = 3
+        
+        # Called as listener(old_state, new_state) on every transition
+        self.listeners = []
+    
+    def add_listener(self, listener):
+        """Register a callback for state transitions"""
+        self.listeners.append(listener)
     
     def set_state(self, new_state):
         """Change game state"""
+        old_state = self.state
         self.state = new_state
+        if new_state != old_state:
+            for listener in self.listeners:
+                listener(old_state, new_state)
     
     def is_playing(self):
         """Check if currently playing"""
@@ -0,0 +1,71 @@
+"""
+Glyph atlas for fast text assembly
+Renders each character once per font and colour, then builds strings by blitting glyphs
+"""
+
+import pygame
+
+class GlyphAtlas:
+    """Pre-rendered glyphs for one font and colour"""
+
+    # Digits and characters that appear in frequently changing HUD strings
+    PRELOAD_CHARS = "0123456789 :./-+x%s"
+
+    _atlas_cache = {}
+
+    def __init__(self, font, color):
+        self.font = font
+        self.color = tuple(color)
+        self.height = font.get_height()
+        self._glyphs = {}
+
+        for char in self.PRELOAD_CHARS:
+            self._get_glyph(char)
+
+    @classmethod
+    def for_font(cls, font, color):
+        """Get cached atlas for a font and colour"""
+        key = (font, tuple(color))
+        atlas = cls._atlas_cache.get(key)
+        if atlas is None:
+            atlas = cls(font, color)
+            cls._atlas_cache[key] = atlas
+        return atlas
+
+    def _get_glyph(self, char):
+        """Get (surface, advance) for a character, rendering it on first use"""
+        glyph = self._glyphs.get(char)
+        if glyph is None:
+            surface = self.font.render(char, True, self.color)
+            advance = surface.get_width()
+            try:
+                metrics = self.font.metrics(char)
+                if metrics and metrics[0]:
+                    advance = metrics[0][4]
+            except (pygame.error, TypeError, IndexError):
+                pass
+            glyph = (surface, advance)
+            self._glyphs[char] = glyph
+        return glyph
+
+    def get_width(self, text):
+        """Get pixel width of text assembled from glyphs"""
+        return sum(self._get_glyph(char)[1] for char in text)
+
+    def render(self, text):
+        """Assemble text into a new transparent surface"""
+        glyphs = [self._get_glyph(char) for char in text]
+        width = sum(advance for _, advance in glyphs)
+        # Last glyph may overhang its advance
+        if glyphs:
+            width += max(0, glyphs[-1][0].get_width() - glyphs[-1][1])
+
+        surface = pygame.Surface((max(1, width), self.height), pygame.SRCALPHA)
+        blit_sequence = []
+        x = 0
+        for glyph_surface, advance in glyphs:
+            # MAX blend copies glyph pixels onto the transparent surface without darkening edges
+            blit_sequence.append((glyph_surface, (x, 0), None, pygame.BLEND_RGBA_MAX))
+            x += advance
+        surface.blits(blit_sequence, doreturn=False)
+        return surface
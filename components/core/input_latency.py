@@ -0,0 +1,76 @@
+"""
+Input latency instrumentation
+Measures time from a direction key being handled to the flip of the first frame showing the turn
+"""
+
+import time
+from collections import deque
+
+class InputLatencyTracker:
+    """Collects key-to-photon style latency samples for snake turns
+
+    Timestamps are taken when the key event is pulled from the event queue, since
+    pygame does not expose SDL's own event timestamps; time the event spent waiting
+    in the queue before that (at most one frame) is not included.
+    """
+
+    def __init__(self, max_samples=1000):
+        self.samples = deque(maxlen=max_samples)  # Key handled -> frame flipped, in ms
+        self.queue_waits = deque(maxlen=max_samples)  # Key handled -> turn applied by move(), in ms
+        self.dropped = 0
+        self._applied = []
+
+    @staticmethod
+    def now():
+        """Get a timestamp for a key event"""
+        return time.perf_counter()
+
+    def turn_applied(self, input_time):
+        """Record that a queued turn was applied by the snake's move this frame"""
+        self._applied.append(input_time)
+        self.queue_waits.append((self.now() - input_time) * 1000)
+
+    def turn_dropped(self):
+        """Record a key press discarded because the turn queue was full or the turn was invalid"""
+        self.dropped += 1
+
+    def frame_presented(self):
+        """Close samples for turns shown by the frame that was just flipped"""
+        if not self._applied:
+            return
+        presented = self.now()
+        for input_time in self._applied:
+            self.samples.append((presented - input_time) * 1000)
+        self._applied.clear()
+
+    def reset(self):
+        """Forget all samples"""
+        self.samples.clear()
+        self.queue_waits.clear()
+        self.dropped = 0
+        self._applied.clear()
+
+    @staticmethod
+    def _percentile(values, p):
+        """Nearest-rank percentile of an already sorted list"""
+        if not values:
+            return 0.0
+        index = min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))
+        return values[index]
+
+    def summary(self):
+        """Get latency statistics in milliseconds"""
+        latencies = sorted(self.samples)
+        waits = sorted(self.queue_waits)
+        return {
+            "turns": len(latencies),
+            "dropped": self.dropped,
+            "p50": round(self._percentile(latencies, 50), 1),
+            "p95": round(self._percentile(latencies, 95), 1),
+            "p99": round(self._percentile(latencies, 99), 1),
+            "max": round(latencies[-1], 1) if latencies else 0.0,
+            "queue_wait_p50": round(self._percentile(waits, 50), 1),
+        }
+
+# Global input latency tracker
+input_latency = InputLatencyTracker()
@@ -0,0 +1,213 @@
+"""
+Leaderboard storage
+Keeps the full score history in SQLite with cached top-N lists for the menus
+"""
+
+import json
+import os
+import sqlite3
+import time
+
+class Leaderboard:
+    """SQLite-backed score history with per-level and all-time rankings"""
+
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS scores (
+            id INTEGER PRIMARY KEY,
+            score INTEGER NOT NULL,
+            level INTEGER NOT NULL,
+            player TEXT NOT NULL DEFAULT '',
+            played_at REAL NOT NULL
+        )""",
+        "CREATE INDEX IF NOT EXISTS idx_scores_level_score ON scores (level, score DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_scores_score ON scores (score DESC)",
+        "CREATE INDEX IF NOT EXISTS idx_scores_player_score ON scores (player, score DESC)",
+    )
+
+    def __init__(self, db_file="high_scores.db", legacy_file="high_scores.json", top_n=10):
+        self.db_file = db_file
+        self.legacy_file = legacy_file
+        self.top_n = top_n
+        self._connection = None
+
+        # level (None = all levels) -> top_n rows, best first; kept current on add_score
+        self._top_cache = {}
+        self._total_count = None
+
+        # Bumped whenever scores change so menus know to refresh rows they hold
+        self.version = 0
+
+    def _connect(self):
+        """Open the database on first use"""
+        if self._connection is not None:
+            return self._connection
+
+        connection = sqlite3.connect(self.db_file)
+        try:
+            # WAL lets readers work while a score is being written; NORMAL sync is safe with WAL
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        except sqlite3.DatabaseError:
+            pass
+        for statement in self.SCHEMA:
+            connection.execute(statement)
+        connection.commit()
+        self._connection = connection
+        self._import_legacy_scores()
+        return connection
+
+    def _import_legacy_scores(self):
+        """Copy scores from the old high_scores.json into an empty database"""
+        if not self.legacy_file or not os.path.exists(self.legacy_file):
+            return
+        connection = self._connection
+        if connection.execute("SELECT 1 FROM scores LIMIT 1").fetchone():
+            return
+
+        try:
+            with open(self.legacy_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (json.JSONDecodeError, IOError, UnicodeDecodeError):
+            return
+
+        rows = []
+        for entry in entries if isinstance(entries, list) else []:
+            try:
+                rows.append((int(entry["score"]), int(entry["level"]), "", 0.0))
+            except (KeyError, TypeError, ValueError):
+                continue
+        if rows:
+            connection.executemany(
+                "INSERT INTO scores (score, level, player, played_at) VALUES (?, ?, ?, ?)", rows
+            )
+            connection.commit()
+
+    @staticmethod
+    def _row_to_entry(row):
+        """Convert a database row to the score dict the menus use"""
+        return {"score": row[0], "level": row[1], "player": row[2], "played_at": row[3]}
+
+    def add_score(self, score, level, player=""):
+        """Record a finished game; returns False if it could not be stored
+
+        The game's rank is not computed here (it is a range scan that grows with the
+        history); call rank_of() when something displays it.
+        """
+        played_at = time.time()
+        try:
+            connection = self._connect()
+            connection.execute(
+                "INSERT INTO scores (score, level, player, played_at) VALUES (?, ?, ?, ?)",
+                (int(score), int(level), player, played_at)
+            )
+            connection.commit()
+        except sqlite3.Error:
+            return False
+
+        # Update cached rankings in place instead of re-querying
+        entry = {"score": int(score), "level": int(level), "player": player, "played_at": played_at}
+        for cached_level, rows in self._top_cache.items():
+            if cached_level is None or cached_level == entry["level"]:
+                self._insert_cached(rows, entry)
+        if self._total_count is not None:
+            self._total_count += 1
+        self.version += 1
+        return True
+
+    def _insert_cached(self, rows, entry):
+        """Insert an entry into a cached best-first list, keeping only top_n"""
+        if len(rows) >= self.top_n and entry["score"] <= rows[-1]["score"]:
+            return
+        # Ties go after existing rows, matching the ORDER BY score DESC, id ASC queries
+        index = len(rows)
+        while index > 0 and rows[index - 1]["score"] < entry["score"]:
+            index -= 1
+        rows.insert(index, entry)
+        del rows[self.top_n:]
+
+    def top_scores(self, limit=None, level=None, offset=0):
+        """Get best scores, best first, optionally for one level and paginated"""
+        limit = self.top_n if limit is None else limit
+
+        if offset == 0 and limit <= self.top_n:
+            rows = self._top_cache.get(level)
+            if rows is None:
+                rows = self._top_cache[level] = self._query_top(self.top_n, level, 0)
+            return rows[:limit]
+
+        return self._query_top(limit, level, offset)
+
+    def _query_top(self, limit, level, offset):
+        """Run a top-N query using the score indexes"""
+        try:
+            connection = self._connect()
+            if level is None:
+                cursor = connection.execute(
+                    "SELECT score, level, player, played_at FROM scores "
+                    "ORDER BY score DESC, id ASC LIMIT ? OFFSET ?", (limit, offset)
+                )
+            else:
+                cursor = connection.execute(
+                    "SELECT score, level, player, played_at FROM scores WHERE level = ? "
+                    "ORDER BY score DESC, id ASC LIMIT ? OFFSET ?", (level, limit, offset)
+                )
+            return [self._row_to_entry(row) for row in cursor]
+        except sqlite3.Error:
+            return []
+
+    def personal_best(self, player="", level=None):
+        """Get a player's best score, or 0 if they have none"""
+        try:
+            connection = self._connect()
+            if level is None:
+                row = connection.execute(
+                    "SELECT MAX(score) FROM scores WHERE player = ?", (player,)
+                ).fetchone()
+            else:
+                row = connection.execute(
+                    "SELECT MAX(score) FROM scores WHERE player = ? AND level = ?", (player, level)
+                ).fetchone()
+        except sqlite3.Error:
+            return 0
+        return row[0] or 0
+
+    def rank_of(self, score, level=None):
+        """Get the rank a score holds (1 = best)"""
+        try:
+            connection = self._connect()
+            if level is None:
+                row = connection.execute("SELECT COUNT(*) FROM scores WHERE score > ?", (score,)).fetchone()
+            else:
+                row = connection.execute(
+                    "SELECT COUNT(*) FROM scores WHERE level = ? AND score > ?", (level, score)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] + 1
+
+    def count(self, level=None):
+        """Get the number of recorded games"""
+        if level is None and self._total_count is not None:
+            return self._total_count
+        try:
+            connection = self._connect()
+            if level is None:
+                row = connection.execute("SELECT COUNT(*) FROM scores").fetchone()
+                self._total_count = row[0]
+            else:
+                row = connection.execute("SELECT COUNT(*) FROM scores WHERE level = ?", (level,)).fetchone()
+        except sqlite3.Error:
+            return 0
+        return row[0]
+
+    def close(self):
+        """Close the database connection"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._top_cache.clear()
+        self._total_count = None
+        self.version += 1
+
+# Global leaderboard instance; the database is opened on first use
+leaderboard = Leaderboard()
@@ -0,0 +1,142 @@
+"""
+Persistence helpers
+Atomic JSON writes and a debounced writer that saves files on a background thread
+"""
+
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+
+def _read_umask():
+    """Get the process umask (read once at import, before any writer threads exist)"""
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+_UMASK = _read_umask()
+
+def _file_mode(path):
+    """Get the permission bits a rewrite of path should keep
+
+    An existing file keeps its mode; a new one gets the mode open() would give it.
+    """
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+def atomic_write_json(path, data, indent=4):
+    """Write JSON through a temp file in the same directory and swap it into place
+
+    mkstemp creates the temp file owner-only, so it is given the target's mode first.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    mode = _file_mode(path)
+    fd, temp_path = tempfile.mkstemp(prefix=".tmp-", suffix=".json", dir=directory)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(temp_path, mode)
+        except OSError:
+            pass  # Keep the write even where modes cannot be set
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+class DebouncedWriter:
+    """Coalesces repeated saves of one file into a single background write
+
+    schedule() takes an already serializable copy of the data, so the caller's
+    objects can keep changing while the write is pending.
+    """
+
+    def __init__(self, path, delay=0.5, indent=4, lock=None, on_written=None):
+        self.path = path
+        self.delay = delay
+        self.indent = indent
+        self.on_written = on_written
+
+        # Held while the file is written so other file users can coordinate with the writer
+        self.lock = lock or threading.Lock()
+
+        self._condition = threading.Condition()
+        self._pending = None
+        self._has_pending = False
+        # schedule() numbers each version; a write older than the last one written is dropped
+        self._generation = 0
+        self._written_generation = 0
+        self._deadline = 0.0
+        self._closed = False
+        self._thread = None
+
+    def schedule(self, data):
+        """Queue data to be written after the debounce window; newer data replaces older"""
+        with self._condition:
+            if self._closed:
+                return
+            self._pending = data
+            self._has_pending = True
+            self._generation += 1
+            self._deadline = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="debounced-writer", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def _run(self):
+        """Writer thread: wait until the data stops changing, then write it"""
+        while True:
+            with self._condition:
+                while not self._has_pending and not self._closed:
+                    self._condition.wait()
+                if not self._has_pending:
+                    return
+                remaining = self._deadline - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._condition.wait(remaining)
+                    continue
+                data, self._pending, self._has_pending = self._pending, None, False
+                generation = self._generation
+            self._write(data, generation)
+
+    def _write(self, data, generation):
+        """Write data to disk unless newer data is already there, keeping the previous file on failure"""
+        try:
+            with self.lock:
+                if generation <= self._written_generation:
+                    return
+                atomic_write_json(self.path, data, self.indent)
+                self._written_generation = generation
+                if self.on_written:
+                    self.on_written()
+        except (IOError, OSError, TypeError, ValueError):
+            pass
+
+    def flush(self):
+        """Write pending data now on the calling thread"""
+        with self._condition:
+            if not self._has_pending:
+                return
+            data, self._pending, self._has_pending = self._pending, None, False
+            generation = self._generation
+        self._write(data, generation)
+
+    def close(self):
+        """Flush pending data and stop the writer thread"""
+        self.flush()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=2.0)
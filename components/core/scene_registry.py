@@ -0,0 +1,106 @@
+"""
+Scene registry
+Maps each game state to its event handler, draw function and accepted event types
+"""
+
+import pygame
+
+def _event_types(*names):
+    """Get event type constants by name, skipping ones this pygame build lacks"""
+    return tuple(getattr(pygame, name) for name in names if hasattr(pygame, name))
+
+class Scene:
+    """Handler, renderer and event filter for one game state"""
+
+    def __init__(self, name, handle_event=None, draw=None, allowed_events=None):
+        self.name = name
+        self.handle_event = handle_event
+        self.draw = draw
+        self.allowed_events = tuple(allowed_events) if allowed_events is not None else None
+
+class SceneRegistry:
+    """Dispatches per state and keeps pygame's event filter in sync with the active state"""
+
+    # Never filtered: quitting, window management and custom events
+    ALWAYS_ALLOWED = _event_types(
+        "QUIT", "VIDEOEXPOSE", "VIDEORESIZE", "ACTIVEEVENT", "WINDOWEXPOSED",
+        "WINDOWFOCUSGAINED", "WINDOWFOCUSLOST", "WINDOWRESTORED", "WINDOWSHOWN",
+        "WINDOWSIZECHANGED", "WINDOWCLOSE", "USEREVENT"
+    )
+
+    # Common event sets for scenes. Key and button releases (KEYUP, MOUSEBUTTONUP) are
+    # left out on purpose: no handler reads them and nothing polls key state, so
+    # blocking them only saves queue traffic. Add them here if a scene starts to need them.
+    KEYBOARD_EVENTS = _event_types("KEYDOWN")
+    MENU_EVENTS = _event_types("KEYDOWN", "MOUSEMOTION", "MOUSEBUTTONDOWN", "MOUSEWHEEL")
+
+    def __init__(self):
+        self.scenes = {}
+        self.active = None
+        self._fallback = Scene(None)
+
+    def register(self, name, handle_event=None, draw=None, allowed_events=None):
+        """Add a scene or fill in parts of an existing one"""
+        scene = self.scenes.get(name)
+        if scene is None:
+            scene = self.scenes[name] = Scene(name)
+        if handle_event is not None:
+            scene.handle_event = handle_event
+        if draw is not None:
+            scene.draw = draw
+        if allowed_events is not None:
+            scene.allowed_events = tuple(allowed_events)
+            if name == self.active:
+                self._apply_event_filter(scene.allowed_events)
+        return scene
+
+    def get(self, name):
+        """Get the scene for a state (an empty scene if none is registered)"""
+        return self.scenes.get(name, self._fallback)
+
+    def activate(self, name):
+        """Switch the active scene and restrict pygame to the event types it uses"""
+        if name == self.active:
+            return
+        self.active = name
+        self._apply_event_filter(self.get(name).allowed_events)
+
+    def on_state_change(self, old_state, new_state):
+        """GameState listener that activates the new state's scene"""
+        self.activate(new_state)
+
+    def _apply_event_filter(self, allowed_events):
+        """Block every event type the scene does not use so SDL never queues it"""
+        try:
+            if allowed_events is None:
+                pygame.event.set_allowed(None)
+                return
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(self.ALWAYS_ALLOWED) + list(allowed_events))
+        except pygame.error:
+            pass
+
+    def poll_events(self):
+        """Get queued events with each frame's mouse motion collapsed into one event
+
+        The merged motion takes the place of the last real motion event, so hovering
+        keeps its order relative to key presses and clicks in the same batch.
+        """
+        events = pygame.event.get()
+        last_motion = None
+        motion_count = 0
+        rel_x = rel_y = 0
+        for index, event in enumerate(events):
+            if event.type == pygame.MOUSEMOTION:
+                last_motion = index
+                motion_count += 1
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+        if motion_count <= 1:
+            return events
+
+        last = events[last_motion]
+        merged = pygame.event.Event(pygame.MOUSEMOTION, pos=last.pos, rel=(rel_x, rel_y), buttons=last.buttons)
+        return [merged if index == last_motion else event
+                for index, event in enumerate(events)
+                if event.type != pygame.MOUSEMOTION or index == last_motion]
@@ -0,0 +1,161 @@
+"""
+Frame-stall watchdog
+A background thread that notices when the main loop takes too long over a frame,
+logs the main thread's stack with game context and samples stalls into a
+flame-graph-compatible profile
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+logger = logging.getLogger(__name__)
+
+class StallWatchdog:
+    """Watches main-loop heartbeats from a daemon thread
+
+    The main loop calls heartbeat() when a frame starts and idle() before it sleeps
+    until the next frame, so deliberate waiting never counts as a stall.
+    """
+
+    def __init__(self, threshold_ms=50, sample_interval_ms=5, log_file="stalls.log",
+                 profile_file="stalls.folded", context=None, max_logged_stalls=100):
+        self.threshold = threshold_ms / 1000
+        self.sample_interval = sample_interval_ms / 1000
+        self.log_file = log_file
+        self.profile_file = profile_file
+        self.context = context  # Callable returning a dict of game details for the log
+        self.max_logged_stalls = max_logged_stalls
+
+        # Collapsed stacks ("root;...;leaf") -> samples taken while stalled
+        self.stack_samples = {}
+        self._code_names = {}  # Code object -> "file.py:function" label
+        self.stall_count = 0
+        self.longest_stall_ms = 0.0
+
+        self._frame_start = None  # perf_counter() at the last heartbeat; None while idle
+        self._stall_logged_for = None
+        self._main_thread_id = None
+        self._thread = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._handler = None
+
+    def start(self):
+        """Start watching the calling thread"""
+        if self._thread is not None:
+            return
+        self._main_thread_id = threading.get_ident()
+        if self.log_file:
+            try:
+                self._handler = logging.FileHandler(self.log_file, encoding='utf-8', delay=True)
+                self._handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+                logger.addHandler(self._handler)
+                logger.setLevel(logging.INFO)
+            except (IOError, OSError):
+                self._handler = None
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+
+    def heartbeat(self):
+        """Mark the start of a frame's work"""
+        self._end_stall()
+        self._frame_start = time.perf_counter()
+
+    def idle(self):
+        """Mark the end of a frame's work; the loop is about to wait for the next frame"""
+        self._end_stall()
+        self._frame_start = None
+
+    def _end_stall(self):
+        """Record the length of a stall that the main thread has just recovered from"""
+        frame_start = self._frame_start
+        self._frame_start = None  # Stop sampling before logging
+        if frame_start is None or self._stall_logged_for != frame_start:
+            return
+        duration_ms = (time.perf_counter() - frame_start) * 1000
+        self.longest_stall_ms = max(self.longest_stall_ms, duration_ms)
+        if self.stall_count <= self.max_logged_stalls:
+            logger.warning("Stall ended after %.1f ms", duration_ms)
+
+    def _run(self):
+        """Watchdog thread: poll the heartbeat, sampling the main stack while it is late"""
+        while not self._stop_event.is_set():
+            frame_start = self._frame_start
+            stalled = frame_start is not None and time.perf_counter() - frame_start >= self.threshold
+            if stalled:
+                self._sample(frame_start)
+            self._stop_event.wait(self.sample_interval if stalled else self.threshold / 4)
+
+    def _sample(self, frame_start):
+        """Take one stack sample of the main thread during a stall"""
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        # Walk the frames directly: no source lookups while the main thread is stalled
+        names = []
+        code_names = self._code_names
+        current = frame
+        while current is not None:
+            code = current.f_code
+            name = code_names.get(code)
+            if name is None:
+                name = code_names[code] = f"{os.path.basename(code.co_filename)}:{code.co_name}"
+            names.append(name)
+            current = current.f_back
+        folded = ";".join(reversed(names))
+        with self._lock:
+            self.stack_samples[folded] = self.stack_samples.get(folded, 0) + 1
+
+        if self._stall_logged_for != frame_start:
+            # First sample of this stall: log where the main thread is (with source lines) and what it was doing
+            self._stall_logged_for = frame_start
+            self.stall_count += 1
+            if self.stall_count <= self.max_logged_stalls:
+                elapsed_ms = (time.perf_counter() - frame_start) * 1000
+                logger.warning("Frame stalled for %.1f ms (threshold %.0f ms) %s\n%s",
+                               elapsed_ms, self.threshold * 1000, self._describe_context(),
+                               "".join(traceback.format_stack(frame)).rstrip())
+
+    def _describe_context(self):
+        """Format game details from the context callback"""
+        if self.context is None:
+            return ""
+        try:
+            details = self.context()
+        except Exception:
+            return ""
+        return " ".join(f"{key}={value}" for key, value in details.items())
+
+    def export_profile(self, path=None):
+        """Write stall samples in collapsed-stack format for flamegraph.pl or speedscope"""
+        path = path or self.profile_file
+        with self._lock:
+            samples = sorted(self.stack_samples.items())
+        if not path or not samples:
+            return None
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                for stack, count in samples:
+                    f.write(f"{stack} {count}\n")
+        except (IOError, OSError):
+            return None
+        return path
+
+    def stop(self):
+        """Stop watching, write the stall profile and close the log"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop_event.set()
+        thread.join(timeout=1.0)
+        self._thread = None
+        self.export_profile()
+        if self._handler is not None:
+            logger.removeHandler(self._handler)
+            self._handler.close()
+            self._handler = None
@@ -7,6 +7,7 @@ import pygame
 import random
 import math
 from ..core import config
+from ..core.animation_clock import animation_clock
 
 class Food:
     """Base food class"""
@@ -24,7 +25,8 @@ class Food:
         self.x = x if x is not None else 0
         self.y = y if y is not None else 0
         
-        # Visual effects
+        # Visual effects (animation_timer counts reference frames since spawn)
+        self.spawn_time = animation_clock.now()
         self.animation_timer = 0
         self.pulse_scale = 1.0
         self.rotation = 0
@@ -91,8 +93,8 @@ class Food:
                     self.is_warning = False
                     self.alpha = 255
             
-            # Update animations - optimized
-            self.animation_timer += 1
+            # Update animations from elapsed time so speed is independent of FPS
+            self.animation_timer = animation_clock.frames_since(self.spawn_time)
             
             if self.is_warning:
                 # Warning animation - faster pulse
@@ -101,7 +103,7 @@ class Food:
                 # Normal animation
                 self.pulse_scale = 1.0 + 0.2 * math.sin(self.animation_timer * 0.1)
             
-            self.rotation += 2
+            self.rotation = 2 * self.animation_timer
             return True  # Food is still alive
         except (ValueError, TypeError, ZeroDivisionError) as e:
             # Handle animation calculation errors
@@ -145,12 +147,12 @@ class Food:
     
     def _get_color(self):
         """Get color based on food type"""
-        color_map = {
-            "normal": config.get_color('food_normal'),
-            "special": config.get_color('food_special'),
-            "bad": config.get_color('food_bad')
-        }
-        return color_map.get(self.food_type, config.get_color('food_normal'))
+        colors = config.snapshot.colors
+        if self.food_type == "special":
+            return colors.food_special
+        if self.food_type == "bad":
+            return colors.food_bad
+        return colors.food_normal
     
     def _draw_special_effects(self, surface, rect):
         """Draw special visual effects"""
@@ -181,12 +183,14 @@ class Food:
     
     def get_score(self):
         """Get score value for this food"""
-        score_map = {
-            "normal": config.get("food.normal_score"),
-            "special": config.get("food.special_score"),
-            "bad": -config.get("food.bad_penalty")
-        }
-        return score_map.get(self.food_type, 0)
+        food_config = config.snapshot.food
+        if self.food_type == "normal":
+            return food_config.normal_score
+        if self.food_type == "special":
+            return food_config.special_score
+        if self.food_type == "bad":
+            return -food_config.bad_penalty
+        return 0
     
     def get_rect(self):
         """Get food rectangle for collision detection"""
@@ -7,10 +7,18 @@ import pygame
 import random
 import math
 from ..core import config
+from ..core.animation_clock import animation_clock
 
 class Obstacle:
     """Base obstacle class"""
     
+    # Fixed colors per type; walls use the configurable obstacle color
+    TYPE_COLORS = {
+        "spike": (200, 50, 50),
+        "ice": (100, 150, 255),
+        "fire": (255, 100, 0)
+    }
+    
     def __init__(self, x, y, obstacle_type="wall"):
         self.block_size = config.get_block_size()
         self.screen_width, self.screen_height = config.get_screen_size()
@@ -22,7 +30,8 @@ class Obstacle:
         self.width = self.block_size
         self.height = self.block_size
         
-        # Visual effects
+        # Visual effects (animation_timer counts reference frames since creation)
+        self.spawn_time = animation_clock.now()
         self.animation_timer = 0
         self.pulse_scale = 1.0
         
@@ -31,7 +40,7 @@ class Obstacle:
     
     def update(self):
         """Update obstacle animation"""
-        self.animation_timer += 1
+        self.animation_timer = animation_clock.frames_since(self.spawn_time)
         self.pulse_scale = 1.0 + 0.1 * math.sin(self.animation_timer * 0.05)
     
     def draw(self, surface):
@@ -57,13 +66,7 @@ class Obstacle:
     
     def _get_color(self):
         """Get color based on obstacle type"""
-        color_map = {
-            "wall": config.get_color('obstacle'),
-            "spike": (200, 50, 50),
-            "ice": (100, 150, 255),
-            "fire": (255, 100, 0)
-        }
-        return color_map.get(self.obstacle_type, config.get_color('obstacle'))
+        return self.TYPE_COLORS.get(self.obstacle_type) or config.snapshot.colors.obstacle
     
     def _draw_pattern(self, surface, rect):
         """Draw pattern based on obstacle type"""
@@ -191,6 +194,9 @@ class ObstacleManager:
 class MovingObstacle(Obstacle):
     """Moving obstacle that follows a pattern"""
     
+    # Most frames of movement one update may catch up on, so a pause or stall never teleports it
+    MAX_CATCH_UP_FRAMES = 2
+    
     def __init__(self, x, y, obstacle_type="wall", move_pattern="horizontal", speed=1):
         super().__init__(x, y, obstacle_type)
         self.move_pattern = move_pattern
@@ -202,18 +208,24 @@ class MovingObstacle(Obstacle):
     
     def update(self):
         """Update obstacle position and animation"""
+        previous_timer = self.animation_timer
         super().update()
-        self.move_timer += 1
+        elapsed_frames = min(max(0.0, self.animation_timer - previous_timer), self.MAX_CATCH_UP_FRAMES)
+        self.move_timer += elapsed_frames
         
-        # Move based on pattern
+        # Move based on pattern, clamping at the edges so the obstacle turns back once
         if self.move_pattern == "horizontal":
-            self.x += self.speed * self.direction
-            if self.x <= 0 or self.x >= self.screen_width - self.width:
-                self.direction *= -1
+            self.x += self.speed * self.direction * elapsed_frames
+            if self.x <= 0:
+                self.x, self.direction = 0, 1
+            elif self.x >= self.screen_width - self.width:
+                self.x, self.direction = self.screen_width - self.width, -1
         elif self.move_pattern == "vertical":
-            self.y += self.speed * self.direction
-            if self.y <= 0 or self.y >= self.screen_height - self.height:
-                self.direction *= -1
+            self.y += self.speed * self.direction * elapsed_frames
+            if self.y <= 0:
+                self.y, self.direction = 0, 1
+            elif self.y >= self.screen_height - self.height:
+                self.y, self.direction = self.screen_height - self.height, -1
         elif self.move_pattern == "circular":
             angle = self.move_timer * 0.02
             radius = 50
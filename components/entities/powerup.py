@@ -7,6 +7,7 @@ import pygame
 import random
 import math
 from ..core import config
+from ..core.animation_clock import animation_clock
 
 class PowerUp:
     """Base power-up class"""
@@ -25,7 +26,8 @@ class PowerUp:
         self.x = x if x is not None else 0
         self.y = y if y is not None else 0
         
-        # Visual effects
+        # Visual effects (animation_timer counts reference frames since spawn)
+        self.spawn_time = animation_clock.now()
         self.animation_timer = 0
         self.pulse_scale = 1.0
         self.rotation = 0
@@ -101,7 +103,7 @@ class PowerUp:
             self.is_warning = False
             self.is_fading = False
             self.alpha = 255
-        self.animation_timer += 1
+        self.animation_timer = animation_clock.frames_since(self.spawn_time)
         
         if self.is_warning:
             self.pulse_scale = 1.0 + 0.5 * math.sin(self.animation_timer * 0.3)
@@ -110,7 +112,7 @@ class PowerUp:
             self.pulse_scale = 1.0 + 0.3 * math.sin(self.animation_timer * 0.15)
             self.glow_intensity = 0.5 + 0.5 * math.sin(self.animation_timer * 0.2)
         
-        self.rotation += 3
+        self.rotation = 3 * self.animation_timer
         return True
     
     def draw(self, surface):
@@ -158,11 +160,10 @@ class PowerUp:
     def _get_color(self):
         """Get color based on power-up type"""
 
-        color_map = {
-            "slow_motion": config.get_color('powerup_slow'),
-            "wall_pass": config.get_color('powerup_wall')
-        }
-        return color_map.get(self.power_type, config.get_color('powerup_slow'))
+        colors = config.snapshot.colors
+        if self.power_type == "wall_pass":
+            return colors.powerup_wall
+        return colors.powerup_slow
     
     def _draw_symbol(self, surface, rect):
         """Draw symbol representing the power-up"""
@@ -5,11 +5,15 @@ Handles snake movement, growth, collision detection, and power-up effects
 
 import pygame
 import random
+from collections import deque
 from ..core import config
 
 class Snake:
     """Snake class with enhanced features"""
     
+    # Turns buffered between moves; presses beyond this are dropped
+    MAX_QUEUED_TURNS = 3
+    
     def __init__(self, x=None, y=None, game_area_x=0, game_area_y=0, game_area_width=800, game_area_height=600):
         """Initialize snake with optional starting position"""
         self.block_size = config.get_block_size()
@@ -26,10 +30,15 @@ class Snake:
         self.x_change = 0
         self.y_change = 0
         
+        # Pending turns as (dx, dy, input_time); move() applies one per step
+        self.turn_queue = deque()
+        self.last_turn_input_time = None  # Input time of the turn applied by the last move
+        
         # Body and properties
         self.body = []
         self.length = 1
         self.lives = 3  # New: lives system
+        self.last_collision = None  # "wall" or "self" after check_collision hits
         
         # Power-up effects
         self.power_ups = {
@@ -44,6 +53,13 @@ class Snake:
     def move(self):
         """Move the snake"""
         
+        # Apply at most one buffered turn per step
+        self.last_turn_input_time = None
+        if self.turn_queue:
+            dx, dy, input_time = self.turn_queue.popleft()
+            self.change_direction(dx, dy)
+            self.last_turn_input_time = input_time
+        
         # Only move if there's a direction set
         if self.x_change == 0 and self.y_change == 0:
             return
@@ -86,6 +102,7 @@ class Snake:
         self.y = self.game_area_y + self.game_area_height // 2
         self.x_change = 0
         self.y_change = 0
+        self.turn_queue.clear()
         self.body = []
         self.length = 1
 
@@ -106,8 +123,9 @@ class Snake:
     def draw(self, surface):
         """Draw the snake with modern design"""
         try:
-            snake_color = config.get_color('snake')
-            head_color = config.get_color('snake_head')
+            colors = config.snapshot.colors
+            snake_color = colors.snake
+            head_color = colors.snake_head
             
             for i, block in enumerate(self.body):
                 is_head = (i == len(self.body) - 1)
@@ -194,6 +212,7 @@ class Snake:
             if not self.power_ups['wall_pass']:
                 if (self.x >= self.game_area_x + self.game_area_width or self.x < self.game_area_x or 
                     self.y >= self.game_area_y + self.game_area_height or self.y < self.game_area_y):
+                    self.last_collision = "wall"
                     return True
             
             # Wall pass
@@ -218,7 +237,9 @@ class Snake:
             # Self collision
             if len(self.body) > 1:
                 head_pos = [self.x, self.y]
-                return head_pos in self.body[:-1]
+                if head_pos in self.body[:-1]:
+                    self.last_collision = "self"
+                    return True
             return False
         except (IndexError, TypeError, KeyError):
             return True 
@@ -233,6 +254,28 @@ class Snake:
         except (AttributeError, TypeError):
             return False
     
+    def queue_direction(self, dx, dy, input_time=None):
+        """Buffer a turn for the next move; returns False if it was rejected
+        
+        Each turn is validated against the direction the snake will have after the
+        turns already queued, so quick "up, left" sequences between moves are kept
+        and cannot reverse the snake into itself.
+        """
+        if self.turn_queue:
+            current_dx, current_dy = self.turn_queue[-1][:2]
+        else:
+            current_dx, current_dy = self.x_change, self.y_change
+        
+        if (dx, dy) == (current_dx, current_dy):
+            return False  # Already heading that way
+        if dx != 0 and current_dx == -dx or dy != 0 and current_dy == -dy:
+            return False  # Reversal
+        if len(self.turn_queue) >= self.MAX_QUEUED_TURNS:
+            return False
+        
+        self.turn_queue.append((dx, dy, input_time))
+        return True
+    
     def change_direction(self, dx, dy):
         """Change snake direction with improved logic"""
         if dx != 0 and self.x_change != -dx:
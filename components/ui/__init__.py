@@ -2,4 +2,6 @@
 from .game_menus import MainMenu, LevelSelectMenu, GameOverMenu
 from .settings_menu import SettingsMenu
 from .score_menu import HighScoreMenu
-from .achievement_menu import AchievementMenu, AchievementNotification
\ No newline at end of file
+from .achievement_menu import AchievementMenu, AchievementNotification
+from .layout import HitTestIndex, RowIndex
+from .lazy_menus import LazyMenus
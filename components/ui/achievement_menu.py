@@ -4,18 +4,48 @@ Achievement Menu for displaying unlocked achievements and progress
 
 import pygame
 import math
+from datetime import datetime, date
 from .base_menu import Menu
+from .layout import RowIndex
 from ..core.achievement_manager import achievement_manager
 
 class AchievementMenu(Menu):
     """Achievement display menu"""
     
+    # Scrollable list area below the title and progress summary
+    VIEWPORT_TOP = 120
+    VIEWPORT_BOTTOM_MARGIN = 60
+    
+    CARD_HEIGHT = 70
+    CARD_SPACING = 80
+    
+    # List content is rendered lazily in fixed-height tiles so long lists never need one huge surface
+    TILE_HEIGHT = 512
+    MAX_CACHED_TILES = 6
+    
     def __init__(self, screen):
         super().__init__(screen)
         self.scroll_offset = 0
         self.max_scroll = 0
         self.selected_achievement = None
         
+        self.viewport = pygame.Rect(0, self.VIEWPORT_TOP, self.screen_width,
+                                    self.screen_height - self.VIEWPORT_TOP - self.VIEWPORT_BOTTOM_MARGIN)
+        self.card_x = 50
+        self.card_width = self.screen_width - 100
+        
+        # Content layout (content-space y coordinates), rebuilt when unlock state changes
+        self._content_key = None
+        self._content_height = 0
+        self._progress_text = ""
+        self._headers = []
+        self._cards = []
+        self.card_index = RowIndex()
+        self._card_positions = {}
+        
+        self._tiles = {}
+        self._selected_background = None
+        
     def handle_event(self, event):
         """Handle achievement menu events"""
         if event.type == pygame.KEYDOWN:
@@ -32,37 +62,90 @@ class AchievementMenu(Menu):
         
         return None
     
-    def _update_selection_from_mouse(self, mouse_pos):
-        """Update selected achievement based on mouse position"""
+    def _ensure_layout(self):
+        """Rebuild list layout and drop rendered tiles when unlock state changes"""
+        content_key = (achievement_manager.revision, date.today())
+        if content_key == self._content_key:
+            return
+        self._content_key = content_key
+        self._tiles = {}
+        
         achievements = achievement_manager.get_achievements_by_type()
+        
+        # Progress summary
+        session_count = len(achievements["session"]["unlocked"])
+        persistent_count = len(achievements["persistent"]["unlocked"])
+        session_total = len(achievements["session"]["unlocked"]) + len(achievements["session"]["locked"])
+        persistent_total = len(achievements["persistent"]["unlocked"]) + len(achievements["persistent"]["locked"])
+        self._progress_text = f"Session: {session_count}/{session_total} | Persistent: {persistent_count}/{persistent_total}"
+        
+        # Combine all achievements for display
         session_achievements = achievements["session"]["unlocked"] + achievements["session"]["locked"]
         persistent_achievements = achievements["persistent"]["unlocked"] + achievements["persistent"]["locked"]
         
-        current_y = 120
+        self._headers = []
+        self._cards = []
+        current_y = 0
         
         if session_achievements:
-            current_y += 40 
+            self._headers.append(("SESSION ACHIEVEMENTS", (150, 200, 100), current_y))
+            current_y += 40
             for achievement in session_achievements:
-                y = current_y - self.scroll_offset
-                if 50 <= y <= self.screen_height - 50:
-                    rect = pygame.Rect(50, y, self.screen_width - 100, 70)
-                    if rect.collidepoint(mouse_pos):
-                        self.selected_achievement = achievement
-                        return
-                current_y += 80
+                self._cards.append((achievement, current_y))
+                current_y += self.CARD_SPACING
         
         if persistent_achievements:
-            current_y += 60 
+            current_y += 20
+            self._headers.append(("PERSISTENT ACHIEVEMENTS", (100, 200, 100), current_y))
+            current_y += 40
             for achievement in persistent_achievements:
-                y = current_y - self.scroll_offset
-                if 50 <= y <= self.screen_height - 50:
-                    rect = pygame.Rect(50, y, self.screen_width - 100, 70)
-                    if rect.collidepoint(mouse_pos):
-                        self.selected_achievement = achievement
-                        return
-                current_y += 80
+                self._cards.append((achievement, current_y))
+                current_y += self.CARD_SPACING
+        
+        self.card_index.rebuild((achievement, top, self.CARD_HEIGHT) for achievement, top in self._cards)
+        self._card_positions = {achievement.id: top for achievement, top in self._cards}
+        self._content_height = current_y
         
+        self.max_scroll = max(0, self._content_height - self.viewport.height)
+        self.scroll_offset = min(self.scroll_offset, self.max_scroll)
+    
+    def _card_at(self, content_y):
+        """Find achievement card at a content-space y coordinate"""
+        return self.card_index.hit(content_y)
+    
+    def _update_selection_from_mouse(self, mouse_pos):
+        """Update selected achievement based on mouse position"""
+        self._ensure_layout()
         self.selected_achievement = None
+        
+        if not self.viewport.collidepoint(mouse_pos):
+            return
+        if not self.card_x <= mouse_pos[0] < self.card_x + self.card_width:
+            return
+        
+        content_y = mouse_pos[1] - self.viewport.top + self.scroll_offset
+        self.selected_achievement = self._card_at(content_y)
+    
+    def _get_tile(self, index):
+        """Get rendered content tile, drawing its cards on first use"""
+        tile = self._tiles.get(index)
+        if tile is None:
+            if len(self._tiles) >= self.MAX_CACHED_TILES:
+                del self._tiles[next(iter(self._tiles))]
+            
+            tile_top = index * self.TILE_HEIGHT
+            tile_bottom = tile_top + self.TILE_HEIGHT
+            tile = pygame.Surface((self.screen_width, self.TILE_HEIGHT), pygame.SRCALPHA)
+            
+            # Cards straddling a tile edge are drawn into both tiles and clipped by each
+            first = self.card_index.first_visible(tile_top)
+            for achievement, top in self._cards[first:]:
+                if top >= tile_bottom:
+                    break
+                self._draw_achievement(tile, achievement, self.card_x, top - tile_top,
+                                       self.card_width, self.CARD_HEIGHT)
+            self._tiles[index] = tile
+        return tile
     
     def draw(self):
         """Draw achievement menu with modern styling"""
@@ -79,60 +162,38 @@ class AchievementMenu(Menu):
         self.draw_text("ACHIEVEMENTS", self.font_large, title_color,
                       self.screen_width // 2, title_y, shadow=True)
         
-        # Achievement list organized by type
-        achievements = achievement_manager.get_achievements_by_type()
+        self._ensure_layout()
         
-        # Progress summary
-        session_count = len(achievements["session"]["unlocked"])
-        persistent_count = len(achievements["persistent"]["unlocked"])
-        session_total = len(achievements["session"]["unlocked"]) + len(achievements["session"]["locked"])
-        persistent_total = len(achievements["persistent"]["unlocked"]) + len(achievements["persistent"]["locked"])
-        
-        progress_text = f"Session: {session_count}/{session_total} | Persistent: {persistent_count}/{persistent_total}"
         progress_color = (150, 200, 255)
-        self.draw_text(progress_text, self.font_medium, progress_color,
+        self.draw_text(self._progress_text, self.font_medium, progress_color,
                       self.screen_width // 2, 110, shadow=True)
         
-        # Combine all achievements for display
-        session_achievements = achievements["session"]["unlocked"] + achievements["session"]["locked"]
-        persistent_achievements = achievements["persistent"]["unlocked"] + achievements["persistent"]["locked"]
-        
-        # Draw achievements
-        start_y = 120 - self.scroll_offset
-        current_y = start_y
-        
-        if session_achievements:
-            section_y = current_y - self.scroll_offset
-            if section_y > 50 and section_y < self.screen_height - 50:
-                section_color = (150, 200, 100)
-                self.draw_text("SESSION ACHIEVEMENTS", self.font_medium, section_color,
-                              70, section_y, center=False)
-            current_y += 40
-            
-            for achievement in session_achievements:
-                y = current_y - self.scroll_offset
-                if y > 50 and y < self.screen_height - 50:
-                    self._draw_achievement(achievement, 50, y, self.screen_width - 100, 70)
-                current_y += 80
-        
-        if persistent_achievements:
-            current_y += 20  
-            section_y = current_y - self.scroll_offset
-            if section_y > 50 and section_y < self.screen_height - 50:
-                section_color = (100, 200, 100)
-                self.draw_text("PERSISTENT ACHIEVEMENTS", self.font_medium, section_color,
-                              70, section_y, center=False)
-            current_y += 40
-            
-            for achievement in persistent_achievements:
-                y = current_y - self.scroll_offset
-                if y > 50 and y < self.screen_height - 50:
-                    self._draw_achievement(achievement, 50, y, self.screen_width - 100, 70)
-                current_y += 80
-        
-        total_content_height = current_y - start_y
-        visible_height = self.screen_height - 200
-        self.max_scroll = max(0, total_content_height - visible_height)
+        # Blit only the tiles overlapping the visible part of the list
+        previous_clip = self.screen.get_clip()
+        self.screen.set_clip(self.viewport)
+        
+        view_top = self.scroll_offset
+        view_bottom = min(view_top + self.viewport.height, self._content_height)
+        if view_bottom > view_top:
+            first_tile = view_top // self.TILE_HEIGHT
+            last_tile = (view_bottom - 1) // self.TILE_HEIGHT
+            for index in range(first_tile, last_tile + 1):
+                tile_y = self.viewport.top + index * self.TILE_HEIGHT - view_top
+                self.screen.blit(self._get_tile(index), (0, tile_y))
+        
+        for text, color, content_y in self._headers:
+            if view_top - 40 < content_y < view_bottom:
+                self.draw_text(text, self.font_medium, color,
+                              70, self.viewport.top + content_y - view_top, center=False)
+        
+        if self.selected_achievement is not None:
+            top = self._card_positions.get(self.selected_achievement.id)
+            if top is not None:
+                self._draw_achievement(self.screen, self.selected_achievement, self.card_x,
+                                       self.viewport.top + top - view_top,
+                                       self.card_width, self.CARD_HEIGHT, is_selected=True)
+        
+        self.screen.set_clip(previous_clip)
         
         if self.max_scroll > 0:
             self._draw_scrollbar()
@@ -146,30 +207,34 @@ class AchievementMenu(Menu):
         
         self.update_animation()
     
-    def _draw_achievement(self, achievement, x, y, width, height):
-        """Draw individual achievement"""
+    def _get_selected_background(self, width, height):
+        """Get cached gradient background for the selected card"""
+        if self._selected_background is None or self._selected_background.get_size() != (width, height):
+            background = pygame.Surface((width, height))
+            for draw_y in range(height):
+                progress = draw_y / height
+                line_color = (int(80 + 40 * progress), int(80 + 40 * progress), 
+                            int(120 + 30 * progress))
+                pygame.draw.line(background, line_color, (0, draw_y), (width, draw_y))
+            self._selected_background = background
+        return self._selected_background
+    
+    def _draw_achievement(self, surface, achievement, x, y, width, height, is_selected=False):
+        """Draw individual achievement onto a surface"""
         is_unlocked = achievement.unlocked
-        is_selected = (achievement == self.selected_achievement)
         
         if is_selected:
-            bg_color = (80, 80, 120)
             border_color = (255, 255, 100)
             border_width = 2
+            surface.blit(self._get_selected_background(width, height), (x, y))
         else:
             bg_color = (60, 60, 100) if is_unlocked else (40, 40, 60)
             border_color = (100, 100, 120)
             border_width = 1
-        for draw_y in range(height):
-            progress = draw_y / height
-            if is_selected:
-                line_color = (int(80 + 40 * progress), int(80 + 40 * progress), 
-                            int(120 + 30 * progress))
-            else:
-                line_color = bg_color
-            pygame.draw.line(self.screen, line_color, (x, y + draw_y), (x + width, y + draw_y))
+            pygame.draw.rect(surface, bg_color, (x, y, width, height))
         
         rect = pygame.Rect(x, y, width, height)
-        pygame.draw.rect(self.screen, border_color, rect, border_width, border_radius=8)
+        pygame.draw.rect(surface, border_color, rect, border_width, border_radius=8)
         
         icon_size = 40
         icon_x = x + 15
@@ -183,35 +248,33 @@ class AchievementMenu(Menu):
             lock_color = (80, 60, 40)
         
         if is_unlocked:
-            pygame.draw.circle(self.screen, unlock_color, 
+            pygame.draw.circle(surface, unlock_color, 
                              (icon_x + icon_size//2, icon_y + icon_size//2), icon_size//2 - 2)
-            pygame.draw.circle(self.screen, (255, 255, 255), 
+            pygame.draw.circle(surface, (255, 255, 255), 
                              (icon_x + icon_size//2, icon_y + icon_size//2), icon_size//2 - 2, 2)
             self.draw_text(achievement.icon, self.font_small, (255, 255, 255),
-                          icon_x + icon_size//2, icon_y + icon_size//2)
+                          icon_x + icon_size//2, icon_y + icon_size//2, surface=surface)
         else:
-            pygame.draw.circle(self.screen, lock_color, 
+            pygame.draw.circle(surface, lock_color, 
                              (icon_x + icon_size//2, icon_y + icon_size//2), icon_size//2 - 2)
-            pygame.draw.circle(self.screen, (100, 100, 100), 
+            pygame.draw.circle(surface, (100, 100, 100), 
                              (icon_x + icon_size//2, icon_y + icon_size//2), icon_size//2 - 2, 2)
             self.draw_text("?", self.font_small, (100, 100, 100),
-                          icon_x + icon_size//2, icon_y + icon_size//2)
+                          icon_x + icon_size//2, icon_y + icon_size//2, surface=surface)
         text_x = icon_x + icon_size + 15
         text_color = (255, 255, 100) if is_unlocked else (150, 150, 150)
         
-        name_scale = 1.05 if is_selected else 1.0
         self.draw_text(achievement.name, self.font_medium, text_color,
-                      text_x, y + 20, center=False)
+                      text_x, y + 20, center=False, surface=surface)
         
         desc_color = self.text_color if is_unlocked else (100, 100, 100)
         type_text = " [SESSION]" if not achievement.persistent else " [PERSISTENT]"
         full_description = achievement.description + type_text
         self.draw_text(full_description, self.font_small, desc_color,
-                      text_x, y + 45, center=False)
+                      text_x, y + 45, center=False, surface=surface)
         
         if is_unlocked and achievement.unlock_time:
             try:
-                from datetime import datetime
                 unlock_dt = datetime.fromisoformat(achievement.unlock_time)
                 
                 now = datetime.now()
@@ -230,10 +293,10 @@ class AchievementMenu(Menu):
                     time_text = unlock_dt.strftime("%d/%m/%y")
                 
                 self.draw_text(time_text, self.font_small, (150, 150, 150),
-                              x + width - 70, y + 20, center=False)
+                              x + width - 70, y + 20, center=False, surface=surface)
             except Exception:
                 self.draw_text("Unlocked", self.font_small, (150, 150, 150),
-                              x + width - 60, y + 20, center=False)
+                              x + width - 60, y + 20, center=False, surface=surface)
     
     def _draw_scrollbar(self):
         """Draw scrollbar for achievement list"""
@@ -242,8 +305,8 @@ class AchievementMenu(Menu):
         
         bar_width = 8
         bar_x = self.screen_width - 20
-        bar_y = 120
-        bar_height = self.screen_height - 200
+        bar_y = self.viewport.top
+        bar_height = self.viewport.height
         
         pygame.draw.rect(self.screen, (60, 60, 60), 
                         (bar_x, bar_y, bar_width, bar_height), border_radius=4)
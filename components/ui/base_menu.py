@@ -3,14 +3,18 @@ Base Menu class for all menu screens
 """
 
 import pygame
-import math
 from ..core import config
+from ..core.animation_clock import animation_clock
+from .particles import ParticleSystem
 
 class Menu:
     """Base menu class with performance optimizations"""
     
     _font_cache = {}
     
+    # Menu animations were tuned at the default menu frame rate
+    ANIMATION_FPS = 15
+    
     def __init__(self, screen):
         self.screen = screen
         self.screen_width, self.screen_height = 1000, 700  # Fixed optimal size
@@ -19,15 +23,28 @@ class Menu:
         self.font_medium = self._get_cached_font(40)
         self.font_small = self._get_cached_font(30)
         
-        self.text_color = config.get_color('text')
-        self.highlight_color = config.get_color('text_highlight')
-        self.background_color = config.get_color('background')
+        self._load_colors()
+        config.subscribe(self._on_colors_changed, "colors")
         
+        # Animation timers count frames at ANIMATION_FPS, sampled from elapsed time
+        self._animation_start = animation_clock.now()
         self.animation_timer = 0
+        self.previous_animation_timer = 0
+        self.animation_delta = 0
         
         self._text_cache = {}
         
-        self.particles = []
+        self.particles = ParticleSystem(fps=self.ANIMATION_FPS)
+    
+    def _load_colors(self):
+        """Load theme colors from config"""
+        self.text_color = config.get_color('text')
+        self.highlight_color = config.get_color('text_highlight')
+        self.background_color = config.get_color('background')
+    
+    def _on_colors_changed(self, changed_paths):
+        """Refresh theme colors after a config change"""
+        self._load_colors()
     
     @classmethod
     def _get_cached_font(cls, size):
@@ -39,8 +56,11 @@ class Menu:
                 cls._font_cache[size] = pygame.font.Font(pygame.font.get_default_font(), size)
         return cls._font_cache[size]
     
-    def draw_text(self, text, font, color, x, y, center=True, shadow=False):
+    def draw_text(self, text, font, color, x, y, center=True, shadow=False, surface=None):
         """Draw text with optimized caching and optional shadow"""
+        if surface is None:
+            surface = self.screen
+        
         cache_key = (str(text), id(font), color, shadow)
         
         if cache_key not in self._text_cache:
@@ -64,13 +84,13 @@ class Menu:
                 shadow_rect = shadow_surface.get_rect(center=(x + 2, y + 2))
             else:
                 shadow_rect = shadow_surface.get_rect(topleft=(x + 2, y + 2))
-            self.screen.blit(shadow_surface, shadow_rect)
+            surface.blit(shadow_surface, shadow_rect)
         
         if center:
             text_rect = text_surface.get_rect(center=(x, y))
         else:
             text_rect = text_surface.get_rect(topleft=(x, y))
-        self.screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
         return text_rect
     
     def draw_button(self, text, x, y, width, height, color, hover_color, is_hovered=False):
@@ -130,46 +150,26 @@ class Menu:
     
     def draw_animated_particles(self):
         """Draw and update animated particles"""
-        for particle in self.particles[:]:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vy'] += 0.1  # Gravity
-            
-            if particle['life'] <= 0:
-                self.particles.remove(particle)
-                continue
-            
-            alpha = int(255 * (particle['life'] / particle['max_life']))
-            color = particle['color']
-            size = max(1, int(particle['size'] * (particle['life'] / particle['max_life'])))
-            
-            try:
-                pygame.draw.circle(self.screen, color, 
-                                 (int(particle['x']), int(particle['y'])), size)
-            except ValueError:
-                pass
+        self.particles.update()
+        self.particles.draw(self.screen)
     
     def spawn_particles(self, x, y, count=5, color=(100, 200, 255)):
         """Spawn animated particles"""
-        import random
-        for _ in range(count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(0.5, 2)
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed - 1,
-                'life': 30,
-                'max_life': 30,
-                'color': color,
-                'size': random.randint(3, 6)
-            })
+        self.particles.spawn(x, y, count=count, color=color)
     
     def update_animation(self):
-        """Update animation timer"""
-        self.animation_timer += 1
+        """Update animation timer from elapsed time"""
+        self.previous_animation_timer = self.animation_timer
+        self.animation_timer = animation_clock.frames_since(self._animation_start, self.ANIMATION_FPS)
+        self.animation_delta = self.animation_timer - self.previous_animation_timer
+    
+    def animation_interval_elapsed(self, interval):
+        """Check if the last animation update crossed a multiple of interval frames"""
+        return int(self.previous_animation_timer // interval) != int(self.animation_timer // interval)
+    
+    def ease(self, current, target, rate):
+        """Move current towards target by rate per animation frame, independent of FPS"""
+        return current + (target - current) * animation_clock.smoothing(rate, self.animation_delta)
     
     def handle_event(self, event):
         """Handle menu events - to be implemented by subclass"""
@@ -6,6 +6,7 @@ import pygame
 import math
 import random
 from .base_menu import Menu
+from .layout import HitTestIndex
 from ..core import config
 
 class MainMenu(Menu):
@@ -15,8 +16,31 @@ class MainMenu(Menu):
         super().__init__(screen)
         self.selected_option = 0
         self.options = ["Start Game", "Settings", "High Scores", "Achievements"]
-        self.buttons = []
         self.button_hover_scale = [1.0] * len(self.options)
+        self.hit_index = HitTestIndex()
+
+    def _button_rect(self, index, scale):
+        """Get the rect of a menu button drawn at the given hover scale"""
+        start_y = 280
+        button_width = 280
+        button_height = 50
+        button_spacing = 75
+
+        y = start_y + index * button_spacing
+        scaled_width = int(button_width * scale)
+        scaled_height = int(button_height * scale)
+        centered_x = self.screen_width // 2 - scaled_width // 2
+        centered_y = y - (scaled_height - button_height) // 2
+        return pygame.Rect(centered_x, centered_y, scaled_width, scaled_height)
+
+    def _button_at(self, pos):
+        """Get the index of the button under pos, or None"""
+        layout_key = (self.screen_width, self.selected_option, len(self.options))
+        self.hit_index.ensure(layout_key, lambda: [
+            (i, self._button_rect(i, 1.08 if i == self.selected_option else 1.0))
+            for i in range(len(self.options))
+        ])
+        return self.hit_index.hit(pos)
 
     def handle_event(self, event):
         """Handle menu events"""
@@ -33,19 +57,17 @@ class MainMenu(Menu):
                     return "Select Level"
                 return selected_action
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            for i, button_rect in enumerate(self.buttons):
-                if button_rect.collidepoint(mouse_pos):
-                    self.selected_option = i
+            index = self._button_at(pygame.mouse.get_pos())
+            if index is not None:
+                self.selected_option = index
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
-                mouse_pos = pygame.mouse.get_pos()
-                for i, button_rect in enumerate(self.buttons):
-                    if button_rect.collidepoint(mouse_pos):
-                        selected_action = self.options[i]
-                        if selected_action == "Start Game":
-                            return "Select Level"
-                        return selected_action
+                index = self._button_at(pygame.mouse.get_pos())
+                if index is not None:
+                    selected_action = self.options[index]
+                    if selected_action == "Start Game":
+                        return "Select Level"
+                    return selected_action
         return None
 
     def draw(self):
@@ -79,23 +101,13 @@ class MainMenu(Menu):
         self.draw_text("Classic Game | Modern Experience", self.font_small, subtitle_color,
                       self.screen_width // 2, title_y + 60)
 
-        start_y = 280
-        button_width = 280
-        button_height = 50
-        button_spacing = 75
-
-        self.buttons = []
         for i, option in enumerate(self.options):
-            y = start_y + i * button_spacing
             is_selected = (i == self.selected_option)
 
             target_scale = 1.08 if is_selected else 1.0
-            self.button_hover_scale[i] += (target_scale - self.button_hover_scale[i]) * 0.15
+            self.button_hover_scale[i] = self.ease(self.button_hover_scale[i], target_scale, 0.15)
 
-            scaled_width = int(button_width * self.button_hover_scale[i])
-            scaled_height = int(button_height * self.button_hover_scale[i])
-            centered_x = self.screen_width // 2 - scaled_width // 2
-            centered_y = y - (scaled_height - button_height) // 2
+            centered_x, centered_y, scaled_width, scaled_height = self._button_rect(i, self.button_hover_scale[i])
 
             if is_selected:
                 base_color = (50, 100, 200)
@@ -104,7 +116,7 @@ class MainMenu(Menu):
                 base_color = (40, 70, 150)
                 hover_color = (60, 110, 200)
             
-            button_rect = self.draw_button(
+            self.draw_button(
                 option,
                 centered_x,
                 centered_y,
@@ -115,12 +127,10 @@ class MainMenu(Menu):
                 is_selected
             )
             
-            if is_selected and self.animation_timer % 15 == 0:
+            if is_selected and self.animation_interval_elapsed(15):
                 self.spawn_particles(centered_x + scaled_width // 2, 
                                    centered_y + scaled_height // 2, 
                                    count=3, color=(100, 255, 150))
-            
-            self.buttons.append(button_rect)
 
         self.draw_animated_particles()
 
@@ -141,11 +151,42 @@ class LevelSelectMenu(Menu):
     def __init__(self, screen):
         super().__init__(screen)
         self.selected_level = 0
+        self._load_levels()
+        config.subscribe(self._on_levels_changed, "levels")
+
+    def _load_levels(self):
+        """Load level definitions from config"""
         self.max_level = config.get("levels.max_level")
         self.level_names = config.get("levels.level_names")
         self.obstacle_counts = config.get("levels.obstacle_count")
         self.speed_multipliers = config.get("levels.speed_multiplier")
         self.level_scales = [1.0] * self.max_level
+        self.selected_level = min(self.selected_level, self.max_level - 1)
+        self.hit_index = HitTestIndex()
+
+    def _on_levels_changed(self, changed_paths):
+        """Rebuild level cards after level config changes"""
+        self._load_levels()
+
+    def _card_rect(self, index, scale):
+        """Get the rect of a level card drawn at the given hover scale"""
+        start_y = 140
+        level_height = 80
+        card_width = 700
+        card_x = (self.screen_width - card_width) // 2
+
+        y = start_y + index * level_height
+        card_height = int(65 * scale)
+        card_y = y - (card_height - 65) // 2
+        return pygame.Rect(card_x, card_y, card_width, card_height)
+
+    def _card_at(self, pos):
+        """Get the index of the level card under pos, or None"""
+        layout_key = (self.screen_width, self.max_level)
+        self.hit_index.ensure(layout_key, lambda: [
+            (i, self._card_rect(i, 1.0)) for i in range(self.max_level)
+        ])
+        return self.hit_index.hit(pos)
 
     def handle_event(self, event):
         """Handle level selection events"""
@@ -159,34 +200,14 @@ class LevelSelectMenu(Menu):
             elif event.key == pygame.K_ESCAPE:
                 return "back"
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            start_y = 140
-            level_height = 80
-            card_width = 700
-            card_x = (self.screen_width - card_width) // 2
-            
-            for i in range(self.max_level):
-                y = start_y + i * level_height
-                card_height = 65
-                card_y = y - (card_height - 65) // 2
-                level_rect = pygame.Rect(card_x, card_y, card_width, card_height)
-                if level_rect.collidepoint(mouse_pos):
-                    self.selected_level = i
+            index = self._card_at(pygame.mouse.get_pos())
+            if index is not None:
+                self.selected_level = index
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  
-                mouse_pos = pygame.mouse.get_pos()
-                start_y = 140
-                level_height = 80
-                card_width = 700
-                card_x = (self.screen_width - card_width) // 2
-                
-                for i in range(self.max_level):
-                    y = start_y + i * level_height
-                    card_height = 65
-                    card_y = y - (card_height - 65) // 2
-                    level_rect = pygame.Rect(card_x, card_y, card_width, card_height)
-                    if level_rect.collidepoint(mouse_pos):
-                        return f"start_level_{i + 1}"
+                index = self._card_at(pygame.mouse.get_pos())
+                if index is not None:
+                    return f"start_level_{index + 1}"
         return None
 
     def draw(self):
@@ -210,20 +231,13 @@ class LevelSelectMenu(Menu):
         self.draw_text("Choose your challenge", self.font_small, subtitle_color,
                       self.screen_width // 2, title_y + 50)
 
-        start_y = 140
-        level_height = 80
-        card_width = 700
-        card_x = (self.screen_width - card_width) // 2
-
         for i in range(self.max_level):
-            y = start_y + i * level_height
             is_selected = (i == self.selected_level)
 
             target_scale = 1.06 if is_selected else 1.0
-            self.level_scales[i] += (target_scale - self.level_scales[i]) * 0.12
+            self.level_scales[i] = self.ease(self.level_scales[i], target_scale, 0.12)
 
-            card_height = int(65 * self.level_scales[i])
-            card_y = y - (card_height - 65) // 2
+            card_x, card_y, card_width, card_height = self._card_rect(i, self.level_scales[i])
 
             if is_selected:
                 grad_start = (70, 110, 200)
@@ -296,7 +310,7 @@ class LevelSelectMenu(Menu):
             self.draw_text(f"Obstacles: {obstacles}", self.font_small, badge_text_color,
                           obs_badge_x + obs_badge_width // 2, obs_badge_y + obs_badge_height // 2)
             
-            if is_selected and self.animation_timer % 20 == 0:
+            if is_selected and self.animation_interval_elapsed(20):
                 self.spawn_particles(card_x + card_width // 2,
                                    card_y + card_height // 2,
                                    count=2, color=(100, 200, 255))
@@ -320,6 +334,7 @@ class GameOverMenu(Menu):
         from .score_menu import HighScoreMenu
         self.high_score_menu = HighScoreMenu(screen)
         self.show_high_score = False
+        self.hit_index = HitTestIndex()
         
         # Add score to high scores
         self.high_score_menu.add_score(final_score, level)
@@ -365,20 +380,26 @@ class GameOverMenu(Menu):
         if event.button != 1:
             return None
         
-        mouse_pos = pygame.mouse.get_pos()
-        
         actions = ["restart", "menu", None]
-        start_y = 400
-        for i in range(3):
-            y = start_y + i * 40
-            text_rect = pygame.Rect(self.screen_width // 2 - 100, y - 15, 200, 30)
-            if text_rect.collidepoint(mouse_pos):
-                if i == 2:  # High Scores
-                    self.show_high_score = True
-                    return None
-                return actions[i]
-        
-        return None
+        self.hit_index.ensure(self.screen_width, lambda: [
+            (i, self._button_rect(i)) for i in range(len(actions))
+        ])
+        index = self.hit_index.hit(pygame.mouse.get_pos())
+        if index is None:
+            return None
+        if index == 2:  # High Scores
+            self.show_high_score = True
+            return None
+        return actions[index]
+
+    def _button_rect(self, index):
+        """Get the rect of an option button"""
+        button_y = 350
+        button_spacing = 65
+        button_width = 300
+        button_height = 45
+        button_x = self.screen_width // 2 - button_width // 2
+        return pygame.Rect(button_x, button_y + index * button_spacing, button_width, button_height)
 
     def draw(self):
         """Draw game over screen with modern web-friendly design"""
@@ -441,15 +462,8 @@ class GameOverMenu(Menu):
             ("High Scores", "H", (100, 150, 255))
         ]
 
-        button_y = 350
-        button_spacing = 65
-        
         for i, (text, key, base_color) in enumerate(options):
-            y = button_y + i * button_spacing
-            
-            button_width = 300
-            button_height = 45
-            button_x = self.screen_width // 2 - button_width // 2
+            button_x, y, button_width, button_height = self._button_rect(i)
             
             hover_color = tuple(min(255, c + 40) for c in base_color)
             pygame.draw.rect(self.screen, base_color, (button_x, y, button_width, button_height))
@@ -0,0 +1,94 @@
+"""
+Menu layout and hit testing
+Widget rects are computed once per layout change and point queries use a cached index
+"""
+
+from bisect import bisect_right
+import pygame
+
+class HitTestIndex:
+    """Spatial hash of widget rects for O(1) average point queries
+
+    Widgets added later sit on top: where rects overlap, the last one added wins.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.layout_key = None
+        self.rects = {}
+        self._cells = {}
+
+    def ensure(self, layout_key, build):
+        """Rebuild from build() -> [(key, rect), ...] only when layout_key changes"""
+        if layout_key != self.layout_key:
+            self.rebuild(build())
+            self.layout_key = layout_key
+
+    def rebuild(self, widgets):
+        """Replace all widgets"""
+        self.clear()
+        for key, rect in widgets:
+            self.add(key, rect)
+
+    def add(self, key, rect):
+        """Add a widget rect"""
+        rect = pygame.Rect(rect)
+        self.rects[key] = rect
+        size = self.cell_size
+        for cell_x in range(rect.left // size, (rect.right - 1) // size + 1):
+            for cell_y in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                self._cells.setdefault((cell_x, cell_y), []).append(key)
+
+    def hit(self, pos):
+        """Get the key of the topmost widget containing pos, or None"""
+        x, y = pos
+        candidates = self._cells.get((x // self.cell_size, y // self.cell_size))
+        if not candidates:
+            return None
+        for key in reversed(candidates):
+            if self.rects[key].collidepoint(x, y):
+                return key
+        return None
+
+    def clear(self):
+        """Remove all widgets and force the next ensure() to rebuild"""
+        self.rects = {}
+        self._cells = {}
+        self.layout_key = None
+
+class RowIndex:
+    """Vertical list of rows with sorted tops for O(log n) lookups by y"""
+
+    def __init__(self):
+        self.layout_key = None
+        self.rows = []
+        self.tops = []
+
+    def ensure(self, layout_key, build):
+        """Rebuild from build() -> [(key, top, height), ...] sorted by top when layout_key changes"""
+        if layout_key != self.layout_key:
+            self.rebuild(build())
+            self.layout_key = layout_key
+
+    def rebuild(self, rows):
+        """Replace all rows"""
+        self.rows = list(rows)
+        self.tops = [top for _, top, _ in self.rows]
+
+    def hit(self, y):
+        """Get the key of the row containing y, or None"""
+        index = bisect_right(self.tops, y) - 1
+        if index >= 0:
+            key, top, height = self.rows[index]
+            if y < top + height:
+                return key
+        return None
+
+    def first_visible(self, y):
+        """Get the index of the first row that ends below y"""
+        index = bisect_right(self.tops, y) - 1
+        if index >= 0:
+            _, top, height = self.rows[index]
+            if y >= top + height:
+                index += 1
+        return max(0, index)
@@ -0,0 +1,20 @@
+"""
+Lazily built menu collection
+"""
+
+class LazyMenus(dict):
+    """Menu lookup that builds each menu the first time it is indexed
+
+    Only ``menus[name]`` builds a menu; ``get`` and iteration see built menus only.
+    """
+
+    def __init__(self, factories, **menus):
+        super().__init__(**menus)
+        self.factories = factories
+
+    def __missing__(self, name):
+        factory = self.factories.get(name)
+        if factory is None:
+            raise KeyError(name)
+        menu = self[name] = factory()
+        return menu
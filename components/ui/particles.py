@@ -0,0 +1,118 @@
+"""
+Particle system for menu effects
+Particles are stored as preallocated NumPy arrays so updates and culling are vectorised
+"""
+
+import math
+import numpy as np
+import pygame
+from ..core.animation_clock import animation_clock, AnimationClock
+
+class ParticleSystem:
+    """Struct-of-arrays particle engine with a fixed capacity"""
+
+    GRAVITY = 0.1
+
+    _sprite_cache = {}
+
+    def __init__(self, capacity=4096, fps=AnimationClock.REFERENCE_FPS):
+        self.capacity = capacity
+        self.count = 0
+        self._rng = np.random.default_rng()
+
+        # Velocities and lifetimes are expressed per frame at this rate
+        self.fps = fps
+        self._last_update = animation_clock.now()
+
+        # Live particles occupy the first `count` slots of every array
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, count=5, color=(100, 200, 255), speed=(0.5, 2), life=30, size=(3, 6)):
+        """Spawn particles bursting from a point; extra particles beyond capacity are dropped"""
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+
+        start, end = self.count, self.count + count
+        angles = self._rng.uniform(0, 2 * math.pi, count)
+        speeds = self._rng.uniform(speed[0], speed[1], count)
+
+        self.position[start:end] = (x, y)
+        self.velocity[start:end, 0] = np.cos(angles) * speeds
+        self.velocity[start:end, 1] = np.sin(angles) * speeds - 1
+        self.life[start:end] = life
+        self.max_life[start:end] = life
+        self.size[start:end] = self._rng.integers(size[0], size[1] + 1, count)
+        self.color[start:end] = color[:3]
+        self.count = end
+
+    def update(self):
+        """Integrate all particles by elapsed time and compact out dead ones"""
+        now = animation_clock.now()
+        elapsed_frames = (now - self._last_update) * self.fps
+        self._last_update = now
+
+        n = self.count
+        if n == 0:
+            return
+
+        self.position[:n] += self.velocity[:n] * elapsed_frames
+        self.life[:n] -= elapsed_frames
+        self.velocity[:n, 1] += self.GRAVITY * elapsed_frames
+
+        alive = self.life[:n] > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            for array in (self.position, self.velocity, self.life, self.max_life, self.size, self.color):
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    def draw(self, surface):
+        """Draw all particles with a single batched blit"""
+        n = self.count
+        if n == 0:
+            return
+
+        radii = np.maximum(1, (self.size[:n] * (self.life[:n] / self.max_life[:n])).astype(np.int32))
+        xs = self.position[:n, 0].astype(np.int32) - radii
+        ys = self.position[:n, 1].astype(np.int32) - radii
+        colors = self.color[:n].astype(np.int32)
+        keys = (radii << 24) | (colors[:, 0] << 16) | (colors[:, 1] << 8) | colors[:, 2]
+
+        sprites = self._sprite_cache
+        blit_sequence = []
+        for key, x, y in zip(keys.tolist(), xs.tolist(), ys.tolist()):
+            sprite = sprites.get(key)
+            if sprite is None:
+                sprite = self._make_sprite(key)
+            blit_sequence.append((sprite, (x, y)))
+
+        try:
+            surface.blits(blit_sequence, doreturn=False)
+        except (pygame.error, ValueError):
+            pass
+
+    @classmethod
+    def _make_sprite(cls, key):
+        """Render and cache a circle sprite for a packed (radius, colour) key"""
+        if len(cls._sprite_cache) > 512:
+            cls._sprite_cache.clear()
+
+        radius = key >> 24
+        color = ((key >> 16) & 0xFF, (key >> 8) & 0xFF, key & 0xFF)
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (radius, radius), radius)
+        cls._sprite_cache[key] = sprite
+        return sprite
+
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
@@ -2,48 +2,41 @@
 High score menu and management
 """
 
-import json
-import os
 import pygame
 import math
 from .base_menu import Menu
+from ..core.leaderboard import leaderboard
 
 class HighScoreMenu(Menu):
     """High scores menu screen"""
 
+    PAGE_SIZE = 10
+
     def __init__(self, screen):
         super().__init__(screen)
-        self.high_scores_file = "high_scores.json"
-        self.high_scores = self.load_high_scores()
         self.selected_score = None
+        self.page = 0
 
-    def load_high_scores(self):
-        """Load high scores from file"""
-
-        if os.path.exists(self.high_scores_file):
-            try:
-                with open(self.high_scores_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return []
+        # Rows of the page last loaded, reused until the page or the leaderboard changes
+        self._page_rows = None
+        self._page_key = None
 
-    def save_high_scores(self):
-        """Save high scores to file"""
+    @property
+    def high_scores(self):
+        """Scores on the current page; the first page comes from the leaderboard cache"""
+        key = (self.page, leaderboard.version)
+        if self._page_rows is None or self._page_key != key:
+            self._page_rows = self.load_high_scores()
+            self._page_key = key
+        return self._page_rows
 
-        try:
-            with open(self.high_scores_file, 'w', encoding='utf-8') as f:
-                json.dump(self.high_scores, f, indent=2, ensure_ascii=False)
-        except IOError:
-            pass
+    def load_high_scores(self):
+        """Load the current page of high scores"""
+        return leaderboard.top_scores(self.PAGE_SIZE, offset=self.page * self.PAGE_SIZE)
 
     def add_score(self, score, level):
         """Add new score to high scores"""
-
-        self.high_scores.append({"score": score, "level": level})
-        self.high_scores.sort(key=lambda x: x["score"], reverse=True)
-        self.high_scores = self.high_scores[:10]  # Keep top 10
-        self.save_high_scores()
+        return leaderboard.add_score(score, level)
 
     def handle_event(self, event):
         """Handle high scores events"""
@@ -52,11 +45,12 @@ class HighScoreMenu(Menu):
             if event.key == pygame.K_ESCAPE:
                 return "back"
             elif event.key == pygame.K_UP:
-                # Scroll up
-                pass
+                # Previous page
+                self.page = max(0, self.page - 1)
             elif event.key == pygame.K_DOWN:
-                # Scroll down
-                pass
+                # Next page, if there are lower-ranked scores
+                if (self.page + 1) * self.PAGE_SIZE < leaderboard.count():
+                    self.page += 1
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1: 
                 return "back"
@@ -85,15 +79,17 @@ class HighScoreMenu(Menu):
         self.draw_text("HIGH SCORES", self.font_large, title_color,
                       self.screen_width // 2, title_y, shadow=True)
 
-        if not self.high_scores:
+        high_scores = self.high_scores
+        if not high_scores:
             no_scores_color = (180, 180, 200)
             self.draw_text("No scores yet! Be the first!", self.font_medium, no_scores_color,
                           self.screen_width // 2, 300)
         else:
             start_y = 200
-            for i, score_data in enumerate(self.high_scores):
+            first_rank = self.page * self.PAGE_SIZE + 1
+            for i, score_data in enumerate(high_scores):
                 y = start_y + i * 45
-                rank = i + 1
+                rank = first_rank + i
                 score = score_data["score"]
                 level = score_data["level"]
 
@@ -126,14 +122,14 @@ class HighScoreMenu(Menu):
                 
                 try:
                     top_colors = [(255, 215, 0), (192, 192, 192), (205, 127, 50)]
-                    rank_color = top_colors[i] if i < len(top_colors) else (200, 200, 255)
+                    rank_color = top_colors[rank - 1] if rank <= len(top_colors) else (200, 200, 255)
                 except (IndexError, TypeError):
                     rank_color = (200, 200, 255)
                 
-                rank_text = f"#{rank}" if i < 3 else f"{rank}."
+                rank_text = f"#{rank}" if rank <= 3 else f"{rank}."
                 self.draw_text(rank_text, self.font_medium, rank_color, 200, y, shadow=True)
 
-                if i < 3:
+                if rank <= 3:
                     score_color = (255, 255, 100)
                     score_font = self.font_large
                 else:
@@ -148,6 +144,10 @@ class HighScoreMenu(Menu):
         self.draw_animated_particles()
 
         instr_color = (180, 180, 200)
+        if leaderboard.count() > self.PAGE_SIZE:
+            self.draw_text(f"UP/DOWN for lower-ranked scores (page {self.page + 1})",
+                          self.font_small, instr_color,
+                          self.screen_width // 2, self.screen_height - 80)
         self.draw_text("Press ESC or CLICK anywhere to go back",
                       self.font_small, instr_color,
                       self.screen_width // 2, self.screen_height - 50)
@@ -5,6 +5,7 @@ Settings menu for game configuration
 import pygame
 import math
 from .base_menu import Menu
+from .layout import HitTestIndex
 from ..core import config
 
 class SettingsMenu(Menu):
@@ -19,9 +20,9 @@ class SettingsMenu(Menu):
         ]
         self.current_values = []
         self.load_current_values()
-        self._button_rects = []
-        self._row_rects = []
+        config.subscribe(self._on_config_changed, *(key_path for _, key_path, _ in self.settings))
         self.row_scales = [1.0] * len(self.settings)
+        self.hit_index = HitTestIndex()
 
     def load_current_values(self):
         """Load current setting values"""
@@ -38,6 +39,42 @@ class SettingsMenu(Menu):
                 else:
                     self.current_values.append(0)
 
+    def _on_config_changed(self, changed_paths):
+        """Reflect settings changed elsewhere, such as a reloaded config file"""
+        self.load_current_values()
+
+    def _row_layout(self, index, scale):
+        """Get (row, left button, right button) rects of a setting row drawn at the given scale"""
+        start_y = 250
+        row_height = 90
+
+        y = start_y + index * row_height
+        row_width = int(600 * scale)
+        row_height_scaled = int(60 * scale)
+        row_x = self.screen_width // 2 - row_width // 2
+        row_y = y - (row_height_scaled - 60) // 2
+
+        row_rect = pygame.Rect(row_x, row_y, row_width, row_height_scaled)
+        left_rect = pygame.Rect(row_x + row_width - 170, row_y + row_height_scaled // 2 - 15, 35, 30)
+        right_rect = pygame.Rect(row_x + row_width - 70, row_y + row_height_scaled // 2 - 15, 35, 30)
+        return row_rect, left_rect, right_rect
+
+    def _widget_at(self, pos):
+        """Get ("row" | "left" | "right", index) for the widget under pos, or None"""
+        layout_key = (self.screen_width, self.selected_setting, len(self.settings))
+        self.hit_index.ensure(layout_key, self._build_hit_index)
+        return self.hit_index.hit(pos)
+
+    def _build_hit_index(self):
+        """Get widget rects at their resting scales; buttons come after rows so they win"""
+        rows, buttons = [], []
+        for i in range(len(self.settings)):
+            row_rect, left_rect, right_rect = self._row_layout(i, 1.05 if i == self.selected_setting else 1.0)
+            rows.append((("row", i), row_rect))
+            buttons.append((("left", i), left_rect))
+            buttons.append((("right", i), right_rect))
+        return rows + buttons
+
     def handle_event(self, event):
         """Handle settings events"""
         if event.type == pygame.KEYDOWN:
@@ -56,32 +93,22 @@ class SettingsMenu(Menu):
                 return "back"
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
-                mouse_pos = pygame.mouse.get_pos()
-                for i, pair in enumerate(self._button_rects):
-                    if not pair:
-                        continue
-                    left_rect, right_rect = pair
-                    if left_rect and left_rect.collidepoint(mouse_pos):
-                        self.selected_setting = i
-                        self.current_values[i] = max(0, self.current_values[i] - 1)
-                        self.update_setting()
-                        return None
-                    if right_rect and right_rect.collidepoint(mouse_pos):
-                        self.selected_setting = i
-                        setting_name, key_path, options = self.settings[i]
-                        self.current_values[i] = min(len(options) - 1, self.current_values[i] + 1)
-                        self.update_setting()
-                        return None
-                for i, row in enumerate(self._row_rects):
-                    if row and row.collidepoint(mouse_pos):
-                        self.selected_setting = i
-                        return None
+                widget = self._widget_at(pygame.mouse.get_pos())
+                if widget is None:
+                    return None
+                kind, i = widget
+                self.selected_setting = i
+                if kind == "left":
+                    self.current_values[i] = max(0, self.current_values[i] - 1)
+                    self.update_setting()
+                elif kind == "right":
+                    setting_name, key_path, options = self.settings[i]
+                    self.current_values[i] = min(len(options) - 1, self.current_values[i] + 1)
+                    self.update_setting()
         elif event.type == pygame.MOUSEMOTION:
-            mouse_pos = pygame.mouse.get_pos()
-            for i, row in enumerate(self._row_rects):
-                if row and row.collidepoint(mouse_pos):
-                    self.selected_setting = i
-                    break
+            widget = self._widget_at(pygame.mouse.get_pos())
+            if widget is not None:
+                self.selected_setting = widget[1]
         return None
 
     def update_setting(self):
@@ -89,7 +116,7 @@ class SettingsMenu(Menu):
         setting_name, key_path, options = self.settings[self.selected_setting]
         new_value = options[self.current_values[self.selected_setting]]
         config.set(key_path, new_value)
-        config.save_config()
+        config.schedule_save()
 
     def draw(self):
         """Draw simplified settings menu with modern styling"""
@@ -105,24 +132,15 @@ class SettingsMenu(Menu):
         self.draw_text("SETTINGS", self.font_large, title_color,
                       self.screen_width // 2, title_y, shadow=True)
 
-        self._button_rects = []
-        self._row_rects = []
-        
-        start_y = 250
-        row_height = 90
-        
         for i, (setting_name, key_path, options) in enumerate(self.settings):
-            y = start_y + i * row_height
             is_selected = (i == self.selected_setting)
             current_value = options[self.current_values[i]]
             
             target_scale = 1.05 if is_selected else 1.0
-            self.row_scales[i] += (target_scale - self.row_scales[i]) * 0.1
+            self.row_scales[i] = self.ease(self.row_scales[i], target_scale, 0.1)
             
-            row_width = int(600 * self.row_scales[i])
-            row_height_scaled = int(60 * self.row_scales[i])
-            row_x = self.screen_width // 2 - row_width // 2
-            row_y = y - (row_height_scaled - 60) // 2
+            row_rect, left_rect, right_rect = self._row_layout(i, self.row_scales[i])
+            row_x, row_y, row_width, row_height_scaled = row_rect
             
             for draw_y in range(row_height_scaled):
                 progress = draw_y / row_height_scaled
@@ -135,8 +153,6 @@ class SettingsMenu(Menu):
                 pygame.draw.line(self.screen, line_color, (row_x, row_y + draw_y), 
                                (row_x + row_width, row_y + draw_y))
             
-            row_rect = pygame.Rect(row_x, row_y, row_width, row_height_scaled)
-            
             if is_selected:
                 border_color = (255, 200 + int(55 * math.sin(self.animation_timer * 0.08)), 100)
                 border_width = 3
@@ -148,13 +164,11 @@ class SettingsMenu(Menu):
                 border_width = 2
             
             pygame.draw.rect(self.screen, border_color, row_rect, border_width)
-            self._row_rects.append(row_rect)
             
             name_color = (255, 255, 100) if is_selected else (200, 200, 200)
             self.draw_text(setting_name, self.font_medium, name_color,
                           row_x + 30, row_y + 15, center=False)
             
-            left_rect = pygame.Rect(row_x + row_width - 170, row_y + row_height_scaled // 2 - 15, 35, 30)
             btn_color = (100, 120, 180) if is_selected else (80, 100, 160)
             pygame.draw.rect(self.screen, btn_color, left_rect, 0, border_radius=5)
             pygame.draw.rect(self.screen, (255, 255, 100) if is_selected else (150, 150, 150), 
@@ -172,15 +186,12 @@ class SettingsMenu(Menu):
                 value_rect = value_surface.get_rect(center=(row_x + row_width - 102, row_y + row_height_scaled // 2))
                 self.screen.blit(value_surface, value_rect)
             
-            right_rect = pygame.Rect(row_x + row_width - 70, row_y + row_height_scaled // 2 - 15, 35, 30)
             pygame.draw.rect(self.screen, btn_color, right_rect, 0, border_radius=5)
             pygame.draw.rect(self.screen, (255, 255, 100) if is_selected else (150, 150, 150), 
                            right_rect, 2, border_radius=5)
             right_text = self.font_medium.render(">", True, (255, 255, 255))
             right_text_rect = right_text.get_rect(center=right_rect.center)
             self.screen.blit(right_text, right_text_rect)
-            
-            self._button_rects.append((left_rect, right_rect))
 
         self.draw_animated_particles()
 
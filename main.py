@@ -1,9 +1,11 @@
 import pygame
 import sys
 import asyncio
-from components.core import config, GameState, EventHandler, GameRenderer, achievement_manager
+from components.core import config, GameState, EventHandler, GameRenderer, FrameGovernor, FrameProfiler, StallWatchdog, DebugCapture, achievement_manager, leaderboard, input_latency
+from components.core.game_history import game_history, build_game_record
+from components.ui.base_menu import Menu
 from components.entities import Snake, FoodManager, PowerUpManager, ObstacleManager
-from components.ui import MainMenu, LevelSelectMenu, SettingsMenu, HighScoreMenu, GameOverMenu, AchievementMenu, AchievementNotification
+from components.ui import MainMenu, LevelSelectMenu, SettingsMenu, HighScoreMenu, GameOverMenu, AchievementMenu, AchievementNotification, LazyMenus
 
 class SnakeGame:
     """Main game class"""
@@ -18,6 +20,24 @@ class SnakeGame:
             self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
             pygame.display.set_caption("Enhanced Snake Game")
             self.clock = pygame.time.Clock()
+            self.frame_governor = FrameGovernor()
+            self.frame_profiler = FrameProfiler()
+            self.frame_profiler.overlay_visible = bool(config.get("debug.frame_profiler_overlay", False))
+            self.stall_watchdog = StallWatchdog(
+                threshold_ms=config.get("debug.stall_threshold_ms", 50),
+                context=self._stall_context
+            )
+            self.debug_capture = DebugCapture(
+                frames=config.get("debug.capture_frames", 300),
+                context=self._capture_context
+            )
+            self.debug_capture.request_from_env()
+            
+            # Pick up external edits to config.json without restarting
+            config.start_file_watcher()
+            
+            # Read achievement progress off the main thread while the first frames draw
+            achievement_manager.preload()
             
             # Core components
             self.game_state = GameState()
@@ -35,6 +55,10 @@ class SnakeGame:
                 self.menus, 
                 config.get_block_size()
             )
+            self._register_scene_renderers()
+            self.event_handler.add_hotkey(pygame.K_F3, self.frame_profiler.toggle_overlay)
+            self.event_handler.add_hotkey(pygame.K_F4, self.frame_profiler.export)
+            self.event_handler.add_hotkey(pygame.K_F5, self.debug_capture.request)
             
             # Fonts for notifications
             self.font_medium = pygame.font.Font(None, 40)
@@ -45,21 +69,24 @@ class SnakeGame:
             self.death_notification_duration = 0
             self.lives_remaining = 0
             
+            # Frozen pause frame presentation
+            self._pause_presented = False
+            self._pause_overlay_active = False
+            
 
         except Exception:
             sys.exit(1)
     
     def _init_menus(self):
-        """Initialize all menu objects"""
+        """Set up menus; each one is built the first time it is shown"""
         try:
-            self.menus = {
-                "main": MainMenu(self.screen),
-                "level_select": LevelSelectMenu(self.screen),
-                "settings": SettingsMenu(self.screen),
-                "high_scores": HighScoreMenu(self.screen),
-                "achievements": AchievementMenu(self.screen),
-                "game_over": None
-            }
+            self.menus = LazyMenus({
+                "main": lambda: MainMenu(self.screen),
+                "level_select": lambda: LevelSelectMenu(self.screen),
+                "settings": lambda: SettingsMenu(self.screen),
+                "high_scores": lambda: HighScoreMenu(self.screen),
+                "achievements": lambda: AchievementMenu(self.screen),
+            }, game_over=None)
             
             # Achievement notification system
             self.current_notification = None
@@ -74,6 +101,7 @@ class SnakeGame:
         # Track game start for achievements
         achievement_manager.update_stats("game_start")
         achievement_manager.reset_session_achievements()  # Reset session achievements for new game
+        input_latency.reset()
         
         # Create game objects
         area = self.game_state
@@ -126,6 +154,7 @@ class SnakeGame:
         result = self.event_handler.handle_events(
             self.game_objects.get("snake")
         )
+        self.frame_governor.note_events(self.event_handler.last_event_count)
         
         if result == "start_game":
             self.start_new_game(1)
@@ -165,6 +194,8 @@ class SnakeGame:
         if self.game_state.snake_move_timer >= move_interval:
             snake.move()
             self.game_state.snake_move_timer = 0
+            if snake.last_turn_input_time is not None:
+                input_latency.turn_applied(snake.last_turn_input_time)
         
         # Check collisions and update game
         self._check_collisions()
@@ -176,7 +207,7 @@ class SnakeGame:
         
         # Wall/self collision
         if snake.check_collision():
-            achievement_manager.update_stats("death")
+            achievement_manager.update_stats("death", cause=snake.last_collision)
             if snake.lose_life():
                 self._game_over()
                 return
@@ -186,7 +217,7 @@ class SnakeGame:
         
         # Obstacle collision
         if snake.check_obstacle_collision(self.game_objects["obstacle_manager"].obstacles):
-            achievement_manager.update_stats("death")
+            achievement_manager.update_stats("death", cause="obstacle")
             if snake.lose_life():
                 self._game_over()
                 return
@@ -241,6 +272,13 @@ class SnakeGame:
         achievement_manager.update_stats("game_end")
         achievement_manager.check_achievements()
         
+        # Append this game to the history log (written off the main thread)
+        record = build_game_record(
+            achievement_manager.game_stats, self.game_state.level, self.game_state.score
+        )
+        record["input_latency_ms"] = input_latency.summary()
+        game_history.append(record)
+        
         self.game_state.set_state("game_over")
         self.menus["game_over"] = GameOverMenu(
             self.screen, self.game_state.score, self.game_state.level
@@ -253,32 +291,27 @@ class SnakeGame:
         self.death_notification_duration = 2000  # 2 seconds
         self.lives_remaining = lives_remaining
     
+    def _register_scene_renderers(self):
+        """Register the draw function for each state"""
+        scenes = self.event_handler.scenes
+        # Menus are looked up when drawing so each is built on first use
+        for state, menu_name in (("menu", "main"), ("level_select", "level_select"),
+                                 ("settings", "settings"), ("high_scores", "high_scores"),
+                                 ("achievements", "achievements")):
+            scenes.register(state, draw=lambda name=menu_name: self.menus[name].draw())
+        scenes.register("countdown", draw=lambda: self.renderer.draw_countdown(
+            self.game_state.countdown_timer, self.game_state.countdown_duration
+        ))
+        scenes.register("playing", draw=lambda: self.renderer.draw_game(self.game_objects, self.game_state))
+        scenes.register("paused", draw=lambda: self.renderer.draw_paused(self.game_objects, self.game_state))
+        # The game over menu is rebuilt for every game, so look it up when drawing
+        scenes.register("game_over", draw=lambda: self.menus["game_over"].draw())
+    
     def _draw(self):
         """Draw everything based on current state"""
-        state = self.game_state.state
-        
-        if state == "menu":
-            self.menus["main"].draw()
-        elif state == "level_select":
-            self.menus["level_select"].draw()
-        elif state == "settings":
-            self.menus["settings"].draw()
-        elif state == "high_scores":
-            self.menus["high_scores"].draw()
-        elif state == "achievements":
-            self.menus["achievements"].draw()
-        elif state == "countdown":
-            self.renderer.draw_countdown(
-                self.game_state.countdown_timer, 
-                self.game_state.countdown_duration
-            )
-        elif state == "playing":
-            self.renderer.draw_game(self.game_objects, self.game_state)
-        elif state == "paused":
-            self.renderer.draw_game(self.game_objects, self.game_state)
-            self.renderer.draw_pause()
-        elif state == "game_over":
-            self.menus["game_over"].draw()
+        draw = self.event_handler.scenes.get(self.game_state.state).draw
+        if draw:
+            draw()
     
     def run(self):
         """Main game loop - wrapper for async version"""
@@ -287,35 +320,66 @@ class SnakeGame:
     async def async_run(self):
         """Main game loop - async version for web"""
         running = True
+        profiler = self.frame_profiler
+        watchdog = self.stall_watchdog
+        capture = self.debug_capture
+        if config.get("debug.stall_watchdog", True):
+            watchdog.start()
         
         try:
             while running:
+                # Capture snapshots and reports are slow by design; keep them out of the stall log
+                capture.begin_frame(self.game_state.state)
+                profiler.begin_frame()
+                if not capture.active:
+                    watchdog.heartbeat()
+                
                 # Handle events
                 running = self._handle_events()
                 
+                # Apply config.json edits detected by the watcher
+                config.poll_file_changes()
+                profiler.mark("events")
+                
                 # Update achievements
                 self._update_achievements()
+                profiler.mark("achievements")
                 
                 # Update countdown
                 if self.game_state.state == "countdown":
                     self.game_state.countdown_timer += self.clock.get_time()
                     if self.game_state.countdown_timer >= self.game_state.countdown_duration:
                         self.game_state.set_state("playing")
+                profiler.mark("countdown")
                 
                 # Update game
                 self._update_game()
+                profiler.mark("update")
                 
-                # Draw
-                self._draw()
+                # Draw (a frozen pause frame is only presented once)
+                if self._should_present():
+                    self._draw()
+                    profiler.mark("draw")
+                    
+                    # Draw achievement notification
+                    self._draw_achievement_notification()
+                    profiler.mark("notification")
+                    
+                    profiler.draw_overlay(self.screen)
+                    profiler.mark("overlay")
+                    
+                    pygame.display.flip()
+                    input_latency.frame_presented()
+                    profiler.mark("flip")
                 
-                # Draw achievement notification
-                self._draw_achievement_notification()
-                
-                pygame.display.flip()
-                
-                # Control FPS
-                fps = 60 if self.game_state.is_playing() else config.get_fps()
-                self.clock.tick(fps)
+                # Control FPS (drops on idle screens, sleeps on static ones)
+                watchdog.idle()
+                capture.end_frame()
+                overlay_refresh = profiler.OVERLAY_REFRESH_MS if profiler.overlay_visible else None
+                await self.frame_governor.wait(self.clock, self.game_state.state, self._is_animating(),
+                                               max_sleep_ms=overlay_refresh)
+                profiler.mark("wait")
+                profiler.end_frame()
                 
                 # Critical for web - yield to browser
                 await asyncio.sleep(0)
@@ -330,13 +394,69 @@ class SnakeGame:
             pass
         finally:
             # Cleanup
+            watchdog.stop()
+            capture.stop()
+            config.stop_file_watcher()
+            config.flush()
             try:
+                achievement_manager.flush()
                 achievement_manager.save_progress()
             except Exception:
                 pass
+            leaderboard.close()
+            game_history.close()
             pygame.quit()
             sys.exit()
     
+    def _should_present(self):
+        """Check if a new frame must be drawn, skipping repeats of the frozen pause frame"""
+        exposed = self.event_handler.window_exposed
+        self.event_handler.window_exposed = False
+        
+        if self.game_state.state != "paused":
+            self._pause_presented = False
+            return True
+        
+        if not self._pause_presented or exposed:
+            # Pause just entered or window exposed: rebuild the composite
+            self.renderer.invalidate_pause_frame()
+        elif not self._is_animating() and not self._pause_overlay_active and not self.frame_profiler.overlay_due():
+            return False
+        
+        # Present once more after an overlay finishes so it is cleared
+        self._pause_presented = True
+        self._pause_overlay_active = self._is_animating()
+        return True
+    
+    def _stall_context(self):
+        """Describe the current state and entity counts for stall reports"""
+        objects = self.game_objects
+        context = {"state": self.game_state.state}
+        if "snake" in objects:
+            context["snake_length"] = len(objects["snake"].body)
+            context["obstacles"] = len(objects["obstacle_manager"].obstacles)
+            context["food"] = len(objects["food_manager"].foods)
+            context["powerups"] = len(objects["powerup_manager"].powerups)
+        return context
+    
+    def _capture_context(self):
+        """Report cache sizes suspected of growing over long sessions"""
+        context = {f"{name}._text_cache": len(menu._text_cache)
+                   for name, menu in self.menus.items() if menu is not None}
+        context["Menu._font_cache"] = len(Menu._font_cache)
+        context["GameRenderer._countdown_font_cache"] = len(self.renderer._countdown_font_cache)
+        context["GameRenderer._hud_line_cache"] = len(self.renderer._hud_line_cache)
+        context.update(self._stall_context())
+        return context
+    
+    def _is_animating(self):
+        """Check if a timed overlay needs full frame rate regardless of state"""
+        return bool(
+            self.current_notification
+            or self.death_notification_time > 0
+            or achievement_manager.pending_notifications
+        )
+    
     def _update_achievements(self):
         """Update achievement system (optimized)"""
         delta_time = self.clock.get_time()
@@ -0,0 +1,83 @@
+"""
+Tests for saving and loading achievement progress
+"""
+
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from components.core.achievement_manager import AchievementManager
+
+def file_mode(path):
+    """Get the permission bits of a file"""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+class AchievementPersistenceTest(unittest.TestCase):
+    """Progress survives a save and reload without changing the file's mode"""
+
+    def setUp(self):
+        # The catalog cache goes to the working directory, like the game's other files
+        self.original_dir = os.getcwd()
+        self.directory = tempfile.mkdtemp(prefix="snake-test-")
+        os.chdir(self.directory)
+        self.save_file = os.path.join(self.directory, "achievements.json")
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def play_one_game(self, manager):
+        """Play a short game so there is progress to save"""
+        manager.update_stats("game_start")
+        manager.update_stats("food_eaten", food_type="normal")
+        manager.update_stats("score_update", score=10)
+        manager.update_stats("game_end")
+        manager.check_achievements()
+
+    def reload(self):
+        """Load the save file into a new manager"""
+        return AchievementManager(save_file=self.save_file)
+
+    def prepare_save_file(self, mode):
+        """Create an existing save file with the given mode"""
+        with open(self.save_file, 'w', encoding='utf-8') as f:
+            f.write("{}")
+        os.chmod(self.save_file, mode)
+
+    def test_save_progress_round_trip(self):
+        manager = AchievementManager(save_file=self.save_file)
+        self.play_one_game(manager)
+        manager.save_progress()
+        manager.flush()
+
+        reloaded = self.reload()
+        reloaded.get_progress_summary()
+        self.assertEqual(reloaded.game_stats.total_games, 1)
+        self.assertEqual(reloaded.game_stats.total_food_eaten, 1)
+
+    @unittest.skipUnless(os.name == "posix", "file modes are POSIX-only")
+    def test_save_progress_keeps_mode(self):
+        self.prepare_save_file(0o644)
+        manager = AchievementManager(save_file=self.save_file)
+        self.play_one_game(manager)
+        manager.save_progress()
+        manager.flush()
+        self.assertEqual(file_mode(self.save_file), 0o644)
+
+    @unittest.skipUnless(os.name == "posix", "file modes are POSIX-only")
+    def test_scheduled_save_keeps_mode(self):
+        self.prepare_save_file(0o640)
+        manager = AchievementManager(save_file=self.save_file)
+        self.play_one_game(manager)
+        manager.schedule_save()
+        manager.flush()
+        self.assertEqual(file_mode(self.save_file), 0o640)
+
+        reloaded = self.reload()
+        reloaded.get_progress_summary()
+        self.assertEqual(reloaded.game_stats.total_games, 1)
+
+if __name__ == "__main__":
+    unittest.main()
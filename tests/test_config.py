@@ -0,0 +1,67 @@
+"""
+Tests for config change subscriptions
+"""
+
+import gc
+import os
+import shutil
+import tempfile
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from components.core.config import Config, config
+
+class Subscriber:
+    """Object that listens for colour changes"""
+
+    def __init__(self, settings):
+        self.calls = 0
+        settings.subscribe(self.on_change, "colors")
+
+    def on_change(self, changed_paths):
+        self.calls += 1
+
+class SubscriptionTest(unittest.TestCase):
+    """Subscriptions of collected objects must not pile up"""
+
+    def setUp(self):
+        self.original_dir = os.getcwd()
+        self.directory = tempfile.mkdtemp(prefix="snake-test-")
+        os.chdir(self.directory)
+
+    def tearDown(self):
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_dead_subscribers_are_dropped_without_notify(self):
+        settings = Config(os.path.join(self.directory, "config.json"))
+        keep = Subscriber(settings)
+        for _ in range(200):
+            Subscriber(settings)
+        gc.collect()
+        self.assertEqual(len(settings._subscribers), 1)
+
+        settings._notify(["colors.text"])
+        self.assertEqual(keep.calls, 1)
+
+    def test_collected_menus_do_not_grow_subscriptions(self):
+        # Every Menu subscribes to colour changes, as each game over's GameOverMenu does
+        from components.ui import MainMenu, HighScoreMenu
+        pygame.init()
+        screen = pygame.display.set_mode((1000, 700))
+        try:
+            gc.collect()
+            baseline = len(config._subscribers)
+            for _ in range(50):
+                MainMenu(screen)
+                HighScoreMenu(screen)
+            gc.collect()
+            self.assertLessEqual(len(config._subscribers), baseline)
+        finally:
+            pygame.quit()
+
+if __name__ == "__main__":
+    unittest.main()
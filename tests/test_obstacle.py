@@ -0,0 +1,61 @@
+"""
+Tests for moving obstacles
+"""
+
+import unittest
+
+from components.entities.obstacle import MovingObstacle
+
+class MovingObstacleTest(unittest.TestCase):
+    """Movement follows elapsed time but never jumps after a pause"""
+
+    def make_obstacle(self, pattern="horizontal", speed=2):
+        obstacle = MovingObstacle(200, 200, move_pattern=pattern, speed=speed)
+        obstacle.update()
+        return obstacle
+
+    def skip_time(self, obstacle, seconds):
+        """Pretend the game was paused or stalled for seconds"""
+        obstacle.spawn_time -= seconds
+
+    def test_resume_after_pause_moves_at_most_catch_up_frames(self):
+        obstacle = self.make_obstacle()
+        start_x = obstacle.x
+        self.skip_time(obstacle, 5.0)
+        obstacle.update()
+        self.assertLessEqual(abs(obstacle.x - start_x),
+                             obstacle.speed * MovingObstacle.MAX_CATCH_UP_FRAMES + 1e-9)
+        self.assertEqual(obstacle.rect.x, int(obstacle.x))
+
+    def test_circular_pattern_does_not_jump_after_pause(self):
+        obstacle = self.make_obstacle("circular")
+        start_timer = obstacle.move_timer
+        self.skip_time(obstacle, 5.0)
+        obstacle.update()
+        self.assertLessEqual(obstacle.move_timer - start_timer, MovingObstacle.MAX_CATCH_UP_FRAMES + 1e-9)
+
+    def test_out_of_bounds_is_clamped_and_turns_back(self):
+        obstacle = self.make_obstacle()
+        right_edge = obstacle.screen_width - obstacle.width
+        obstacle.x = right_edge + 500
+        obstacle.direction = 1
+        obstacle.update()
+        self.assertEqual(obstacle.x, right_edge)
+        self.assertEqual(obstacle.direction, -1)
+
+        # Following updates keep heading back inside instead of flipping every frame
+        for _ in range(3):
+            self.skip_time(obstacle, 1 / 60)
+            obstacle.update()
+            self.assertEqual(obstacle.direction, -1)
+        self.assertLess(obstacle.x, right_edge)
+
+    def test_vertical_lower_edge_turns_back(self):
+        obstacle = self.make_obstacle("vertical")
+        obstacle.y = -300
+        obstacle.direction = -1
+        obstacle.update()
+        self.assertEqual((obstacle.y, obstacle.direction), (0, 1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests for the atomic JSON writer and the debounced writer
+"""
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+
+from components.core.persistence import atomic_write_json, DebouncedWriter, _UMASK
+
+def file_mode(path):
+    """Get the permission bits of a file"""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+@unittest.skipUnless(os.name == "posix", "file modes are POSIX-only")
+class AtomicWriteModeTest(unittest.TestCase):
+    """Saving must not change who can read the file"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="snake-test-")
+        self.path = os.path.join(self.directory, "config.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_existing_mode_is_kept(self):
+        for mode in (0o644, 0o640, 0o600):
+            with open(self.path, 'w', encoding='utf-8') as f:
+                f.write("{}")
+            os.chmod(self.path, mode)
+            atomic_write_json(self.path, {"mode": mode})
+            self.assertEqual(file_mode(self.path), mode)
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.assertEqual(json.load(f), {"mode": mode})
+
+    def test_new_file_follows_umask(self):
+        atomic_write_json(self.path, {})
+        self.assertEqual(file_mode(self.path), 0o666 & ~_UMASK)
+
+    def test_debounced_writer_keeps_mode(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write("{}")
+        os.chmod(self.path, 0o644)
+        writer = DebouncedWriter(self.path, delay=0.01)
+        writer.schedule({"saved": True})
+        writer.close()
+        self.assertEqual(file_mode(self.path), 0o644)
+
+if __name__ == "__main__":
+    unittest.main()
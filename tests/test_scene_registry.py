@@ -0,0 +1,76 @@
+"""
+Tests for scene event polling and filtering
+"""
+
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+from components.core.scene_registry import SceneRegistry
+
+def motion(pos, rel=(1, 1)):
+    """Create a mouse motion event"""
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=rel, buttons=(0, 0, 0))
+
+def key(code):
+    """Create a key press event"""
+    return pygame.event.Event(pygame.KEYDOWN, key=code, mod=0, unicode="", scancode=0)
+
+class PollEventsTest(unittest.TestCase):
+    """Motion is merged without moving it past other input"""
+
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        pygame.display.set_mode((100, 100))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.registry = SceneRegistry()
+        pygame.event.set_allowed(None)
+        pygame.event.clear()
+
+    def post(self, *events):
+        for event in events:
+            pygame.event.post(event)
+
+    def summarize(self, events):
+        """Describe events as (kind, detail) pairs"""
+        result = []
+        for event in events:
+            if event.type == pygame.MOUSEMOTION:
+                result.append(("motion", tuple(event.pos), tuple(event.rel)))
+            elif event.type == pygame.KEYDOWN:
+                result.append(("key", event.key))
+        return result
+
+    def test_motion_merged_at_last_motion(self):
+        self.post(motion((10, 10)), key(pygame.K_DOWN), motion((20, 20), (2, 3)), key(pygame.K_RETURN))
+        self.assertEqual(self.summarize(self.registry.poll_events()), [
+            ("key", pygame.K_DOWN),
+            ("motion", (20, 20), (3, 4)),
+            ("key", pygame.K_RETURN),
+        ])
+
+    def test_hover_before_key_stays_before(self):
+        self.post(motion((10, 10)), motion((30, 40)), key(pygame.K_UP))
+        self.assertEqual(self.summarize(self.registry.poll_events()), [
+            ("motion", (30, 40), (2, 2)),
+            ("key", pygame.K_UP),
+        ])
+
+    def test_events_without_motion_are_unchanged(self):
+        self.post(key(pygame.K_UP), key(pygame.K_DOWN))
+        self.assertEqual(self.summarize(self.registry.poll_events()), [
+            ("key", pygame.K_UP),
+            ("key", pygame.K_DOWN),
+        ])
+
+if __name__ == "__main__":
+    unittest.main()